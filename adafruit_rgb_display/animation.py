@@ -0,0 +1,458 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.animation`
+====================================================
+
+Play animated GIFs from frames that are converted for the display only once,
+sending only the parts of each frame that changed. Frames are converted in
+background threads while playing. Requires Pillow, and NumPy to find the
+changes.
+
+* Author(s): Adafruit Industries
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageOps
+
+from adafruit_rgb_display.rgb import Display
+from adafruit_rgb_display.scheduler import FrameScheduler
+
+try:
+    from typing import Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+    Rect = Tuple[int, int, int, int, bytes]
+except ImportError:
+    pass
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+# Unchanged lines or columns needed to split a changed area in two
+_SPLIT_GAP = 8
+
+
+def _runs(lines: numpy.ndarray) -> List[Tuple[int, int]]:
+    """Split sorted line numbers at gaps of more than ``_SPLIT_GAP`` lines and
+    return the first and last line of each run."""
+    cuts = numpy.flatnonzero(numpy.diff(lines) > _SPLIT_GAP)
+    starts = numpy.concatenate(([lines[0]], lines[cuts + 1]))
+    ends = numpy.concatenate((lines[cuts], [lines[-1]]))
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def _changes(previous: bytes, current: bytes, width: int, height: int) -> List[Rect]:
+    """Return the rectangles of a frame that differ from the previous frame,
+    each as ``(x0, y0, x1, y1, data)``."""
+    new = numpy.frombuffer(current, dtype="uint8").reshape(height, width, -1)
+    changed = (numpy.frombuffer(previous, dtype="uint8").reshape(height, width, -1) != new).any(axis=2)
+    rects: List[Rect] = []
+    # Cut the changed areas at wide enough gaps between rows, then between
+    # columns, until neither can be cut any more
+    areas = [(0, 0, changed)]
+    while areas:
+        x, y, mask = areas.pop()
+        rows = numpy.flatnonzero(mask.any(axis=1))
+        if not rows.size:
+            continue
+        runs = _runs(rows)
+        if len(runs) > 1:
+            areas.extend((x, y + start, mask[start : end + 1]) for start, end in runs)
+            continue
+        runs = _runs(numpy.flatnonzero(mask.any(axis=0)))
+        if len(runs) > 1:
+            areas.extend((x + start, y, mask[:, start : end + 1]) for start, end in runs)
+            continue
+        x0, x1 = x + runs[0][0], x + runs[0][1]
+        y0, y1 = y + int(rows[0]), y + int(rows[-1])
+        rects.append((x0, y0, x1, y1, new[y0 : y1 + 1, x0 : x1 + 1].tobytes()))
+    return rects
+
+
+def _uncovered(rects: List[Rect]) -> List[Rect]:
+    """Return the rectangles that are not entirely drawn over by a later one."""
+    return [
+        rect
+        for index, rect in enumerate(rects)
+        if not any(
+            later[0] <= rect[0] and later[1] <= rect[1] and rect[2] <= later[2] and rect[3] <= later[3]
+            for later in rects[index + 1 :]
+        )
+    ]
+
+
+class Frame:
+    """A frame of an animation, encoded for the display.
+
+    :param list rects: the rectangles to update, each as
+        ``(x0, y0, x1, y1, data)``
+    :param float duration: the time to show the frame, in seconds
+    """
+
+    def __init__(self, rects: List[Rect], duration: float) -> None:
+        self.rects = rects
+        self.duration = duration
+
+    @property
+    def nbytes(self) -> int:
+        """The memory used by the pixels of the frame"""
+        return sum(len(rect[4]) for rect in self.rects)
+
+
+class Animation:
+    """The frames of an animation, encoded for a display. Each frame only
+    holds the changes from the frame before it, and the first frame the
+    changes from the last one, for looping. ``first`` holds the whole first
+    frame, to start playing.
+
+    An animation created without frames is being converted: frames are added
+    as they become ready, and `frame` waits for them. An animation too large
+    for the memory budget drops its frames and is marked ``streamed``, to be
+    converted again as it plays.
+
+    :param Frame first: the whole first frame
+    :param list frames: the `Frame` objects
+    :param int loop: the number of times to play the animation, 0 for forever
+    """
+
+    def __init__(
+        self, first: Optional[Frame] = None, frames: Optional[List[Frame]] = None, loop: int = 1
+    ) -> None:
+        self.first = first
+        self.frames = [] if frames is None else frames
+        self.loop = loop
+        self.complete = frames is not None
+        self.streamed = False
+        self.error: Optional[Exception] = None
+        self._ready = threading.Condition()
+        self._nbytes = sum(frame.nbytes for frame in self.frames if frame is not first)
+        if first is not None:
+            self._nbytes += first.nbytes
+
+    @property
+    def nbytes(self) -> int:
+        """The memory used by the encoded frames"""
+        return self._nbytes
+
+    def frame(self, index: int) -> Optional[Frame]:
+        """Return a frame, waiting until it has been converted. Returns None
+        past the last frame."""
+        with self._ready:
+            while index >= len(self.frames) and not self.complete:
+                self._ready.wait()
+            if self.error is not None:
+                raise self.error
+            return self.frames[index] if index < len(self.frames) else None
+
+    def _add(self, frame: Frame) -> None:
+        """Add a converted frame."""
+        with self._ready:
+            if not self.frames:
+                self.first = frame
+            self.frames.append(frame)
+            self._nbytes += frame.nbytes
+            self._ready.notify_all()
+
+    def _finish(self, first: Optional[Frame] = None, error: Optional[Exception] = None) -> None:
+        """Mark the animation as complete, with the changes from the last to
+        the first frame or the error that stopped the conversion."""
+        with self._ready:
+            if first is not None:
+                self.frames[0] = first
+                self._nbytes += first.nbytes
+            self.error = error
+            self.complete = True
+            self._ready.notify_all()
+
+    def _drop(self) -> None:
+        """Drop the frames of an animation too large to keep, and mark it as
+        complete and streamed."""
+        with self._ready:
+            self.first = None
+            self.frames = []
+            self._nbytes = 0
+            self.streamed = True
+            self.complete = True
+            self._ready.notify_all()
+
+
+class FrameCache:
+    """A least recently used cache of encoded animations that keeps their
+    total size within a memory budget.
+
+    :param int budget: the maximum number of bytes of frame data to keep
+    """
+
+    def __init__(self, budget: int = 32 * 1024 * 1024) -> None:
+        self.budget = budget
+        self._animations: OrderedDict = OrderedDict()
+        self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """The memory used by the cached frames"""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._animations)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._animations
+
+    def get(self, key: Hashable) -> Optional[Animation]:
+        """Return the animation stored under ``key``, or None."""
+        animation = self._animations.get(key)
+        if animation is not None:
+            self._animations.move_to_end(key)
+        return animation
+
+    def put(self, key: Hashable, animation: Animation) -> None:
+        """Store an animation, evicting the least recently used ones to stay
+        within the budget. Animations larger than the budget are not stored."""
+        self.discard(key)
+        nbytes = animation.nbytes
+        if nbytes > self.budget:
+            return
+        while self._nbytes + nbytes > self.budget:
+            _, evicted = self._animations.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+        self._animations[key] = animation
+        self._nbytes += nbytes
+
+    def shrink(self, nbytes: int) -> None:
+        """Evict the least recently used animations until at most ``nbytes``
+        bytes are cached."""
+        while self._nbytes > max(0, nbytes):
+            _, evicted = self._animations.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+
+    def discard(self, key: Hashable) -> None:
+        """Remove the animation stored under ``key``, if any."""
+        animation = self._animations.pop(key, None)
+        if animation is not None:
+            self._nbytes -= animation.nbytes
+
+    def clear(self) -> None:
+        """Remove all animations."""
+        self._animations.clear()
+        self._nbytes = 0
+
+
+class AnimationPlayer:
+    """Plays animated GIFs on a display. Each frame is padded to the display,
+    rotated and encoded once, and the result is kept in a `FrameCache`, so
+    playing an animation again only sends the data to the display.
+
+    Conversion runs in background threads, and playing starts as soon as the
+    first frame is ready. Use `prefetch` to convert the animations likely to
+    be played next ahead of time. Frames being converted count against the
+    budget too, evicting cached animations to make room. An animation that
+    doesn't fit in the budget is not kept, but converted again frame by frame
+    each time it plays.
+
+    Frames are paced by a `FrameScheduler`, available as ``scheduler`` to
+    check how late playback runs. Frames that are dropped to catch up are
+    sent along with the next frame that is shown, leaving out parts drawn
+    over by it.
+
+    :param Display display: the display to play on
+    :param int rotation: the rotation to apply to the frames, defaults to the
+        rotation of the display
+    :param int budget: the memory budget of the frame cache, in bytes
+    :param tuple background: the RGB color of the padding around frames
+    :param bool drop: whether to drop frames when falling behind
+    :param int workers: the number of threads converting animations
+    """
+
+    def __init__(
+        self,
+        display: Display,
+        *,
+        rotation: Optional[int] = None,
+        budget: int = 32 * 1024 * 1024,
+        background: Tuple[int, int, int] = (0, 0, 0),
+        drop: bool = True,
+        workers: int = 2,
+    ) -> None:
+        self.display = display
+        self.rotation = display.rotation if rotation is None else rotation
+        self.background = background
+        self.cache = FrameCache(budget)
+        self.scheduler = FrameScheduler(drop=drop)
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._lock = threading.Lock()
+        self._converting: Dict[Tuple, Animation] = {}
+        # Animations too large for the budget, kept without frames
+        self._streamed: Dict[Tuple, Animation] = {}
+
+    def close(self) -> None:
+        """Stop the conversion threads once they are done."""
+        self._executor.shutdown(wait=False)
+
+    def _key(self, path: str) -> Tuple:
+        """Return the cache key of the animation in a file."""
+        path = os.path.abspath(path)
+        return (path, os.stat(path).st_mtime, self.display.width, self.display.height, self.rotation)
+
+    def load(self, path: str) -> Animation:
+        """Return the encoded frames of an animated GIF. If they are not in
+        the cache, conversion starts in the background and the returned
+        animation fills up as frames become ready."""
+        key = self._key(path)
+        with self._lock:
+            animation = self.cache.get(key) or self._converting.get(key) or self._streamed.get(key)
+            if animation is None:
+                animation = Animation()
+                self._converting[key] = animation
+                self._executor.submit(self._convert, path, key, animation)
+        return animation
+
+    def prefetch(self, *paths: str) -> None:
+        """Start converting animated GIFs in the background, so that they are
+        ready when played."""
+        for path in paths:
+            self.load(path)
+
+    def _convert(self, path: str, key: Tuple, animation: Animation) -> None:
+        """Convert an animated GIF and store it in the cache."""
+        try:
+            self._encode(path, animation)
+        except Exception as error:
+            animation._finish(error=error)
+        with self._lock:
+            del self._converting[key]
+            if animation.streamed:
+                self._streamed[key] = animation
+            elif animation.error is None:
+                self.cache.put(key, animation)
+
+    def _make_room(self) -> bool:
+        """Count the frames converted so far against the budget, evicting
+        cached animations to make room. Return False when the animations
+        being converted don't fit in the budget by themselves."""
+        with self._lock:
+            converting = sum(animation.nbytes for animation in self._converting.values())
+            if converting > self.cache.budget:
+                return False
+            self.cache.shrink(self.cache.budget - converting)
+            return True
+
+    def _encode(self, path: str, animation: Animation) -> None:
+        """Read an animated GIF and encode its frames into an animation."""
+        first = previous = b""
+        with Image.open(path) as image:
+            animation.loop = image.info.get("loop", 1)
+            for data, frame in self._frames(image):
+                first = first or data
+                animation._add(frame)
+                if not self._make_room():
+                    animation._drop()
+                    return
+                previous = data
+        if numpy and animation.first is not None and len(animation.frames) > 1:
+            width, height = self.display.width, self.display.height
+            animation._finish(Frame(_changes(previous, first, width, height), animation.first.duration))
+        else:
+            animation._finish()
+
+    def _frames(self, image: Image.Image) -> Iterator[Tuple[bytes, Frame]]:
+        """Encode the frames of an open animated GIF, and return the pixels
+        of each with the changes from the frame before it. The first frame
+        is whole."""
+        width, height = self.display.width, self.display.height
+        size = (height, width) if self.rotation % 180 == 90 else (width, height)
+        whole = (0, 0, width - 1, height - 1)
+        previous = None
+        for index in range(getattr(image, "n_frames", 1)):
+            image.seek(index)
+            frame = ImageOps.pad(
+                image.convert("RGB"), size, method=Image.Resampling.NEAREST, color=self.background
+            )
+            if self.rotation:
+                frame = frame.rotate(self.rotation, expand=True)
+            data = bytes(self.display._encode_image(frame))  # type: ignore[arg-type]
+            duration = image.info.get("duration", 0) / 1000
+            if previous is None or not numpy:
+                yield data, Frame([(*whole, data)], duration)
+            else:
+                yield data, Frame(_changes(previous, data, width, height), duration)
+            previous = data
+
+    def _pass(self, path: str, animation: Animation, first_pass: bool) -> Iterator[Frame]:
+        """Return the frames of one pass over an animation, converting them
+        from the file as they are needed once the animation is streamed."""
+        index = 0
+        while True:
+            frame = animation.first if first_pass and not index else animation.frame(index)
+            if frame is None:
+                break
+            yield frame
+            index += 1
+        if not animation.streamed:
+            return
+        with Image.open(path) as image:
+            for number, (_, frame) in enumerate(self._frames(image)):
+                if number >= index:
+                    yield frame
+
+    def show(self, frame: Frame) -> None:
+        """Send the rectangles of a frame to the display."""
+        self._send(frame.rects)
+
+    def _send(self, rects: List[Rect]) -> None:
+        """Send rectangles to the display."""
+        for x0, y0, x1, y1, data in rects:
+            self.display._block(x0, y0, x1, y1, data)
+
+    def play(
+        self,
+        path: str,
+        *,
+        loops: Optional[int] = None,
+        stop: Optional[Callable[[], bool]] = None,
+    ) -> bool:
+        """Play an animated GIF.
+
+        :param str path: the file to play
+        :param int loops: the number of times to play it, 0 for forever.
+            Defaults to the loop count of the file.
+        :param stop: a function called after each frame, return True from it
+            to stop playing
+        :return: True if the animation played to the end, False if stopped
+        """
+        animation = self.load(path)
+        animation.frame(0)
+        if loops is None:
+            loops = animation.loop
+        # Changes of dropped frames, still needed by the frames after them
+        dropped: List[Rect] = []
+        first_pass = True
+        self.scheduler.reset()
+        while True:
+            for frame in self._pass(path, animation, first_pass):
+                if self.scheduler.next(frame.duration):
+                    self._send(_uncovered(dropped + frame.rects) if dropped else frame.rects)
+                    dropped = []
+                else:
+                    dropped.extend(frame.rects)
+                if stop is not None and stop():
+                    return False
+                self.scheduler.wait()
+            if loops == 1:
+                if dropped:
+                    self._send(_uncovered(dropped))
+                return True
+            if loops > 0:
+                loops -= 1
+            first_pass = False
@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.arbiter`
+====================================================
+
+Hands a shared bus to one device at a time, highest priority first, so that
+threads drawing on displays and polling other devices on the same bus don't
+mix up their transfers. Requires threads, so it works on CPython only.
+
+* Author(s): Adafruit Industries
+"""
+
+import heapq
+import threading
+
+try:
+    from typing import Dict, List, Optional, Tuple
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+
+class BusArbiter:
+    """Lets one thread at a time use a bus, and decides who is next when it
+    is released: the waiting thread with the highest priority, or the one
+    waiting longest among equal priorities. The thread holding the bus may
+    acquire it again without blocking.
+
+    Long transfers call :meth:`checkpoint` between chunks, where they give
+    the bus to a waiting thread with a higher priority and wait to get it
+    back. A touch controller polled with a high priority thus waits at most
+    one chunk of a frame.
+
+    Displays sharing the bus are always taken before the bus. A thread
+    holding the bus may only draw on displays it already holds, otherwise
+    drawing raises :class:`RuntimeError` rather than risk a deadlock.
+
+    .. code-block:: python
+
+      arbiter = BusArbiter.for_bus(spi)
+      display.share_bus(arbiter)
+      with arbiter.claim(priority=10):
+          touch.read()
+      with display, arbiter.claim(priority=10):
+          display.pixel(0, 0, 0xFFFF)
+
+    """
+
+    _buses: Dict[int, Tuple[object, "BusArbiter"]] = {}
+    _buses_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._owner: Optional[int] = None
+        self._depth = 0
+        self._priority = 0
+        # Waiting threads, as (-priority, order, thread) with the next one first
+        self._waiting: List[Tuple[int, int, int]] = []
+        self._order = 0
+        self._resumed = 0
+
+    @classmethod
+    def for_bus(cls, bus: object) -> "BusArbiter":
+        """Return the arbiter of a bus, made the first time it is asked for,
+        so that all devices on the bus share it."""
+        with cls._buses_lock:
+            entry = cls._buses.get(id(bus))
+            if entry is None or entry[0] is not bus:
+                entry = (bus, cls())
+                cls._buses[id(bus)] = entry
+            return entry[1]
+
+    @property
+    def held(self) -> bool:
+        """Whether the current thread holds the bus"""
+        return self._owner == threading.get_ident()
+
+    @property
+    def waiting(self) -> int:
+        """The number of threads waiting for the bus"""
+        return len(self._waiting)
+
+    def _wait_turn(self, entry: Tuple[int, int, int]) -> None:
+        """Queue up and wait until the bus is free and it's our turn. Called
+        with the condition held."""
+        heapq.heappush(self._waiting, entry)
+        while self._owner is not None or self._waiting[0] is not entry:
+            self._condition.wait()
+        heapq.heappop(self._waiting)
+        self._owner = entry[2]
+
+    def acquire(self, priority: int = 0) -> None:
+        """Wait for the bus and take it.
+
+        :param int priority: threads with higher priorities get the bus first
+        """
+        me = threading.get_ident()
+        with self._condition:
+            if self._owner == me:
+                self._depth += 1
+                return
+            self._order += 1
+            self._wait_turn((-priority, self._order, me))
+            self._depth = 1
+            self._priority = priority
+
+    def release(self) -> None:
+        """Give the bus back, once for each time it was acquired."""
+        with self._condition:
+            if self._owner != threading.get_ident():
+                raise RuntimeError("Bus is not held by this thread")
+            self._depth -= 1
+            if not self._depth:
+                self._owner = None
+                self._condition.notify_all()
+
+    def checkpoint(self) -> bool:
+        """Let a waiting thread with a higher priority use the bus, then take
+        it back. Call it only where the transfer can be safely interrupted.
+
+        :return: whether the bus was given away
+        """
+        me = threading.get_ident()
+        with self._condition:
+            if self._owner != me or not self._waiting or -self._waiting[0][0] <= self._priority:
+                return False
+            depth, priority = self._depth, self._priority
+            self._owner = None
+            self._condition.notify_all()
+            # Come back before others of the same priority, as we were first
+            self._resumed -= 1
+            self._wait_turn((-priority, self._resumed, me))
+            self._depth, self._priority = depth, priority
+            return True
+
+    def claim(self, priority: int = 0) -> "_Claim":
+        """Return a context manager that holds the bus with a priority."""
+        return _Claim(self, priority)
+
+    def __enter__(self) -> "BusArbiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.release()
+
+
+class _Claim:
+    """Holds a bus with a priority for the duration of a with statement."""
+
+    def __init__(self, arbiter: BusArbiter, priority: int) -> None:
+        self.arbiter = arbiter
+        self.priority = priority
+
+    def __enter__(self) -> BusArbiter:
+        self.arbiter.acquire(self.priority)
+        return self.arbiter
+
+    def __exit__(self, *exc: object) -> None:
+        self.arbiter.release()
@@ -0,0 +1,305 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.asset`
+====================================================
+
+Icons and backgrounds stored as 565 pixels ready to send to the display, drawn
+with :meth:`Display.draw_asset() <adafruit_rgb_display.rgb.Display.draw_asset>`.
+Loading and drawing work on CircuitPython, reading the file as it is drawn.
+Converting images requires Pillow.
+
+The file starts with a 10 byte little endian header: the magic ``b"A565"``,
+the width and height and the flags. Without flags, big endian 565 pixels
+follow, one line after another. With the ``RLE`` or ``KEYED`` flags each line
+is stored as its size in bytes (32 bits) and the number of spans of opaque
+pixels (16 bits), then each span as its offset and number of pixels (16 bits
+each) followed by its pixels. With ``RLE`` the pixels of a span are stored as
+runs, each starting with a byte: with the top bit set, the next pixel repeats
+the lower 7 bits plus one times, otherwise that many plus one pixels follow.
+
+Convert an image from the command line with:
+
+.. code-block:: shell
+
+  python -m adafruit_rgb_display.asset icon.a565 icon.png --rotation 90 --rle
+
+* Author(s): Adafruit Industries
+"""
+
+import struct
+
+try:
+    import mmap
+except ImportError:
+    mmap = None  # type: ignore[assignment]
+
+try:
+    from typing import Iterator, List, Optional, Tuple, Union
+
+    from circuitpython_typing.pil import Image
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+_MAGIC = b"A565"
+_HEADER = "<4sHHH"
+_HEADER_SIZE = struct.calcsize(_HEADER)
+
+RLE = 0x01
+"""Flag of assets storing their pixels as runs"""
+KEYED = 0x02
+"""Flag of assets with transparent pixels"""
+
+# The number of bytes read at a time when streaming from a file
+_CHUNK_SIZE = 1024
+
+
+def _unpack(row: memoryview, offset: int, count: int) -> Tuple[bytearray, int]:
+    """Decode the runs of ``count`` pixels starting at ``offset`` in a line,
+    returning the pixels and the offset after them."""
+    pixels = bytearray(count * 2)
+    position = 0
+    while position < len(pixels):
+        header = row[offset]
+        offset += 1
+        run = (header & 0x7F) + 1
+        if header & 0x80:
+            pixels[position : position + run * 2] = bytes(row[offset : offset + 2]) * run
+            offset += 2
+        else:
+            pixels[position : position + run * 2] = row[offset : offset + run * 2]
+            offset += run * 2
+        position += run * 2
+    return pixels, offset
+
+
+def _pack(pixels: bytes) -> bytes:
+    """Encode big endian 565 pixels as runs."""
+    colors = [pixels[i : i + 2] for i in range(0, len(pixels), 2)]
+    data = bytearray()
+    start = 0
+    while start < len(colors):
+        end = start + 1
+        while end < len(colors) and end - start < 128 and colors[end] == colors[start]:
+            end += 1
+        if end - start > 1:
+            data.append(0x80 | (end - start - 1))
+            data += colors[start]
+        else:
+            # Gather pixels up to the next repeated one
+            while end < len(colors) and end - start < 128 and colors[end] != colors[end - 1]:
+                end += 1
+            if end < len(colors) and end - start > 1 and colors[end] == colors[end - 1]:
+                end -= 1
+            data.append(end - start - 1)
+            data += b"".join(colors[start:end])
+        start = end
+    return bytes(data)
+
+
+class Asset:
+    """An image stored as pixels ready to send to the display. The file is
+    memory mapped when possible, and otherwise read as the asset is drawn, so
+    that even large backgrounds don't need to fit in memory.
+
+    :param str path: the asset file
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        magic, width, height, flags = struct.unpack(_HEADER, self._file.read(_HEADER_SIZE))
+        if magic != _MAGIC:
+            self._file.close()
+            raise ValueError("Not a 565 asset file")
+        self.width = width
+        self.height = height
+        self.flags = flags
+        """The flags of the asset, :const:`RLE` and :const:`KEYED`"""
+        self._mmap = None
+        self._map: Optional[memoryview] = None
+        if mmap is not None:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._map = memoryview(self._mmap)
+        self._position = 0
+
+    @property
+    def keyed(self) -> bool:
+        """Whether the asset has transparent pixels"""
+        return bool(self.flags & KEYED)
+
+    @property
+    def pixels(self) -> Optional[memoryview]:
+        """The pixels of a memory mapped asset without flags, without copying,
+        or None for other assets"""
+        if self.flags or self._map is None:
+            return None
+        return self._map[_HEADER_SIZE : _HEADER_SIZE + self.width * self.height * 2]
+
+    def _seek(self, position: int) -> None:
+        self._position = position
+        if self._map is None:
+            self._file.seek(position)
+
+    def _read(self, size: int) -> Union[bytes, memoryview]:
+        if self._map is None:
+            return self._file.read(size)
+        data = self._map[self._position : self._position + size]
+        self._position += size
+        return data
+
+    def chunks(self) -> Iterator[Union[bytes, memoryview]]:
+        """Return the pixels of an asset without flags, one piece at a time."""
+        if self.flags:
+            raise ValueError("Asset is not stored as plain pixels")
+        self._seek(_HEADER_SIZE)
+        size = self.width * self.height * 2
+        if self._map is not None:
+            yield self._read(size)
+            return
+        while size > 0:
+            yield self._read(min(size, _CHUNK_SIZE))
+            size -= _CHUNK_SIZE
+
+    def spans(self) -> Iterator[Tuple[int, int, Union[bytes, bytearray, memoryview]]]:
+        """Return the spans of opaque pixels of the asset, one line after
+        another, as their horizontal offset, vertical offset and pixels."""
+        if not self.flags:
+            for y, pixels in enumerate(self._lines()):
+                yield 0, y, pixels
+            return
+        self._seek(_HEADER_SIZE)
+        for y in range(self.height):
+            (size,) = struct.unpack("<I", self._read(4))
+            row = memoryview(self._read(size))
+            (spans,) = struct.unpack_from("<H", row, 0)
+            offset = 2
+            for _ in range(spans):
+                x, count = struct.unpack_from("<HH", row, offset)
+                offset += 4
+                if self.flags & RLE:
+                    runs, offset = _unpack(row, offset, count)
+                    yield x, y, runs
+                else:
+                    yield x, y, row[offset : offset + count * 2]
+                    offset += count * 2
+
+    def _lines(self) -> Iterator[Union[bytes, memoryview]]:
+        """Return the lines of an asset without flags."""
+        self._seek(_HEADER_SIZE)
+        for _ in range(self.height):
+            yield self._read(self.width * 2)
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._map is not None:
+            self._map.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+
+def _line_spans(line: list, keyed: bool) -> list:
+    """Split a line of 565 colors, None where transparent, into spans of
+    opaque pixels."""
+    if not keyed:
+        return [(0, line)]
+    spans = []
+    start = None
+    for x, color in enumerate(line + [None]):
+        if color is None and start is not None:
+            spans.append((start, line[start:x]))
+            start = None
+        elif color is not None and start is None:
+            start = x
+    return spans
+
+
+def encode(
+    path: str,
+    image: Union[str, Image],
+    *,
+    rotation: int = 0,
+    rle: bool = False,
+    key: Optional[Union[int, Tuple[int, int, int]]] = None,
+) -> int:
+    """Convert an image into an asset file. Pixels that are mostly
+    transparent, or that have the color ``key``, are left out when drawing.
+
+    :param str path: the asset file to write
+    :param image: the PIL image, or the image file to read
+    :param int rotation: the rotation of the display, applied like
+        :meth:`Display.image() <adafruit_rgb_display.rgb.Display.image>`
+    :param bool rle: whether to store the pixels as runs, which is smaller for
+        flat colors
+    :param key: the color of transparent pixels, as a 565 integer or an RGB tuple
+    :return: the size of the file in bytes
+    """
+    from PIL import Image as PILImage  # noqa: PLC0415
+
+    from adafruit_rgb_display.rgb import color565  # noqa: PLC0415
+
+    if rotation not in {0, 90, 180, 270}:
+        raise ValueError("Rotation must be 0/90/180/270")
+    # The image protocol of circuitpython_typing requires all arguments
+    picture = (PILImage.open(image) if isinstance(image, str) else image).convert("RGBA")  # type: ignore[call-arg]
+    if rotation:
+        picture = picture.rotate(rotation, expand=True)
+    if isinstance(key, tuple):
+        key = color565(key)
+    width, height = picture.size
+    pixels = list(picture.getdata())
+    lines = []
+    keyed = False
+    for y in range(height):
+        line: List[Optional[int]] = []
+        for red, green, blue, alpha in pixels[y * width : (y + 1) * width]:
+            color = color565(red, green, blue)
+            if alpha < 128 or color == key:
+                line.append(None)
+                keyed = True
+            else:
+                line.append(color)
+        lines.append(line)
+    flags = (RLE if rle else 0) | (KEYED if keyed else 0)
+    with open(path, "wb") as file:
+        file.write(struct.pack(_HEADER, _MAGIC, width, height, flags))
+        for line in lines:
+            if not flags:
+                file.write(struct.pack(">%dH" % width, *line))
+                continue
+            spans = _line_spans(line, keyed)
+            row = bytearray(struct.pack("<H", len(spans)))
+            for x, colors in spans:
+                data = struct.pack(">%dH" % len(colors), *colors)
+                row += struct.pack("<HH", x, len(colors)) + (_pack(data) if rle else data)
+            file.write(struct.pack("<I", len(row)) + row)
+        return file.tell()
+
+
+def main() -> None:
+    """Convert an image from the command line."""
+    import argparse  # noqa: PLC0415
+
+    parser = argparse.ArgumentParser(description="Convert an image into a 565 asset.")
+    parser.add_argument("output", help="the asset file to write")
+    parser.add_argument("image", help="the image to convert")
+    parser.add_argument("--rotation", type=int, default=0, help="the rotation of the display")
+    parser.add_argument("--rle", action="store_true", help="store the pixels as runs")
+    parser.add_argument("--key", help="the color of transparent pixels, as RRGGBB")
+    args = parser.parse_args()
+    key = None
+    if args.key:
+        value = int(args.key, 16)
+        key = ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+    size = encode(args.output, args.image, rotation=args.rotation, rle=args.rle, key=key)
+    print(f"Wrote {size} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
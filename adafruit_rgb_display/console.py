@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.console`
+====================================================
+
+A text console that adds lines using hardware scrolling, so that only the new
+line is sent to the display. Requires Pillow to render the font.
+
+* Author(s): Adafruit Industries
+"""
+
+from math import ceil
+
+from PIL import ImageFont
+
+from adafruit_rgb_display.rgb import Display, VerticalScroll
+from adafruit_rgb_display.text import TextRenderer
+
+try:
+    from typing import List, Optional, Tuple
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+
+class Console:
+    """A scrolling text console. Each line is drawn into the band exposed by
+    scrolling the display, from a cache of glyphs already encoded for the
+    display. Displays without vertical scrolling redraw all lines instead.
+
+    :param Display display: the display to draw on
+    :param font: a Pillow font, monospaced fonts work best. Defaults to
+        Pillow's default font.
+    :param int color: default text color in 565 format
+    :param int background: default background color in 565 format
+    :param int backlog: number of lines to remember for redrawing
+    :param int top: number of lines at the top of the display to leave alone
+    :param int bottom: number of lines at the bottom of the display to leave alone
+    """
+
+    def __init__(
+        self,
+        display: Display,
+        font: Optional[ImageFont.ImageFont] = None,
+        color: int = 0xFFFF,
+        background: int = 0,
+        *,
+        backlog: int = 100,
+        top: int = 0,
+        bottom: int = 0,
+    ) -> None:
+        self.display = display
+        self.font = font if font is not None else ImageFont.load_default()
+        self.color = color
+        self.background = background
+        self._cell_width = ceil(self.font.getlength("M"))
+        self._renderer = TextRenderer(display, self.font, cell_width=self._cell_width)
+        self._line_height = self._renderer.line_height
+        self.columns = display.width // self._cell_width
+        self.rows = (display.height - top - bottom) // self._line_height
+        if self.columns < 1 or self.rows < 1:
+            raise ValueError("Display is too small for the font")
+        self._top = top
+        self._bottom = display.height - top - self.rows * self._line_height
+        self._scrolling = isinstance(display, VerticalScroll) and not display._SCROLL_ALONG_X
+        self._backlog = max(backlog, self.rows)
+        self._lines: List[Tuple[str, int, int]] = []
+        self._row = 0
+        self.clear()
+
+    @property
+    def lines(self) -> List[str]:
+        """The remembered lines of text, oldest first"""
+        return [line[0] for line in self._lines]
+
+    def clear(self) -> None:
+        """Clear the console and forget all lines."""
+        self._lines.clear()
+        self._row = 0
+        if self._scrolling:
+            self.display.scroll_area(self._top, self._bottom)  # type: ignore[attr-defined]
+        self.display.fill_rectangle(
+            0, self._top, self.display.width, self.rows * self._line_height, self.background
+        )
+
+    def append(self, text: str, color: Optional[int] = None, background: Optional[int] = None) -> None:
+        """Add text at the bottom of the console, scrolling up as needed. Lines
+        are split at newlines and wrapped at the width of the console."""
+        if color is None:
+            color = self.color
+        if background is None:
+            background = self.background
+        for line in text.split("\n"):
+            for start in range(0, max(len(line), 1), self.columns):
+                self._add(line[start : start + self.columns], color, background)
+
+    def redraw(self) -> None:
+        """Draw all the visible lines again, for example after something else
+        has drawn over the console."""
+        lines = self._lines[-self.rows :]
+        if self._scrolling:
+            self.display.scroll_area(self._top, self._bottom)  # type: ignore[attr-defined]
+        for row, line in enumerate(lines):
+            self._draw(self._top + row * self._line_height, *line)
+        if len(lines) < self.rows:
+            y = self._top + len(lines) * self._line_height
+            self.display.fill_rectangle(
+                0, y, self.display.width, (self.rows - len(lines)) * self._line_height, self.background
+            )
+        self._row = len(lines)
+
+    def _add(self, text: str, color: int, background: int) -> None:
+        """Remember a line of text and show it on the last row."""
+        self._lines.append((text, color, background))
+        del self._lines[: -self._backlog]
+        if self._row < self.rows:
+            y = self._top + self._row * self._line_height
+            self._row += 1
+        elif self._scrolling:
+            self.display.scroll(self._line_height)  # type: ignore[attr-defined]
+            y = self.display.scrolled(self._top + (self.rows - 1) * self._line_height)  # type: ignore[attr-defined]
+        else:
+            self.redraw()
+            return
+        self._draw(y, text, color, background)
+
+    def _draw(self, y: int, text: str, color: int, background: int) -> None:
+        """Send a line of text to the display in a single block."""
+        self._renderer.draw(text.ljust(self.columns), 0, y, color, background)
@@ -0,0 +1,233 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.fbmirror`
+====================================================
+
+Mirror a Linux framebuffer such as ``/dev/fb0`` to a display, converting the
+memory mapped framebuffer directly and sending only the tiles that changed.
+Requires NumPy.
+
+* Author(s): Adafruit Industries
+"""
+
+import fcntl
+import mmap
+import os
+import struct
+
+import numpy
+
+from adafruit_rgb_display.rgb import Display
+from adafruit_rgb_display.scaler import Scaler
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+# definitions from linux/fb.h
+_FBIOGET_VSCREENINFO = 0x4600
+_FBIOGET_FSCREENINFO = 0x4602
+_VSCREENINFO = "8I12I16I4I"
+_FSCREENINFO = "16cL4I3HI"
+
+# Bytes per pixel of the supported pixel formats, named by their byte order
+_FORMATS = {"RGB565": 2, "BGRA": 4, "XRGB": 4}
+
+
+class Framebuffer:
+    """A Linux framebuffer device, or a file with the same layout, mapped
+    into memory. The size and pixel format are read from the device unless
+    given.
+
+    :param str path: the framebuffer device or file
+    :param int width: the number of pixels in a line
+    :param int height: the number of lines
+    :param str pixel_format: the byte order of the pixels, ``"RGB565"`` (16-bit
+        little endian), ``"BGRA"`` (32-bit little endian XRGB) or ``"XRGB"``
+    :param int stride: the number of bytes between lines, defaults to packed lines
+    """
+
+    def __init__(
+        self,
+        path: str = "/dev/fb0",
+        *,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        pixel_format: Optional[str] = None,
+        stride: Optional[int] = None,
+    ) -> None:
+        self.path = path
+        self._fd = os.open(path, os.O_RDONLY)
+        if width is None or height is None or pixel_format is None:
+            width, height, pixel_format, stride = self._query()
+        if pixel_format not in _FORMATS:
+            raise ValueError("Pixel format must be one of " + ", ".join(_FORMATS))
+        bytes_per_pixel = _FORMATS[pixel_format]
+        if stride is None:
+            stride = width * bytes_per_pixel
+        self.width = width
+        self.height = height
+        self.pixel_format = pixel_format
+        self.stride = stride
+        self._map = mmap.mmap(self._fd, stride * height, flags=mmap.MAP_SHARED, prot=mmap.PROT_READ)
+        self.pixels = numpy.frombuffer(self._map, dtype="<u%d" % bytes_per_pixel).reshape(
+            height, stride // bytes_per_pixel
+        )
+        """The pixels of the framebuffer, without copying, one line per row"""
+
+    def _query(self) -> tuple:
+        """Read the size and pixel format of a framebuffer device."""
+        try:
+            vinfo = struct.unpack(
+                _VSCREENINFO,
+                fcntl.ioctl(self._fd, _FBIOGET_VSCREENINFO, bytes(struct.calcsize(_VSCREENINFO))),
+            )
+            finfo = struct.unpack(
+                _FSCREENINFO,
+                fcntl.ioctl(self._fd, _FBIOGET_FSCREENINFO, bytes(struct.calcsize(_FSCREENINFO))),
+            )
+        except OSError as error:
+            os.close(self._fd)
+            raise ValueError("Not a framebuffer device, give the size and pixel format") from error
+        bits_per_pixel, red_offset = vinfo[6], vinfo[8]
+        if bits_per_pixel == 16:
+            pixel_format = "RGB565"
+        elif bits_per_pixel == 32 and red_offset == 16:
+            pixel_format = "BGRA"
+        elif bits_per_pixel == 32 and red_offset == 8:
+            pixel_format = "XRGB"
+        else:
+            os.close(self._fd)
+            raise ValueError("Unsupported framebuffer pixel format")
+        return vinfo[0], vinfo[1], pixel_format, finfo[24]
+
+    def close(self) -> None:
+        """Unmap and close the framebuffer."""
+        del self.pixels
+        self._map.close()
+        os.close(self._fd)
+
+
+class FramebufferMirror:
+    """Copies a framebuffer to a display, scaled to fill the display. Each
+    display pixel is looked up through an index map computed once, converted
+    to 565 in place, and compared with the previous update so that only
+    changed tiles are sent.
+
+    :param Display display: the display to copy to
+    :param Framebuffer framebuffer: the framebuffer to copy from
+    :param int rotation: the rotation to apply, defaults to the rotation of
+        the display
+    :param int tile: the size of the square tiles compared between updates
+    :param str mode: ``"nearest"`` to copy the nearest framebuffer pixel, or
+        ``"box"`` to average the framebuffer pixels covered by each display
+        pixel, which is slower but keeps small text readable
+    """
+
+    def __init__(
+        self,
+        display: Display,
+        framebuffer: Framebuffer,
+        *,
+        rotation: Optional[int] = None,
+        tile: int = 16,
+        mode: str = "nearest",
+    ) -> None:
+        display._require_565("Mirroring a framebuffer")
+        if mode not in {"nearest", "box"}:
+            raise ValueError("Mode must be nearest or box")
+        if rotation is None:
+            rotation = display.rotation
+        self.display = display
+        self.framebuffer = framebuffer
+        self.tile = tile
+        self.mode = mode
+        width, height = display.width, display.height
+        if rotation % 180 == 90:
+            width, height = height, width
+        # Nearest source pixel of each pixel of the image before rotation
+        rows = ((numpy.arange(height) + 0.5) * framebuffer.height / height).astype("intp")
+        columns = ((numpy.arange(width) + 0.5) * framebuffer.width / width).astype("intp")
+        index = rows[:, None] * framebuffer.pixels.shape[1] + columns[None, :]
+        self._index = numpy.ascontiguousarray(numpy.rot90(index, rotation // 90))
+        self._source = numpy.empty(self._index.shape, dtype=framebuffer.pixels.dtype)
+        self._frame = numpy.empty(self._index.shape, dtype=">u2")
+        self._previous: Optional[numpy.ndarray] = None
+        self._scaler: Optional[Scaler] = None
+        if mode == "box":
+            self._scaler = Scaler(
+                (framebuffer.width, framebuffer.height), (width, height), "box", rotation=rotation
+            )
+
+    def refresh(self) -> None:
+        """Send the whole display on the next update."""
+        self._previous = None
+
+    def _convert(self) -> numpy.ndarray:
+        """Convert the framebuffer into a new 565 frame and return it."""
+        if self._scaler is not None:
+            return self._scaler.scale(self._channels())
+        numpy.take(self.framebuffer.pixels, self._index, out=self._source)
+        pixels = self._source
+        pixel_format = self.framebuffer.pixel_format
+        if pixel_format == "RGB565":
+            self._frame[:] = pixels
+        elif pixel_format == "BGRA":
+            self._frame[:] = ((pixels >> 8) & 0xF800) | ((pixels >> 5) & 0x07E0) | ((pixels >> 3) & 0x001F)
+        else:
+            self._frame[:] = (pixels & 0xF800) | ((pixels >> 13) & 0x07E0) | ((pixels >> 27) & 0x001F)
+        return self._frame
+
+    def _channels(self) -> numpy.ndarray:
+        """Return the red, green and blue channels of the framebuffer. The
+        32-bit formats are viewed in place, 565 pixels are unpacked."""
+        framebuffer = self.framebuffer
+        pixels = framebuffer.pixels[:, : framebuffer.width]
+        if framebuffer.pixel_format == "RGB565":
+            channels = numpy.empty(pixels.shape + (3,), dtype="uint8")
+            channels[:, :, 0] = (pixels >> 8) & 0xF8
+            channels[:, :, 1] = (pixels >> 3) & 0xFC
+            channels[:, :, 2] = (pixels << 3) & 0xF8
+            return channels
+        bytes_ = pixels.view("uint8").reshape(pixels.shape + (4,))
+        if framebuffer.pixel_format == "BGRA":
+            return bytes_[:, :, 2::-1]
+        return bytes_[:, :, 1:]
+
+    def update(self) -> int:
+        """Copy the framebuffer to the display, sending only the tiles that
+        changed since the last update. Adjacent changed tiles in a row of
+        tiles are sent as one block.
+
+        :return: the number of blocks sent
+        """
+        frame = self._convert()
+        height, width = frame.shape
+        tile = self.tile
+        if self._previous is None:
+            self._previous = numpy.empty_like(frame)
+            changed = numpy.ones(((height + tile - 1) // tile, (width + tile - 1) // tile), dtype=bool)
+        else:
+            changed = frame != self._previous
+            changed = numpy.logical_or.reduceat(changed, numpy.arange(0, height, tile), axis=0)
+            changed = numpy.logical_or.reduceat(changed, numpy.arange(0, width, tile), axis=1)
+        blocks = 0
+        for row, tiles in enumerate(changed):
+            if not tiles.any():
+                continue
+            # Find runs of changed tiles from the edges between runs
+            edges = numpy.flatnonzero(numpy.diff(numpy.concatenate(([0], tiles.view("uint8"), [0]))))
+            y0, y1 = row * tile, min(height, (row + 1) * tile)
+            for start, end in zip(edges[::2], edges[1::2]):
+                x0, x1 = start * tile, min(width, end * tile)
+                self.display._block(x0, y0, x1 - 1, y1 - 1, frame[y0:y1, x0:x1].tobytes())
+                blocks += 1
+        self._previous[:] = frame
+        return blocks
@@ -100,6 +100,7 @@ class GC9A01A(DisplaySPI):
         x_offset: int = 0,
         y_offset: int = 0,
         rotation: int = 0,
+        exclusive: bool = False,
     ) -> None:
         super().__init__(
             spi,
@@ -114,6 +115,7 @@ class GC9A01A(DisplaySPI):
             x_offset=x_offset,
             y_offset=y_offset,
             rotation=rotation,
+            exclusive=exclusive,
         )
 
     def init(self) -> None:
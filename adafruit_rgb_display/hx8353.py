@@ -77,5 +77,7 @@ class HX8353(DisplaySPI):
         width: int = 128,
         height: int = 128,
         rotation: int = 0,
+        *,
+        exclusive: bool = False,
     ) -> None:
-        super().__init__(spi, dc, cs, rst, width, height, rotation)
+        super().__init__(spi, dc, cs, rst, width, height, rotation=rotation, exclusive=exclusive)
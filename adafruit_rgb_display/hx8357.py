@@ -14,7 +14,7 @@ A simple driver for the HX8357-based displays.
 
 from micropython import const
 
-from adafruit_rgb_display.rgb import DisplaySPI
+from adafruit_rgb_display.rgb import DisplaySPI, VerticalScroll
 
 try:
     from typing import Optional
@@ -53,7 +53,7 @@ _SETPANEL = const(0xCC)
 _SETGAMMA = const(0xE0)
 
 
-class HX8357(DisplaySPI):
+class HX8357(VerticalScroll, DisplaySPI):
     """
     A simple driver for the HX8357-based displays.
 
@@ -73,6 +73,9 @@ class HX8357(DisplaySPI):
     _PAGE_SET = _PASET
     _RAM_WRITE = _RAMWR
     _RAM_READ = _RAMRD
+    _SCROLL_LINES = 480
+    # The init sequence exchanges rows and columns
+    _SCROLL_ALONG_X = True
     _INIT = (
         (_SWRESET, None),
         (_SETC, b"\xff\x83\x57"),
@@ -114,6 +117,8 @@ class HX8357(DisplaySPI):
         polarity: int = 0,
         phase: int = 0,
         rotation: int = 0,
+        *,
+        exclusive: bool = False,
     ):
         super().__init__(
             spi,
@@ -126,4 +131,5 @@ class HX8357(DisplaySPI):
             polarity=polarity,
             phase=phase,
             rotation=rotation,
+            exclusive=exclusive,
         )
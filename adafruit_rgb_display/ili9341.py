@@ -12,9 +12,7 @@ A simple driver for the ILI9341/ILI9340-based displays.
 * Author(s): Radomir Dopieralski, Michael McWethy, Matt Land
 """
 
-import struct
-
-from adafruit_rgb_display.rgb import DisplaySPI
+from adafruit_rgb_display.rgb import DisplaySPI, VerticalScroll
 
 try:
     from typing import Optional
@@ -28,7 +26,7 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
 
 
-class ILI9341(DisplaySPI):
+class ILI9341(VerticalScroll, DisplaySPI):
     """
     A simple driver for the ILI9341/ILI9340-based displays.
 
@@ -93,6 +91,8 @@ class ILI9341(DisplaySPI):
         polarity: int = 0,
         phase: int = 0,
         rotation: int = 0,
+        *,
+        exclusive: bool = False,
     ):
         super().__init__(
             spi,
@@ -105,16 +105,5 @@ class ILI9341(DisplaySPI):
             polarity=polarity,
             phase=phase,
             rotation=rotation,
+            exclusive=exclusive,
         )
-        self._scroll = 0
-
-    def scroll(
-        self,
-        dy: Optional[int] = None,
-    ) -> Optional[int]:
-        """Scroll the display by delta y"""
-        if dy is None:
-            return self._scroll
-        self._scroll = (self._scroll + dy) % self.height
-        self.write(0x37, struct.pack(">H", self._scroll))
-        return None
@@ -14,6 +14,7 @@ Base class for all RGB Display devices
 
 import struct
 import time
+from binascii import crc32
 
 try:
     from typing import Any, ByteString, List, Optional, Tuple, Union
@@ -21,6 +22,9 @@ try:
     import busio
     import digitalio
     from circuitpython_typing.pil import Image
+
+    from adafruit_rgb_display.arbiter import BusArbiter
+    from adafruit_rgb_display.asset import Asset
 except ImportError:
     pass
 
@@ -29,6 +33,11 @@ try:
 except ImportError:
     numpy = None
 
+try:
+    import threading
+except ImportError:
+    threading = None  # type: ignore[assignment]
+
 from adafruit_bus_device import spi_device
 
 __version__ = "0.0.0+auto.0"
@@ -73,6 +82,59 @@ def image_to_data(image: Image) -> Any:
     return numpy.dstack(((color >> 8) & 0xFF, color & 0xFF)).flatten().tolist()
 
 
+# Lookup tables reducing the red, green and blue channels to their bits of an
+# 8-bit RGB332 pixel, one after another as expected by ``Image.point``.
+_LUT332 = (
+    [v & 0xE0 for v in range(256)] + [(v & 0xE0) >> 3 for v in range(256)] + [v >> 6 for v in range(256)]
+)
+
+# 4x4 Bayer matrix used for ordered dithering.
+_BAYER = ((0, 8, 2, 10), (12, 4, 14, 6), (3, 11, 1, 9), (15, 7, 13, 5))
+
+
+def image_to_data332(image: Image, dither: bool = False) -> bytes:
+    """Convert a PIL image to 8-bit RGB332 bytes, optionally with ordered
+    dithering. Uses NumPy when available, otherwise Pillow's own lookup
+    table and matrix conversions."""
+    rgb = image.convert("RGB")  # type: ignore[call-arg]
+    width, height = rgb.size
+    if numpy:
+        data = numpy.asarray(rgb, dtype="uint16")
+        if dither:
+            threshold = numpy.array(_BAYER, dtype="uint16")[:, :, None] * (2, 2, 4)
+            threshold = numpy.tile(threshold, ((height + 3) // 4, (width + 3) // 4, 1))
+            data = numpy.minimum(data + threshold[:height, :width], 255)
+        lut = numpy.array(_LUT332, dtype="uint8").reshape(3, 256)
+        return (lut[0][data[:, :, 0]] | lut[1][data[:, :, 1]] | lut[2][data[:, :, 2]]).tobytes()
+    if dither:
+        from PIL import ImageChops  # noqa: PLC0415
+
+        rows = [
+            (bytes(value for b in row for value in (b * 2, b * 2, b * 4)) * ((width + 3) // 4))[: width * 3]
+            for row in _BAYER
+        ]
+        threshold = rgb.copy()
+        threshold.frombytes(b"".join(rows[y % 4] for y in range(height)))
+        rgb = ImageChops.add(rgb, threshold)
+    # The channel bits don't overlap, so summing them assembles the pixel
+    return rgb.point(_LUT332).convert("L", matrix=(1, 1, 1, 0)).tobytes()
+
+
+def _expand(data: ByteString, width: int, height: int, scale: int) -> ByteString:
+    """Repeat each encoded pixel of an image ``scale`` times along both axes."""
+    size = len(data) // (width * height)
+    if numpy:
+        pixels = numpy.frombuffer(data, dtype="uint8").reshape(height, width, size)
+        return pixels.repeat(scale, axis=1).repeat(scale, axis=0).tobytes()
+    data = bytes(data)
+    rows = []
+    stride = width * size
+    for row in range(0, height * stride, stride):
+        line = b"".join(data[i : i + size] * scale for i in range(row, row + stride, size))
+        rows.append(line * scale)
+    return b"".join(rows)
+
+
 class DummyPin:
     """Can be used in place of a ``DigitalInOut()`` when you don't want to skip it."""
 
@@ -122,12 +184,21 @@ class Display:
     _COLUMN_SET: Optional[int] = None
     _RAM_WRITE: Optional[int] = None
     _RAM_READ: Optional[int] = None
+    # Bytes the controller sends before the pixels it reads back
+    _READ_DUMMY = 1
     _X_START = 0
     _Y_START = 0
     _INIT: Tuple[Tuple[int, Union[ByteString, None]], ...] = ()
     _ENCODE_PIXEL = ">H"
     _ENCODE_POS = ">HH"
     _DECODE_PIXEL = ">BBB"
+    _shadow: Any = None
+    # Lines per stripe of the image cache, 0 when disabled
+    _stripe_height = 0
+    _lock: Any = None
+    # The thread holding the lock and how many times it took it
+    _holder: Optional[int] = None
+    _holds = 0
 
     def __init__(self, width: int, height: int, rotation: int) -> None:
         self.width = width
@@ -135,8 +206,31 @@ class Display:
         if rotation not in {0, 90, 180, 270}:
             raise ValueError("Rotation must be 0/90/180/270")
         self._rotation = rotation
+        if threading:
+            self._lock = threading.RLock()
         self.init()
 
+    def __enter__(self) -> "Display":
+        """Hold the display, so that several drawing operations go out
+        without other threads drawing in between. Each drawing method already
+        holds it while it runs."""
+        if self._lock is not None:
+            self._lock.acquire()
+            self._holder = threading.get_ident()
+            self._holds += 1
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._lock is not None:
+            self._holds -= 1
+            if not self._holds:
+                self._holder = None
+            self._lock.release()
+
+    def _held(self) -> bool:
+        """Return whether the current thread holds the display."""
+        return self._holder is not None and self._holder == threading.get_ident()
+
     def write(self, command: Optional[int] = None, data: Optional[ByteString] = None) -> None:
         """Abstract method"""
         raise NotImplementedError()
@@ -154,14 +248,117 @@ class Display:
         self, x0: int, y0: int, x1: int, y1: int, data: Optional[ByteString] = None
     ) -> Optional[ByteString]:
         """Read or write a block of data."""
-        self.write(self._COLUMN_SET, self._encode_pos(x0 + self._X_START, x1 + self._X_START))
-        self.write(self._PAGE_SET, self._encode_pos(y0 + self._Y_START, y1 + self._Y_START))
-        if data is None:
-            size = struct.calcsize(self._DECODE_PIXEL)
-            return self.read(self._RAM_READ, (x1 - x0 + 1) * (y1 - y0 + 1) * size)
-        self.write(self._RAM_WRITE, data)
+        with self:
+            self.write(self._COLUMN_SET, self._encode_pos(x0 + self._X_START, x1 + self._X_START))
+            self.write(self._PAGE_SET, self._encode_pos(y0 + self._Y_START, y1 + self._Y_START))
+            if data is None:
+                size = struct.calcsize(self._DECODE_PIXEL)
+                count = (x1 - x0 + 1) * (y1 - y0 + 1) * size
+                return memoryview(self.read(self._RAM_READ, self._READ_DUMMY + count))[self._READ_DUMMY :]
+            self.write(self._RAM_WRITE, data)
+            if self._shadow is not None and len(data) == (x1 - x0 + 1) * (y1 - y0 + 1) * 2:
+                self._shadow[y0 : y1 + 1, x0 : x1 + 1] = numpy.frombuffer(data, dtype=">u2").reshape(
+                    y1 - y0 + 1, x1 - x0 + 1
+                )
         return None
 
+    @property
+    def shadow(self) -> Any:
+        """A copy of the display memory as a 2D array of 565 colors, kept up
+        to date by the drawing methods, or None unless enabled with
+        :meth:`enable_shadow`"""
+        return self._shadow
+
+    def _require_565(self, what: str) -> None:
+        """Raise ValueError unless the display takes 16-bit 565 pixels, like
+        SSD1331 panels set to 8-bit color don't."""
+        if len(self._encode_pixel(0)) != 2:
+            raise ValueError(what + " requires 16-bit pixels")
+
+    def enable_shadow(self, enabled: bool = True) -> None:
+        """Keep a copy of the display memory, so that blending images doesn't
+        need to read the display. The copy starts out black, so enable it
+        before drawing. Requires NumPy and 16-bit pixels."""
+        if not enabled:
+            self._shadow = None
+            return
+        if not numpy:
+            raise RuntimeError("The shadow framebuffer requires NumPy")
+        self._require_565("The shadow framebuffer")
+        self._shadow = numpy.zeros((self.height, self.width), dtype=">u2")
+
+    def enable_image_cache(
+        self, enabled: bool = True, *, stripe_height: int = 16, resend: bool = True
+    ) -> None:
+        """Remember the last image drawn by :meth:`image` as horizontal
+        stripes, each with a CRC32 of its pixels and its encoded bytes. When
+        the next image is drawn at the same place and size, stripes with the
+        same checksum are not converted again. The image is hashed every
+        time, so images changed in place are still noticed.
+
+        :param bool enabled: whether to keep the cache
+        :param int stripe_height: the number of lines of the rotated image
+            in each stripe, rounded up to a multiple of 4 so that dithered
+            stripes line up with the dither pattern
+        :param bool resend: whether to send unchanged stripes as well. Only
+            turn this off when nothing else draws where the images go, as the
+            cache can't tell.
+        """
+        self._stripe_height = -(-stripe_height // 4) * 4 if enabled else 0
+        self._stripe_resend = resend
+        self._stripe_key: Optional[tuple] = None
+        self._stripes: List[Tuple[int, ByteString]] = []
+
+    def _image_cached(self, img: Image, x: int, y: int, scale: int) -> None:
+        """Draw an already rotated image, converting only the stripes that
+        changed since the last image drawn at the same place."""
+        width, height = img.size
+        key = (x, y, width, height, scale, img.mode, self._stripe_height)
+        if key != self._stripe_key:
+            self._stripe_key = key
+            self._stripes = []
+        raw = img.tobytes()  # type: ignore[attr-defined]
+        stride = len(raw) // height
+        stripes = self._stripes
+        checksums = []
+        runs: List[List[int]] = []
+        for index, top in enumerate(range(0, height, self._stripe_height)):
+            bottom = min(top + self._stripe_height, height)
+            checksums.append(crc32(raw[top * stride : bottom * stride]))
+            if index < len(stripes) and stripes[index][0] == checksums[index]:
+                continue
+            if runs and runs[-1][1] == top:
+                runs[-1][1] = bottom
+            else:
+                runs.append([top, bottom])
+        # Stripes that were never converted can't match any checksum
+        stripes.extend([(-1, b"")] * (len(checksums) - len(stripes)))
+        # Convert each run of changed stripes at once, then split it. The
+        # checksum is only stored with the converted stripe, so a stripe
+        # that failed to convert is converted again next time.
+        for top, bottom in runs:
+            data = self._encode_image(img.crop((0, top, width, bottom)))  # type: ignore[attr-defined]
+            line = len(data) // (bottom - top)
+            for start in range(top, bottom, self._stripe_height):
+                end = min(start + self._stripe_height, bottom)
+                index = start // self._stripe_height
+                stripes[index] = (checksums[index], data[(start - top) * line : (end - top) * line])
+        if self._stripe_resend:
+            runs = [[0, height]]
+        for top, bottom in runs:
+            first, last = top // self._stripe_height, (bottom - 1) // self._stripe_height
+            data = b"".join(stripe for _, stripe in stripes[first : last + 1])
+            if scale > 1:
+                data = _expand(data, width, bottom - top, scale)
+            self._block(x, y + top * scale, x + width * scale - 1, y + bottom * scale - 1, data)
+
+    def _shadow_fill(self, x: int, y: int, width: int, height: int, color: Union[int, Tuple]) -> None:
+        """Fill a rectangle of the shadow framebuffer, if enabled."""
+        if self._shadow is not None:
+            self._shadow[y : y + height, x : x + width] = (
+                color565(color) if isinstance(color, (tuple, list)) else color
+            )
+
     def _encode_pos(self, x: int, y: int) -> bytes:
         """Encode a position into bytes."""
         return struct.pack(self._ENCODE_POS, x, y)
@@ -189,32 +386,123 @@ class Display:
         rotation: Optional[int] = None,
         x: int = 0,
         y: int = 0,
+        scale: int = 1,
+        blend: bool = False,
     ) -> None:
         """Set buffer to value of Python Imaging Library image. The image should
         be in 1 bit mode and a size not exceeding the display size when drawn at
-        the supplied origin."""
+        the supplied origin.
+
+        With a ``scale`` above 1 each pixel of the image is drawn as a square of
+        ``scale`` by ``scale`` pixels, so an image rendered at half or quarter
+        resolution fills the display for a fraction of the drawing and
+        conversion time.
+
+        With ``blend`` an RGBA image is composited over what the display
+        shows, taken from the :attr:`shadow` framebuffer when enabled and read
+        back from the display otherwise. Only the part of the image that isn't
+        fully transparent is sent. Blending requires 16-bit pixels.
+
+        See :meth:`enable_image_cache` to skip converting the parts of an
+        image that are the same as last time."""
         if rotation is None:
             rotation = self.rotation
         if not img.mode in {"RGB", "RGBA"}:
             raise ValueError("Image must be in mode RGB or RGBA")
         if rotation not in {0, 90, 180, 270}:
             raise ValueError("Rotation must be 0/90/180/270")
+        if scale < 1:
+            raise ValueError("Scale must be at least 1")
         if rotation != 0:
             img = img.rotate(rotation, expand=True)
         imwidth, imheight = img.size
-        if x + imwidth > self.width or y + imheight > self.height:
+        if x + imwidth * scale > self.width or y + imheight * scale > self.height:
             raise ValueError(f"Image must not exceed dimensions of display ({self.width}x{self.height}).")
-        if numpy:
-            pixels = bytes(image_to_data(img))
+        if blend and img.mode == "RGBA":
+            self._require_565("Blending")
+            if scale > 1:
+                img = img.resize((imwidth * scale, imheight * scale), 0)  # type: ignore[attr-defined]  # nearest
+            box = img.getchannel("A").getbbox()  # type: ignore[attr-defined]
+            if box is None:
+                return
+            x, y = x + box[0], y + box[1]
+            img = img.crop(box)  # type: ignore[attr-defined]
+            width, height = img.size
+            # Nothing may draw between reading the background and writing
+            with self:
+                data = self._encode_image(self._blend(img, x, y))
+                self._block(x, y, x + width - 1, y + height - 1, data)
+            return
+        if self._stripe_height:
+            # The cache and the blocks sent from it change together
+            with self:
+                self._image_cached(img, x, y, scale)
+            return
+        data = self._encode_image(img)
+        if scale > 1:
+            data = _expand(data, imwidth, imheight, scale)
+        self._block(x, y, x + imwidth * scale - 1, y + imheight * scale - 1, data)
+
+    def _blend(self, img: Image, x: int, y: int) -> Image:
+        """Composite an RGBA image over the display content at its position
+        and return the RGB result."""
+        width, height = img.size
+        background = img.convert("RGB")  # type: ignore[call-arg]
+        if self._shadow is not None:
+            pixels = self._shadow[y : y + height, x : x + width].astype("uint16")
+            red, green, blue = (pixels >> 11) & 0x1F, (pixels >> 5) & 0x3F, pixels & 0x1F
+            background.frombytes(
+                numpy.dstack(
+                    ((red << 3) | (red >> 2), (green << 2) | (green >> 4), (blue << 3) | (blue >> 2))
+                )
+                .astype("uint8")
+                .tobytes()
+            )
+        elif self._RAM_READ is not None:
+            background.frombytes(bytes(self._block(x, y, x + width - 1, y + height - 1)))  # type: ignore[arg-type]
         else:
-            # Slower but doesn't require numpy
-            pixels = bytearray(imwidth * imheight * 2)
-            for i in range(imwidth):
-                for j in range(imheight):
-                    pix = color565(img.getpixel((i, j)))
-                    pixels[2 * (j * imwidth + i)] = pix >> 8
-                    pixels[2 * (j * imwidth + i) + 1] = pix & 0xFF
-        self._block(x, y, x + imwidth - 1, y + imheight - 1, pixels)
+            raise ValueError("Display can't be read back, enable the shadow framebuffer to blend")
+        background.paste(img, (0, 0), img)
+        return background
+
+    def _encode_image(self, img: Image) -> ByteString:  # noqa: PLR6301
+        """Encode an already rotated image into pixel bytes."""
+        if numpy:
+            return bytes(image_to_data(img))
+        # Slower but doesn't require numpy
+        imwidth, imheight = img.size
+        pixels = bytearray(imwidth * imheight * 2)
+        for i in range(imwidth):
+            for j in range(imheight):
+                pix = color565(img.getpixel((i, j)))
+                pixels[2 * (j * imwidth + i)] = pix >> 8
+                pixels[2 * (j * imwidth + i) + 1] = pix & 0xFF
+        return pixels
+
+    def draw_asset(self, asset: Asset, x: int = 0, y: int = 0) -> None:
+        """Draw an :class:`~adafruit_rgb_display.asset.Asset`, sending its
+        pixels as they are stored. Transparent pixels leave the display as it
+        is. The display must take 16-bit 565 pixels."""
+        self._require_565("Drawing assets")
+        if x + asset.width > self.width or y + asset.height > self.height:
+            raise ValueError(f"Asset must not exceed dimensions of display ({self.width}x{self.height}).")
+        with self:
+            if asset.keyed:
+                for dx, dy, pixels in asset.spans():
+                    self._block(x + dx, y + dy, x + dx + len(pixels) // 2 - 1, y + dy, pixels)
+                return
+            self._block(x, y, x + asset.width - 1, y + asset.height - 1, b"")
+            if asset.flags:
+                for _, _, pixels in asset.spans():
+                    self.write(None, pixels)
+            else:
+                for chunk in asset.chunks():
+                    self.write(None, chunk)
+            if self._shadow is not None:
+                for dx, dy, pixels in asset.spans():
+                    self._shadow[y + dy, x + dx : x + dx + len(pixels) // 2] = numpy.frombuffer(
+                        pixels, dtype=">u2"
+                    )
 
     def fill_rectangle(self, x: int, y: int, width: int, height: int, color: Union[int, Tuple]) -> None:
         """Draw a rectangle at specified position with specified width and
@@ -223,14 +511,16 @@ class Display:
         y = min(self.height - 1, max(0, y))
         width = min(self.width - x, max(1, width))
         height = min(self.height - y, max(1, height))
-        self._block(x, y, x + width - 1, y + height - 1, b"")
         chunks, rest = divmod(width * height, _BUFFER_SIZE)
         pixel = self._encode_pixel(color)
-        if chunks:
-            data = pixel * _BUFFER_SIZE
-            for _ in range(chunks):
-                self.write(None, data)
-        self.write(None, pixel * rest)
+        with self:
+            self._shadow_fill(x, y, width, height, color)
+            self._block(x, y, x + width - 1, y + height - 1, b"")
+            if chunks:
+                data = pixel * _BUFFER_SIZE
+                for _ in range(chunks):
+                    self.write(None, data)
+            self.write(None, pixel * rest)
 
     def fill(self, color: Union[int, Tuple] = 0) -> None:
         """Fill the whole display with the specified color."""
@@ -256,8 +546,131 @@ class Display:
         self._rotation = val
 
 
+class VerticalScroll(Display):
+    """Mixin for controllers with hardware vertical scrolling, using the
+    vertical scrolling definition (0x33) and start address (0x37) commands.
+
+    Scrolling moves the lines between the fixed top and bottom areas set with
+    :meth:`scroll_area`. Use :meth:`scrolled` to find where to draw content
+    that should show up at a given line, for example to redraw only the lines
+    exposed by the last scroll.
+    """
+
+    _VSCRDEF = 0x33
+    _VSCRSADD = 0x37
+    # Number of lines in the frame memory of the controller
+    _SCROLL_LINES = 320
+    # Set when the gate lines run along the x axis, e.g. rows and columns exchanged
+    _SCROLL_ALONG_X = False
+    _scroll = 0
+    _scroll_area: Optional[Tuple[int, int]] = None
+
+    def _scroll_extent(self) -> Tuple[int, int]:
+        """Return the number of lines and the line offset of the display."""
+        if self._SCROLL_ALONG_X:
+            return self.width, self._X_START
+        return self.height, self._Y_START
+
+    def scroll_area(self, top: int = 0, bottom: int = 0) -> None:
+        """Set up the scrolling area, keeping ``top`` lines at the top and
+        ``bottom`` lines at the bottom of the display fixed. This resets the
+        scroll offset."""
+        lines, offset = self._scroll_extent()
+        height = lines - top - bottom
+        if top < 0 or bottom < 0 or height < 1:
+            raise ValueError("Fixed areas must leave lines to scroll")
+        with self:
+            self.write(
+                self._VSCRDEF,
+                struct.pack(">HHH", offset + top, height, self._SCROLL_LINES - offset - top - height),
+            )
+            self.write(self._VSCRSADD, struct.pack(">H", offset + top))
+        self._scroll_area = (top, height)
+        self._scroll = 0
+
+    def scroll(self, dy: Optional[int] = None) -> Optional[int]:
+        """Scroll the display by delta y, or return the current scroll offset
+        when no delta is given. The whole display scrolls unless
+        :meth:`scroll_area` was called first."""
+        if dy is None:
+            return self._scroll
+        if self._scroll_area is None:
+            self.scroll_area()
+        top, height = self._scroll_area  # type: ignore[misc]
+        self._scroll = (self._scroll + dy) % height
+        self.write(self._VSCRSADD, struct.pack(">H", self._scroll_extent()[1] + top + self._scroll))
+        return None
+
+    def scrolled(self, y: int) -> int:
+        """Return the line to draw at for content to show up at line ``y`` of
+        the display with the current scroll offset. Lines in the fixed areas
+        are returned unchanged."""
+        if self._scroll_area is None:
+            return y
+        top, height = self._scroll_area
+        if top <= y < top + height:
+            return top + (y - top + self._scroll) % height
+        return y
+
+
+class _ExclusiveDevice:
+    """Stands in for the :class:`~adafruit_bus_device.spi_device.SPIDevice`
+    of a display that has the bus to itself: the bus is locked and
+    configured once, and chip select stays asserted until :meth:`release`."""
+
+    def __init__(
+        self,
+        spi: busio.SPI,
+        chip_select: digitalio.DigitalInOut,
+        *,
+        baudrate: int,
+        polarity: int,
+        phase: int,
+    ) -> None:
+        self.spi = spi
+        self.chip_select = chip_select
+        self.baudrate = baudrate
+        self.polarity = polarity
+        self.phase = phase
+        while not spi.try_lock():
+            time.sleep(0)
+        spi.configure(baudrate=baudrate, polarity=polarity, phase=phase)
+        chip_select.switch_to_output(value=False)
+        self._held = True
+
+    def __enter__(self) -> busio.SPI:
+        if not self._held:
+            raise RuntimeError("The display was deinitialized")
+        return self.spi
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+    def release(self) -> None:
+        """Deassert chip select and unlock the bus."""
+        if self._held:
+            self.chip_select.value = True
+            self.spi.unlock()
+            self._held = False
+
+
 class DisplaySPI(Display):
-    """Base class for SPI type devices"""
+    """Base class for SPI type devices
+
+    With ``exclusive`` the display keeps the bus to itself: the bus is locked
+    and configured once and chip select stays asserted, instead of for every
+    transfer, which makes small writes such as :meth:`pixel` much cheaper.
+    Writes then go straight to the bus without taking any lock, so the
+    display must be drawn on from one thread only. No other device may use
+    the bus until :meth:`deinit`.
+    """
+
+    arbiter: Optional[BusArbiter] = None
+    """The arbiter of the shared bus, see :meth:`share_bus`"""
+    priority = 0
+    chunk_size = 4096
+    # The bus, while the display holds it exclusively
+    _spi: Optional[busio.SPI] = None
 
     def __init__(
         self,
@@ -274,8 +687,12 @@ class DisplaySPI(Display):
         x_offset: int = 0,
         y_offset: int = 0,
         rotation: int = 0,
+        exclusive: bool = False,
     ):
-        self.spi_device = spi_device.SPIDevice(spi, cs, baudrate=baudrate, polarity=polarity, phase=phase)
+        if exclusive:
+            self.spi_device = _ExclusiveDevice(spi, cs, baudrate=baudrate, polarity=polarity, phase=phase)
+        else:
+            self.spi_device = spi_device.SPIDevice(spi, cs, baudrate=baudrate, polarity=polarity, phase=phase)
         self.dc_pin = dc
         self.rst = rst
         self.dc_pin.switch_to_output(value=0)
@@ -284,7 +701,12 @@ class DisplaySPI(Display):
             self.reset()
         self._X_START = x_offset
         self._Y_START = y_offset
+        if exclusive:
+            self._spi = spi
         super().__init__(width, height, rotation)
+        if exclusive:
+            # Drawn on from one thread, so there is nothing to lock
+            self._lock = None
 
     def reset(self) -> None:
         """Reset the device"""
@@ -295,24 +717,97 @@ class DisplaySPI(Display):
         self.rst.value = 1
         time.sleep(0.050)  # 50 milliseconds
 
-    def write(self, command: Optional[int] = None, data: Optional[ByteString] = None) -> None:
-        """SPI write to the device: commands and data"""
-        if command is not None:
-            self.dc_pin.value = 0
+    def deinit(self) -> None:
+        """Release the bus if the display holds it exclusively."""
+        if isinstance(self.spi_device, _ExclusiveDevice):
+            self._spi = None
+            self.spi_device.release()
+
+    def share_bus(
+        self, arbiter: Optional[BusArbiter] = None, *, priority: int = 0, chunk_size: int = 4096
+    ) -> None:
+        """Take turns with other devices on the bus through a
+        :class:`~adafruit_rgb_display.arbiter.BusArbiter`. Each drawing
+        operation then holds the bus from its window commands to its last
+        pixel, and pixel data goes out in chunks between which devices with
+        a higher priority may use the bus. Requires threads.
+
+        The display is always taken before the bus: drawing while holding
+        the bus, but not the display, raises :class:`RuntimeError`. To draw
+        with a claim on the bus, hold the display first with ``with display:``.
+
+        :param arbiter: the arbiter, by default the one of the display's bus
+        :param int priority: the priority of the display on the bus
+        :param int chunk_size: the most bytes to send without letting others
+            in, which bounds how long they wait
+        """
+        if isinstance(self.spi_device, _ExclusiveDevice):
+            raise ValueError("The display holds the bus exclusively")
+        if arbiter is None:
+            from adafruit_rgb_display.arbiter import BusArbiter  # noqa: PLC0415
+
+            arbiter = BusArbiter.for_bus(self.spi_device.spi)
+        self.arbiter = arbiter
+        self.priority = priority
+        self.chunk_size = chunk_size
+
+    def __enter__(self) -> "DisplaySPI":
+        # The display is always taken before the bus. Taking them the other
+        # way around could deadlock with a thread drawing on this display,
+        # which holds the display while waiting for the bus.
+        if self.arbiter is not None and self.arbiter.held and not self._held():
+            raise RuntimeError("Take the display before the bus, not while holding the bus")
+        super().__enter__()
+        if self.arbiter is not None:
+            self.arbiter.acquire(self.priority)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self.arbiter is not None:
+            self.arbiter.release()
+        super().__exit__(*exc)
+
+    def _write_data(self, data: ByteString) -> None:
+        """Send pixel data, in chunks with chances for others to use the bus
+        in between when sharing it."""
+        if self.arbiter is None or len(data) <= self.chunk_size:
             with self.spi_device as spi:
-                spi.write(bytearray([command]))
-        if data is not None:
-            self.dc_pin.value = 1
+                spi.write(data)
+            return
+        for start in range(0, len(data), self.chunk_size):
+            if start and self.arbiter.checkpoint():
+                self.dc_pin.value = 1
             with self.spi_device as spi:
+                spi.write(data, start=start, end=min(start + self.chunk_size, len(data)))
+
+    def write(self, command: Optional[int] = None, data: Optional[ByteString] = None) -> None:
+        """SPI write to the device: commands and data"""
+        spi = self._spi
+        if spi is not None:
+            if command is not None:
+                self.dc_pin.value = 0
+                spi.write(bytes((command,)))
+            if data is not None:
+                self.dc_pin.value = 1
                 spi.write(data)
+            return
+        with self:
+            if command is not None:
+                self.dc_pin.value = 0
+                with self.spi_device as spi:
+                    spi.write(bytearray([command]))
+            if data is not None:
+                self.dc_pin.value = 1
+                self._write_data(data)
 
     def read(self, command: Optional[int] = None, count: int = 0) -> ByteString:
         """SPI read from device with optional command"""
         data = bytearray(count)
-        self.dc_pin.value = 0
-        with self.spi_device as spi:
-            if command is not None:
-                spi.write(bytearray([command]))
-            if count:
-                spi.readinto(data)
+        with self:
+            self.dc_pin.value = 0
+            with self.spi_device as spi:
+                if command is not None:
+                    spi.write(bytearray([command]))
+                if count:
+                    spi.readinto(data)
         return data
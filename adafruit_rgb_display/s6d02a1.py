@@ -77,6 +77,8 @@ class S6D02A1(DisplaySPI):
         width: int = 128,
         height: int = 160,
         rotation: int = 0,
+        *,
+        exclusive: bool = False,
     ):
         super().__init__(
             spi=spi,
@@ -86,4 +88,5 @@ class S6D02A1(DisplaySPI):
             width=width,
             height=height,
             rotation=rotation,
+            exclusive=exclusive,
         )
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.scaler`
+====================================================
+
+Scale RGB pixels between two fixed sizes and convert them to 565 in one pass,
+with the sampling computed only once. Requires NumPy.
+
+* Author(s): Adafruit Industries
+"""
+
+import numpy
+
+try:
+    from typing import Any, List, Tuple
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+
+class Scaler:
+    """Scales RGB pixels of one size to another and converts them to big
+    endian 565, ready to send to a display. The source lines and columns used
+    for each result pixel are computed once, so each call only gathers or
+    sums pixels. The result is written into the same buffer on every call.
+
+    .. code-block:: python
+
+      scaler = Scaler((1280, 720), (320, 240), "box", rotation=90)
+      display._block(0, 0, 239, 319, scaler.scale(pixels).tobytes())
+
+    :param tuple src_size: the width and height of the source
+    :param tuple dst_size: the width and height of the result, before rotation
+    :param str mode: ``"nearest"`` to take the nearest source pixel, or
+        ``"box"`` to average the source pixels covered by each result pixel
+        when scaling down
+    :param int rotation: the rotation to apply to the result, like
+        :meth:`Display.image() <adafruit_rgb_display.rgb.Display.image>`
+    """
+
+    def __init__(
+        self,
+        src_size: Tuple[int, int],
+        dst_size: Tuple[int, int],
+        mode: str = "nearest",
+        *,
+        rotation: int = 0,
+    ) -> None:
+        if mode not in {"nearest", "box"}:
+            raise ValueError("Mode must be nearest or box")
+        if rotation not in {0, 90, 180, 270}:
+            raise ValueError("Rotation must be 0/90/180/270")
+        self.src_size = src_size
+        self.dst_size = dst_size
+        self.mode = mode
+        self.rotation = rotation
+        (src_width, src_height), (dst_width, dst_height) = src_size, dst_size
+        # The source lines sampled for each result line, one array per sample
+        self._rows = self._sampling(src_height, dst_height)
+        self._columns = self._sampling(src_width, dst_width)
+        self._samples = len(self._rows) * len(self._columns)
+        self._sums = "uint16" if self._samples * 255 <= 0xFFFF else "uint32"
+        self._channels = numpy.empty((dst_height, dst_width, 3), dtype=self._sums)
+        self._result = numpy.empty((dst_height, dst_width), dtype="uint16")
+        if rotation % 180 == 90:
+            dst_width, dst_height = dst_height, dst_width
+        self._output = numpy.empty((dst_height, dst_width), dtype=">u2")
+
+    def _sampling(self, src: int, dst: int) -> List[numpy.ndarray]:
+        """Return the source lines to sample for each result line of an axis.
+        Scaling down in box mode samples as many lines as the widest box,
+        spread evenly over each box."""
+        if self.mode == "box" and dst < src:
+            starts = numpy.arange(dst) * src // dst
+            counts = numpy.diff(numpy.append(starts, src))
+            samples = int(counts.max())
+            return [starts + sample * counts // samples for sample in range(samples)]
+        # Step from the center of the first pixel like Pillow does, so that
+        # centers falling on a pixel edge round the same way
+        steps = numpy.full(dst, src / dst)
+        steps[0] /= 2
+        return [numpy.cumsum(steps).astype("intp")]
+
+    def scale(self, pixels: Any) -> numpy.ndarray:
+        """Scale and convert RGB pixels.
+
+        :param pixels: an array of shape ``(height, width, 3)`` or more
+            channels, or a PIL image
+        :return: the 565 pixels, in a buffer reused by the next call
+        """
+        if hasattr(pixels, "convert"):
+            pixels = numpy.asarray(pixels.convert("RGB"))
+        pixels = pixels[:, :, :3]
+        rows = numpy.take(pixels, self._rows[0], axis=0).astype(self._sums)
+        for lines in self._rows[1:]:
+            rows += numpy.take(pixels, lines, axis=0)
+        channels = self._channels
+        numpy.take(rows, self._columns[0], axis=1, out=channels)
+        for lines in self._columns[1:]:
+            channels += numpy.take(rows, lines, axis=1)
+        if self._samples > 1:
+            channels //= self._samples
+        result = self._result
+        numpy.left_shift(channels[:, :, 0] & 0xF8, 8, out=result, casting="unsafe")
+        result |= (channels[:, :, 1] & 0xFC) << 3
+        result |= channels[:, :, 2] >> 3
+        self._output[:] = numpy.rot90(result, self.rotation // 90)
+        return self._output
@@ -0,0 +1,411 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.scene`
+====================================================
+
+A retained scene of nodes that remembers which areas of the display changed,
+and redraws only those, merged into as few blocks as pays off. Works on
+CircuitPython.
+
+* Author(s): Adafruit Industries
+"""
+
+from adafruit_rgb_display.rgb import Display
+
+try:
+    from typing import Iterable, List, Optional, Tuple
+
+    from adafruit_rgb_display.asset import Asset
+
+    Rect = Tuple[int, int, int, int]
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+# Estimated cost of starting a block, in bytes of pixels that could be sent in
+# the same time: the window commands and the bus transactions around them
+_BLOCK_OVERHEAD = 64
+# Rectangles kept before one that it is tried against in coalesce
+_NEIGHBOURS = 8
+
+
+def _intersect(first: Rect, second: Rect) -> Optional[Rect]:
+    """Return the intersection of two rectangles, or None if they don't meet."""
+    x0, y0 = max(first[0], second[0]), max(first[1], second[1])
+    x1, y1 = min(first[2], second[2]), min(first[3], second[3])
+    if x0 > x1 or y0 > y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def coalesce(rects: Iterable[Rect], overhead: int = _BLOCK_OVERHEAD, pixel_size: int = 2) -> List[Rect]:
+    """Merge rectangles into fewer, larger ones wherever sending the bounding
+    box costs no more than sending both. Each block costs ``overhead`` plus
+    the bytes of its pixels. The rectangles are taken from the top down and
+    each is merged with the last few kept before it, so the time grows with
+    the number of rectangles rather than its cube. When sending the bounding
+    box of all of them costs less, it is sent instead.
+
+    :param rects: the rectangles, each as ``(x0, y0, x1, y1)`` with inclusive corners
+    :param int overhead: the cost of a block in bytes
+    :param int pixel_size: the number of bytes per pixel
+    :return: the merged rectangles
+    """
+
+    def cost(rect: Rect) -> int:
+        return overhead + (rect[2] - rect[0] + 1) * (rect[3] - rect[1] + 1) * pixel_size
+
+    merged: List[Rect] = []
+    for current in sorted(rects, key=lambda rect: (rect[1], rect[0])):
+        rect = current
+        index = len(merged) - 1
+        while index >= max(0, len(merged) - _NEIGHBOURS):
+            other = merged[index]
+            union = (
+                min(rect[0], other[0]),
+                min(rect[1], other[1]),
+                max(rect[2], other[2]),
+                max(rect[3], other[3]),
+            )
+            if cost(union) <= cost(rect) + cost(other):
+                # The larger rectangle may now pay off with ones passed over
+                del merged[index]
+                rect = union
+                index = len(merged) - 1
+            else:
+                index -= 1
+        merged.append(rect)
+    if len(merged) > 1:
+        bounds = (
+            min(rect[0] for rect in merged),
+            min(rect[1] for rect in merged),
+            max(rect[2] for rect in merged),
+            max(rect[3] for rect in merged),
+        )
+        if cost(bounds) <= sum(cost(rect) for rect in merged):
+            return [bounds]
+    return merged
+
+
+class Canvas:
+    """Encoded pixels of a rectangle of the display, that nodes draw into
+    using display coordinates. Drawing outside of the canvas is cut off.
+
+    :param tuple rect: the rectangle of the display, as ``(x0, y0, x1, y1)``
+    :param bytes background: the encoded pixel to start out with
+    """
+
+    def __init__(self, rect: Rect, background: bytes) -> None:
+        self.rect = rect
+        self.width = rect[2] - rect[0] + 1
+        self.height = rect[3] - rect[1] + 1
+        self.pixel_size = len(background)
+        self.buffer = bytearray(background * (self.width * self.height))
+
+    def fill(self, x: int, y: int, width: int, height: int, pixel: bytes) -> None:
+        """Fill a rectangle with an encoded pixel."""
+        area = _intersect(self.rect, (x, y, x + width - 1, y + height - 1))
+        if area is None:
+            return
+        x0, y0, x1, y1 = area
+        line = pixel * (x1 - x0 + 1)
+        size = self.pixel_size
+        for row in range(y0 - self.rect[1], y1 - self.rect[1] + 1):
+            start = (row * self.width + x0 - self.rect[0]) * size
+            self.buffer[start : start + len(line)] = line
+
+    def blit(self, x: int, y: int, pixels: bytes) -> None:
+        """Copy a line of encoded pixels starting at a position."""
+        count = len(pixels) // self.pixel_size
+        if not self.rect[1] <= y <= self.rect[3]:
+            return
+        x0, x1 = max(x, self.rect[0]), min(x + count - 1, self.rect[2])
+        if x0 > x1:
+            return
+        size = self.pixel_size
+        start = ((y - self.rect[1]) * self.width + x0 - self.rect[0]) * size
+        self.buffer[start : start + (x1 - x0 + 1) * size] = pixels[(x0 - x) * size : (x1 - x + 1) * size]
+
+
+class Node:
+    """Something drawn in a :class:`Scene`, covering a rectangle of the
+    display. Changing its position, size, depth or visibility marks the
+    areas it left and entered to be redrawn. Subclasses draw themselves in
+    :meth:`draw` and call :meth:`invalidate` when their content changes.
+
+    :param int x: left edge
+    :param int y: top edge
+    :param int width: width in pixels
+    :param int height: height in pixels
+    :param int z: depth, nodes with higher values are drawn over lower ones
+    :param bool visible: whether to draw the node
+    """
+
+    def __init__(self, x: int, y: int, width: int, height: int, *, z: int = 0, visible: bool = True) -> None:
+        self._scene: Optional[Scene] = None
+        self._x = x
+        self._y = y
+        self._width = width
+        self._height = height
+        self._z = z
+        self._visible = visible
+
+    @property
+    def bounds(self) -> Rect:
+        """The rectangle covered by the node, as ``(x0, y0, x1, y1)``"""
+        return self._x, self._y, self._x + self._width - 1, self._y + self._height - 1
+
+    def _change(self, name: str, value: object) -> None:
+        """Set an attribute, redrawing where the node was and now is."""
+        if getattr(self, name) == value:
+            return
+        self.invalidate()
+        setattr(self, name, value)
+        self.invalidate()
+
+    @property
+    def x(self) -> int:
+        """Left edge"""
+        return self._x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self._change("_x", value)
+
+    @property
+    def y(self) -> int:
+        """Top edge"""
+        return self._y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self._change("_y", value)
+
+    @property
+    def width(self) -> int:
+        """Width in pixels"""
+        return self._width
+
+    @width.setter
+    def width(self, value: int) -> None:
+        self._change("_width", value)
+
+    @property
+    def height(self) -> int:
+        """Height in pixels"""
+        return self._height
+
+    @height.setter
+    def height(self, value: int) -> None:
+        self._change("_height", value)
+
+    @property
+    def z(self) -> int:
+        """Depth, nodes with higher values are drawn over lower ones"""
+        return self._z
+
+    @z.setter
+    def z(self, value: int) -> None:
+        self._change("_z", value)
+        if self._scene is not None:
+            self._scene._sort()
+
+    @property
+    def visible(self) -> bool:
+        """Whether to draw the node"""
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        if self._visible != value:
+            if self._scene is not None:
+                self._scene.damage(*self.bounds)
+            self._visible = value
+
+    def invalidate(self) -> None:
+        """Mark the node to be redrawn on the next flush."""
+        if self._scene is not None and self._visible:
+            self._scene.damage(*self.bounds)
+
+    def draw(self, canvas: Canvas) -> None:
+        """Draw the node into a canvas. The canvas may cover only part of it."""
+        raise NotImplementedError()
+
+
+class Fill(Node):
+    """A rectangle filled with a color.
+
+    :param int color: the 565 color
+    """
+
+    def __init__(
+        self, x: int, y: int, width: int, height: int, color: int, *, z: int = 0, visible: bool = True
+    ) -> None:
+        super().__init__(x, y, width, height, z=z, visible=visible)
+        self._color = color
+        self._pixel = b""
+
+    @property
+    def color(self) -> int:
+        """The 565 color"""
+        return self._color
+
+    @color.setter
+    def color(self, value: int) -> None:
+        if self._color != value:
+            self._color = value
+            self._pixel = b""
+            self.invalidate()
+
+    def draw(self, canvas: Canvas) -> None:
+        if not self._pixel:
+            self._pixel = self._scene.display._encode_pixel(self._color)  # type: ignore[union-attr]
+        canvas.fill(self._x, self._y, self._width, self._height, self._pixel)
+
+
+class Bitmap(Node):
+    """Encoded pixels, ready to send to the display, for example rendered
+    text or an :class:`~adafruit_rgb_display.asset.Asset`. Only the spans
+    given are drawn, so that the rest of the rectangle shows what is below.
+
+    :param int x: left edge
+    :param int y: top edge
+    :param int width: width in pixels
+    :param int height: height in pixels
+    :param spans: the lines of opaque pixels, as their horizontal offset,
+        vertical offset and encoded pixels
+    """
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        spans: Iterable[Tuple[int, int, bytes]],
+        *,
+        z: int = 0,
+        visible: bool = True,
+    ) -> None:
+        super().__init__(x, y, width, height, z=z, visible=visible)
+        self._spans = list(spans)
+
+    @classmethod
+    def from_pixels(cls, x: int, y: int, width: int, height: int, pixels: bytes) -> "Bitmap":
+        """Make an opaque bitmap from encoded pixels, one line after another,
+        such as from :meth:`TextRenderer.render()
+        <adafruit_rgb_display.text.TextRenderer.render>`."""
+        size = len(pixels) // height
+        spans = [(0, row, bytes(pixels[row * size : (row + 1) * size])) for row in range(height)]
+        return cls(x, y, width, height, spans)
+
+    @classmethod
+    def from_asset(cls, asset: Asset, x: int = 0, y: int = 0) -> "Bitmap":
+        """Make a bitmap from an asset, leaving out its transparent pixels."""
+        spans = [(dx, dy, bytes(pixels)) for dx, dy, pixels in asset.spans()]
+        return cls(x, y, asset.width, asset.height, spans)
+
+    @property
+    def spans(self) -> List[Tuple[int, int, bytes]]:
+        """The lines of opaque pixels. Assign new spans to change the content."""
+        return self._spans
+
+    @spans.setter
+    def spans(self, value: Iterable[Tuple[int, int, bytes]]) -> None:
+        self._spans = list(value)
+        self.invalidate()
+
+    def draw(self, canvas: Canvas) -> None:
+        top, bottom = canvas.rect[1] - self._y, canvas.rect[3] - self._y
+        for dx, dy, pixels in self._spans:
+            if top <= dy <= bottom:
+                canvas.blit(self._x + dx, self._y + dy, pixels)
+
+
+class Scene:
+    """Nodes drawn over a background color. Changes to the nodes add up as
+    damaged rectangles until :meth:`flush`, which merges them with
+    :func:`coalesce` and sends each merged rectangle as one block, drawn
+    only by the nodes that meet it.
+
+    .. code-block:: python
+
+      scene = Scene(display)
+      button = scene.add(Fill(10, 10, 100, 40, 0x001F))
+      scene.flush()
+      button.color = 0xF800
+      scene.flush()
+
+    :param Display display: the display to draw on
+    :param int background: the 565 color where no node is drawn
+    :param int overhead: the cost of sending a block, in bytes of pixels
+    """
+
+    def __init__(self, display: Display, background: int = 0, *, overhead: int = _BLOCK_OVERHEAD) -> None:
+        self.display = display
+        self.background = background
+        self.overhead = overhead
+        self.nodes: List[Node] = []
+        """The nodes, from the bottom one to the top one"""
+        self._damage: List[Rect] = [(0, 0, display.width - 1, display.height - 1)]
+
+    def add(self, node: Node) -> Node:
+        """Add a node over the others with the same depth, and return it."""
+        if node._scene is not None:
+            raise ValueError("Node is already in a scene")
+        node._scene = self
+        self.nodes.append(node)
+        self._sort()
+        node.invalidate()
+        return node
+
+    def remove(self, node: Node) -> None:
+        """Remove a node, uncovering what was below it on the next flush."""
+        node.invalidate()
+        self.nodes.remove(node)
+        node._scene = None
+
+    def damage(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        """Redraw a rectangle on the next flush."""
+        rect = _intersect((x0, y0, x1, y1), (0, 0, self.display.width - 1, self.display.height - 1))
+        if rect is not None:
+            self._damage.append(rect)
+
+    def take_damage(self) -> List[Rect]:
+        """Return the damaged rectangles and forget them, to send them some
+        other way than :meth:`flush`, such as with a
+        :class:`~adafruit_rgb_display.scheduler.RegionScheduler`."""
+        damage, self._damage = self._damage, []
+        return damage
+
+    def _sort(self) -> None:
+        self.nodes.sort(key=lambda node: node.z)
+
+    def flush(self) -> int:
+        """Redraw the damaged parts of the display.
+
+        :return: the number of blocks sent
+        """
+        if not self._damage:
+            return 0
+        rects = coalesce(self._damage, self.overhead, len(self.display._encode_pixel(self.background)))
+        self._damage = []
+        # Other threads can't draw between the parts of one update
+        with self.display:
+            for rect in rects:
+                self.display._block(*rect, self.render(rect))
+        return len(rects)
+
+    def render(self, rect: Rect) -> bytearray:
+        """Return the encoded pixels of a rectangle of the display, as
+        ``(x0, y0, x1, y1)``, drawn by the nodes that meet it."""
+        canvas = Canvas(rect, self.display._encode_pixel(self.background))
+        for node in self.nodes:
+            if node.visible and _intersect(rect, node.bounds) is not None:
+                node.draw(canvas)
+        return canvas.buffer
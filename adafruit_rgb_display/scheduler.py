@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.scheduler`
+====================================================
+
+Frame pacing against absolute deadlines, for anything that shows frames for a
+given time: animations, video or dashboards, and spreading updates of
+damaged regions over frames within a budget of bytes.
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+from adafruit_rgb_display.scene import _BLOCK_OVERHEAD, coalesce
+
+try:
+    from typing import Callable, List, Optional, Tuple
+
+    from adafruit_rgb_display.rgb import Display
+
+    Rect = Tuple[int, int, int, int]
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+
+class FrameScheduler:
+    """Paces frames so that each one starts when the frames before it have
+    run for their durations, measured from the first frame. Time spent
+    drawing a frame counts towards its duration, and waiting sleeps instead
+    of spinning. When drawing falls behind, frames whose time is already over
+    are dropped so playback keeps to the wall clock.
+
+    .. code-block:: python
+
+      scheduler = FrameScheduler()
+      for frame in frames:
+          if scheduler.next(frame.duration):
+              draw(frame)
+          scheduler.wait()
+
+    :param bool drop: whether to drop frames whose time is already over
+    """
+
+    def __init__(self, *, drop: bool = True) -> None:
+        self.drop = drop
+        self.late = 0.0
+        """How late the last frame started, in seconds"""
+        self.dropped = 0
+        """The number of frames dropped since the last reset"""
+        self._deadline: Optional[float] = None
+
+    def reset(self) -> None:
+        """Start over, the next frame starts right away."""
+        self._deadline = None
+        self.late = 0.0
+        self.dropped = 0
+
+    def next(self, duration: float) -> bool:
+        """Schedule the next frame, to be shown for ``duration`` seconds.
+
+        :return: False if the frame should be dropped, True to show it
+        """
+        now = time.monotonic()
+        if self._deadline is None:
+            self._deadline = now
+        start = self._deadline
+        self._deadline += duration
+        self.late = max(0.0, now - start)
+        if self.drop and duration > 0 and now >= self._deadline:
+            self.dropped += 1
+            return False
+        return True
+
+    def remaining(self) -> float:
+        """Return the time left until the current frame ends, in seconds.
+        Negative when running late."""
+        if self._deadline is None:
+            return 0.0
+        return self._deadline - time.monotonic()
+
+    def wait(self) -> None:
+        """Sleep until the current frame ends."""
+        delay = self.remaining()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        """Sleep until the current frame ends, letting other tasks run."""
+        import asyncio  # noqa: PLC0415
+
+        await asyncio.sleep(max(0.0, self.remaining()))
+
+
+def _contains(outer: Rect, inner: Rect) -> bool:
+    return outer[0] <= inner[0] and outer[1] <= inner[1] and inner[2] <= outer[2] and inner[3] <= outer[3]
+
+
+class RegionScheduler:
+    """Sends damaged regions of the display a little at a time, keeping each
+    :meth:`tick` within a budget of bytes so that a large update can't hold
+    up input for long. Regions with a higher priority, such as the focused
+    widget or a cursor, are sent first. Regions that have to wait are merged
+    with each other, and regions larger than what is left of the budget are
+    sent a band of lines at a time.
+
+    Without a fixed ``budget``, the budget is what the bus sends in
+    ``time_budget`` seconds. That starts from the baudrate of the display
+    and follows the throughput measured while sending, drawing included.
+
+    .. code-block:: python
+
+      updates = RegionScheduler(display, scene.render, time_budget=0.015)
+      frames = FrameScheduler()
+      while True:
+          frames.next(1 / 30)
+          updates.damage(*cursor.bounds, priority=1)
+          for rect in scene.take_damage():
+              updates.damage(*rect)
+          updates.tick()
+          frames.wait()
+
+    :param Display display: the display to draw on
+    :param render: a function returning the encoded pixels of a rectangle,
+        given as ``(x0, y0, x1, y1)``, such as
+        :meth:`Scene.render() <adafruit_rgb_display.scene.Scene.render>`
+    :param int budget: the bytes to send per tick
+    :param float time_budget: the time to spend sending per tick, in seconds,
+        when no ``budget`` is given
+    :param int overhead: the cost of sending a block, in bytes of pixels
+    """
+
+    def __init__(
+        self,
+        display: Display,
+        render: Callable[[Rect], bytes],
+        *,
+        budget: Optional[int] = None,
+        time_budget: float = 0.01,
+        overhead: int = _BLOCK_OVERHEAD,
+    ) -> None:
+        self.display = display
+        self.render = render
+        self.budget = budget
+        self.time_budget = time_budget
+        self.overhead = overhead
+        baudrate = getattr(getattr(display, "spi_device", None), "baudrate", 0)
+        self.throughput = baudrate / 8 if baudrate else 1000000.0
+        """The bytes sent per second, as measured"""
+        self._pixel_size = len(display._encode_pixel(0))
+        # The regions to send, as [rect, priority, ticks waited]
+        self._pending: List[list] = []
+
+    @property
+    def pending(self) -> int:
+        """The number of regions waiting to be sent"""
+        return len(self._pending)
+
+    def damage(self, x0: int, y0: int, x1: int, y1: int, priority: int = 0) -> None:
+        """Send a rectangle on one of the next ticks.
+
+        :param int priority: regions with higher priorities are sent first
+        """
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, self.display.width - 1), min(y1, self.display.height - 1)
+        if x0 > x1 or y0 > y1:
+            return
+        rect = (x0, y0, x1, y1)
+        for entry in self._pending:
+            if _contains(entry[0], rect):
+                entry[1] = max(entry[1], priority)
+                return
+        self._pending.append([rect, priority, 0])
+
+    def _merge(self) -> None:
+        """Merge the regions that have waited, where that saves bytes."""
+        waiting = [entry for entry in self._pending if entry[2]]
+        if len(waiting) < 2:
+            return
+        merged = []
+        for rect in coalesce([entry[0] for entry in waiting], self.overhead, self._pixel_size):
+            inside = [entry for entry in waiting if _contains(rect, entry[0])]
+            merged.append([rect, max(entry[1] for entry in inside), max(entry[2] for entry in inside)])
+        self._pending = merged + [entry for entry in self._pending if not entry[2]]
+
+    def tick(self) -> int:
+        """Send the waiting regions that fit in the budget, highest priority
+        and longest waiting first. At least some of a region is always sent,
+        so that every region gets through eventually.
+
+        :return: the bytes sent, counting ``overhead`` for each block
+        """
+        if not self._pending:
+            return 0
+        budget = self.budget if self.budget is not None else int(self.throughput * self.time_budget)
+        self._merge()
+        self._pending.sort(key=lambda entry: (-entry[1], -entry[2]))
+        start = time.monotonic()
+        sent = 0
+        left = []
+        for entry in self._pending:
+            x0, y0, x1, y1 = entry[0]
+            line = (x1 - x0 + 1) * self._pixel_size
+            lines = min(y1 - y0 + 1, (budget - sent - self.overhead) // line)
+            if lines < 1:
+                if sent:
+                    left.append(entry)
+                    continue
+                lines = 1
+            band = (x0, y0, x1, y0 + lines - 1)
+            self.display._block(*band, self.render(band))
+            sent += self.overhead + lines * line
+            if y0 + lines <= y1:
+                entry[0] = (x0, y0 + lines, x1, y1)
+                left.append(entry)
+        elapsed = time.monotonic() - start
+        if elapsed > 0:
+            self.throughput = 0.75 * self.throughput + 0.25 * sent / elapsed
+        for entry in left:
+            entry[2] += 1
+        self._pending = left
+        return sent
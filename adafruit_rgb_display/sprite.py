@@ -0,0 +1,272 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.sprite`
+====================================================
+
+Sprites with transparent pixels over a background kept in memory, sending only
+the areas that sprites left or moved into. Requires NumPy.
+
+* Author(s): Adafruit Industries
+"""
+
+import numpy
+
+from adafruit_rgb_display.asset import Asset
+from adafruit_rgb_display.rgb import Display, color565
+
+try:
+    from typing import List, Optional, Tuple, Union
+
+    from circuitpython_typing.pil import Image
+
+    Rect = Tuple[int, int, int, int]
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+
+def _intersect(first: Rect, second: Rect) -> Optional[Rect]:
+    """Return the intersection of two rectangles, or None if they don't meet."""
+    x0, y0 = max(first[0], second[0]), max(first[1], second[1])
+    x1, y1 = min(first[2], second[2]), min(first[3], second[3])
+    if x0 > x1 or y0 > y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def _merge(rects: List[Rect]) -> List[Rect]:
+    """Replace rectangles that overlap by their bounding box, until none
+    overlap."""
+    merged: List[Rect] = []
+    for candidate in rects:
+        rect = candidate
+        index = 0
+        while index < len(merged):
+            other = merged[index]
+            if _intersect(rect, other) is None:
+                index += 1
+                continue
+            rect = (
+                min(rect[0], other[0]),
+                min(rect[1], other[1]),
+                max(rect[2], other[2]),
+                max(rect[3], other[3]),
+            )
+            del merged[index]
+            # The larger rectangle may now overlap ones checked before
+            index = 0
+        merged.append(rect)
+    return merged
+
+
+class Sprite:
+    """An image with transparent pixels, drawn by a :class:`SpriteLayer`.
+    Move it by changing :attr:`x` and :attr:`y`, or animate it by assigning
+    other pixels, then call :meth:`SpriteLayer.update`. The pixels must be in
+    the orientation of the display.
+
+    :param pixels: a 2D array of 565 colors
+    :param mask: a 2D array of the same shape, true where the sprite is
+        opaque. Defaults to an opaque sprite.
+    :param int x: left edge of the sprite on the display
+    :param int y: top edge of the sprite on the display
+    :param bool visible: whether to draw the sprite
+    """
+
+    def __init__(
+        self,
+        pixels: numpy.ndarray,
+        mask: Optional[numpy.ndarray] = None,
+        *,
+        x: int = 0,
+        y: int = 0,
+        visible: bool = True,
+    ) -> None:
+        self.pixels = numpy.asarray(pixels, dtype=">u2")
+        self.mask = None if mask is None else numpy.asarray(mask, dtype=bool)
+        if self.mask is not None and self.mask.shape != self.pixels.shape:
+            raise ValueError("Mask must have the shape of the pixels")
+        self.x = x
+        self.y = y
+        self.visible = visible
+        # The state of the sprite when last drawn, and where it was drawn
+        self._drawn: Optional[tuple] = None
+        self._rect: Optional[Rect] = None
+
+    @classmethod
+    def from_image(
+        cls,
+        image: Image,
+        *,
+        key: Optional[Union[int, Tuple[int, int, int]]] = None,
+        rotation: int = 0,
+        x: int = 0,
+        y: int = 0,
+    ) -> "Sprite":
+        """Make a sprite from a PIL image. Pixels that are mostly transparent,
+        or that have the color ``key``, are left out.
+
+        :param image: the PIL image
+        :param key: the color of transparent pixels, as a 565 integer or an RGB tuple
+        :param int rotation: the rotation of the display, applied like
+            :meth:`Display.image() <adafruit_rgb_display.rgb.Display.image>`
+        :param int x: left edge of the sprite on the display
+        :param int y: top edge of the sprite on the display
+        """
+        if rotation not in {0, 90, 180, 270}:
+            raise ValueError("Rotation must be 0/90/180/270")
+        rgba = image.convert("RGBA")  # type: ignore[call-arg]
+        if rotation:
+            rgba = rgba.rotate(rotation, expand=True)
+        data = numpy.asarray(rgba).astype("uint16")
+        pixels = ((data[:, :, 0] & 0xF8) << 8) | ((data[:, :, 1] & 0xFC) << 3) | (data[:, :, 2] >> 3)
+        if isinstance(key, tuple):
+            key = color565(key)
+        mask = data[:, :, 3] >= 128
+        if key is not None:
+            mask &= pixels != key
+        return cls(pixels, None if mask.all() else mask, x=x, y=y)
+
+    @classmethod
+    def from_asset(cls, asset: Asset, *, x: int = 0, y: int = 0) -> "Sprite":
+        """Make a sprite from an :class:`~adafruit_rgb_display.asset.Asset`,
+        with the transparent pixels of keyed assets left out.
+
+        :param Asset asset: the asset
+        :param int x: left edge of the sprite on the display
+        :param int y: top edge of the sprite on the display
+        """
+        pixels = numpy.zeros((asset.height, asset.width), dtype=">u2")
+        mask = numpy.zeros(pixels.shape, dtype=bool)
+        for dx, dy, data in asset.spans():
+            span = numpy.frombuffer(data, dtype=">u2")
+            pixels[dy, dx : dx + len(span)] = span
+            mask[dy, dx : dx + len(span)] = True
+        return cls(pixels, mask if asset.keyed else None, x=x, y=y)
+
+    @property
+    def width(self) -> int:
+        """The width of the sprite in pixels"""
+        return self.pixels.shape[1]
+
+    @property
+    def height(self) -> int:
+        """The height of the sprite in pixels"""
+        return self.pixels.shape[0]
+
+    def _state(self) -> tuple:
+        """Return what decides how the sprite is drawn."""
+        return self.x, self.y, self.visible, self.pixels, self.mask
+
+    def _changed(self) -> bool:
+        """Return whether the sprite changed since it was last drawn."""
+        drawn = self._drawn
+        return (
+            drawn is None
+            or drawn[:3] != (self.x, self.y, self.visible)
+            or drawn[3] is not self.pixels
+            or drawn[4] is not self.mask
+        )
+
+
+class SpriteLayer:
+    """Draws sprites over a background. Each :meth:`update` sends only the
+    areas where sprites changed: where they were drawn before and where they
+    are now, with overlapping areas sent as one block. The display must take
+    16-bit 565 pixels.
+
+    .. code-block:: python
+
+      layer = SpriteLayer(display, background)
+      ball = layer.add(Sprite.from_image(Image.open("ball.png")))
+      while True:
+          ball.x += 1
+          layer.update()
+
+    :param Display display: the display to draw on
+    :param background: the background, as a 565 color or a 2D array of 565
+        colors the size of the display
+    """
+
+    def __init__(self, display: Display, background: Union[int, numpy.ndarray] = 0) -> None:
+        display._require_565("The sprite layer")
+        self.display = display
+        shape = (display.height, display.width)
+        if isinstance(background, int):
+            self.background = numpy.full(shape, background, dtype=">u2")
+        else:
+            self.background = numpy.array(background, dtype=">u2")
+        if self.background.shape != shape:
+            raise ValueError("Background must have the size of the display")
+        self.sprites: List[Sprite] = []
+        """The sprites, from the bottom one to the top one"""
+        self._damage: List[Rect] = [(0, 0, display.width - 1, display.height - 1)]
+
+    def add(self, sprite: Sprite) -> Sprite:
+        """Add a sprite on top of the others, and return it."""
+        self.sprites.append(sprite)
+        sprite._drawn = sprite._rect = None
+        return sprite
+
+    def remove(self, sprite: Sprite) -> None:
+        """Remove a sprite, uncovering what was under it on the next update."""
+        self.sprites.remove(sprite)
+        if sprite._rect is not None:
+            self._damage.append(sprite._rect)
+        sprite._drawn = sprite._rect = None
+
+    def damage(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        """Send a rectangle again on the next update, for example after
+        changing the pixels of a sprite or the background in place."""
+        self._damage.append((x0, y0, x1, y1))
+
+    def update(self) -> int:
+        """Send the areas where sprites changed since the last update.
+
+        :return: the number of blocks sent
+        """
+        screen = (0, 0, self.display.width - 1, self.display.height - 1)
+        rects = self._damage
+        self._damage = []
+        for sprite in self.sprites:
+            if not sprite._changed():
+                continue
+            if sprite._rect is not None:
+                rects.append(sprite._rect)
+            rect = None
+            if sprite.visible:
+                rect = _intersect(
+                    screen, (sprite.x, sprite.y, sprite.x + sprite.width - 1, sprite.y + sprite.height - 1)
+                )
+            if rect is not None:
+                rects.append(rect)
+            sprite._drawn, sprite._rect = sprite._state(), rect
+        rects = [rect for rect in (_intersect(screen, rect) for rect in rects) if rect is not None]
+        merged = _merge(rects)
+        for rect in merged:
+            self._send(rect)
+        return len(merged)
+
+    def _send(self, rect: Rect) -> None:
+        """Composite the sprites over the background in a rectangle and send it."""
+        x0, y0, x1, y1 = rect
+        frame = self.background[y0 : y1 + 1, x0 : x1 + 1].copy()
+        for sprite in self.sprites:
+            if sprite._rect is None:
+                continue
+            overlap = _intersect(rect, sprite._rect)
+            if overlap is None:
+                continue
+            ox0, oy0, ox1, oy1 = overlap
+            target = frame[oy0 - y0 : oy1 - y0 + 1, ox0 - x0 : ox1 - x0 + 1]
+            source = (slice(oy0 - sprite.y, oy1 - sprite.y + 1), slice(ox0 - sprite.x, ox1 - sprite.x + 1))
+            if sprite.mask is None:
+                target[:] = sprite.pixels[source]
+            else:
+                numpy.copyto(target, sprite.pixels[source], where=sprite.mask[source])
+        self.display._block(x0, y0, x1, y1, frame.tobytes())
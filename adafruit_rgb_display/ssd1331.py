@@ -12,15 +12,18 @@ A simple driver for the SSD1331-based displays.
 * Author(s): Radomir Dopieralski, Michael McWethy, Matt Land
 """
 
+import time
+
 from micropython import const
 
-from adafruit_rgb_display.rgb import DisplaySPI
+from adafruit_rgb_display.rgb import DisplaySPI, color565, image_to_data332
 
 try:
-    from typing import ByteString, Optional
+    from typing import ByteString, Optional, Tuple, Union
 
     import busio
     import digitalio
+    from circuitpython_typing.pil import Image
 except ImportError:
     pass
 
@@ -30,6 +33,8 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
 
 _DRAWLINE = const(0x21)
 _DRAWRECT = const(0x22)
+_COPY = const(0x23)
+_CLEARWINDOW = const(0x25)
 _FILL = const(0x26)
 _PHASEPERIOD = const(0x12)
 _SETCOLUMN = const(0x15)
@@ -59,6 +64,10 @@ _PRECHARGELEVEL = const(0xBB)
 _VCOMH = const(0xBE)
 _LOCK = const(0xFD)
 
+# Time in seconds the graphic acceleration engine needs to complete a command
+_DELAY_HWLINE = 0.001
+_DELAY_HWFILL = 0.003
+
 
 class SSD1331(DisplaySPI):
     """
@@ -79,6 +88,10 @@ class SSD1331(DisplaySPI):
       display.fill(0x7521)
       display.pixel(32, 32, 0)
 
+    Pass ``color_depth=8`` to run the display in 256 color (RGB332) mode, which
+    halves the data sent for pixels and images. Colors are still given in 565
+    format. Set ``dither`` to apply ordered dithering when converting images.
+
     """
 
     _COLUMN_SET = _SETCOLUMN
@@ -92,7 +105,7 @@ class SSD1331(DisplaySPI):
         (_STARTLINE, b"\x00"),
         (_DISPLAYOFFSET, b"\x00"),
         (_NORMALDISPLAY, b""),
-        # (_FILL, b'\x01'),
+        (_FILL, b"\x01"),  # Fill rectangles drawn by the acceleration engine
         (_PHASEPERIOD, b"\x31"),
         (_SETMULTIPLEX, b"\x3f"),
         (_SETMASTER, b"\x8e"),
@@ -126,7 +139,15 @@ class SSD1331(DisplaySPI):
         phase: int = 0,
         *,
         rotation: int = 0,
+        exclusive: bool = False,
+        color_depth: int = 16,
+        dither: bool = False,
     ) -> None:
+        if color_depth not in {8, 16}:
+            raise ValueError("Color depth must be 8 or 16")
+        self._color_depth = color_depth
+        self.dither = dither
+        self._busy_until = 0.0
         super().__init__(
             spi,
             dc,
@@ -138,13 +159,151 @@ class SSD1331(DisplaySPI):
             polarity=polarity,
             phase=phase,
             rotation=rotation,
+            exclusive=exclusive,
         )
 
+    def init(self) -> None:
+        super().init()
+        if self._color_depth == 8:
+            self.write(_SETREMAP, b"\x32")  # 256 Color
+
+    @property
+    def color_depth(self) -> int:
+        """The number of bits per pixel, 8 or 16"""
+        return self._color_depth
+
     def write(self, command: Optional[int] = None, data: Optional[ByteString] = None) -> None:
         """write procedure specific to SSD1331"""
-        self.dc_pin.value = command is None
-        with self.spi_device as spi:
+        spi = self._spi
+        if spi is not None:
+            self._wait()
+            self.dc_pin.value = command is None
             if command is not None:
-                spi.write(bytearray([command]))
+                spi.write(bytes((command,)))
             if data is not None:
                 spi.write(data)
+            return
+        with self:
+            self._wait()
+            self.dc_pin.value = command is None
+            if command is None:
+                if data is not None:
+                    self._write_data(data)
+                return
+            with self.spi_device as spi:
+                spi.write(bytearray([command]))
+                if data is not None:
+                    spi.write(data)
+
+    def _wait(self) -> None:
+        """Wait until the last graphic acceleration command has completed."""
+        delay = self._busy_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _accelerate(self, command: int, data: bytes, delay: float) -> None:
+        """Send a graphic acceleration command and note when it will be done."""
+        with self:
+            self.write(command, data)
+            self._busy_until = time.monotonic() + delay
+
+    def _clip(self, x: int, y: int, width: int, height: int) -> Tuple[int, int, int, int]:
+        """Clip a rectangle to the display and return its corners in controller
+        coordinates."""
+        x = min(self.width - 1, max(0, x))
+        y = min(self.height - 1, max(0, y))
+        width = min(self.width - x, max(1, width))
+        height = min(self.height - y, max(1, height))
+        x += self._X_START
+        y += self._Y_START
+        return x, y, x + width - 1, y + height - 1
+
+    @staticmethod
+    def _encode_color(color: Union[int, Tuple]) -> bytes:
+        """Encode a color into the three 6-bit components used by the
+        acceleration commands."""
+        if isinstance(color, (tuple, list)):
+            color = color565(color)
+        return bytes((((color >> 11) & 0x1F) << 1, (color >> 5) & 0x3F, (color & 0x1F) << 1))
+
+    def _encode_pixel(self, color: Union[int, Tuple]) -> bytes:
+        """Encode a pixel color into bytes."""
+        if self._color_depth == 16:
+            return super()._encode_pixel(color)
+        if isinstance(color, (tuple, list)):
+            color = color565(color)
+        return bytes((((color >> 8) & 0xE0) | ((color >> 6) & 0x1C) | ((color >> 3) & 0x03),))
+
+    def _encode_image(self, img: Image) -> ByteString:
+        """Encode an already rotated image into pixel bytes."""
+        if self._color_depth == 16:
+            return super()._encode_image(img)
+        return image_to_data332(img, self.dither)
+
+    def fill_rectangle(self, x: int, y: int, width: int, height: int, color: Union[int, Tuple]) -> None:
+        """Draw a rectangle at specified position with specified width and
+        height, and fill it with the specified color. The controller draws it
+        by itself, so only the corners and the color are sent."""
+        fill = self._encode_color(color)
+        x0, y0, x1, y1 = self._clip(x, y, width, height)
+        with self:
+            if any(fill):
+                self._accelerate(_DRAWRECT, bytes((x0, y0, x1, y1)) + fill + fill, _DELAY_HWFILL)
+            else:
+                self._accelerate(_CLEARWINDOW, bytes((x0, y0, x1, y1)), _DELAY_HWFILL)
+            self._shadow_fill(x0 - self._X_START, y0 - self._Y_START, x1 - x0 + 1, y1 - y0 + 1, color)
+
+    def hline(self, x: int, y: int, width: int, color: Union[int, Tuple]) -> None:
+        """Draw a horizontal line."""
+        x0, y0, x1, _ = self._clip(x, y, width, 1)
+        with self:
+            self._accelerate(_DRAWLINE, bytes((x0, y0, x1, y0)) + self._encode_color(color), _DELAY_HWLINE)
+            self._shadow_fill(x0 - self._X_START, y0 - self._Y_START, x1 - x0 + 1, 1, color)
+
+    def vline(self, x: int, y: int, height: int, color: Union[int, Tuple]) -> None:
+        """Draw a vertical line."""
+        x0, y0, _, y1 = self._clip(x, y, 1, height)
+        with self:
+            self._accelerate(_DRAWLINE, bytes((x0, y0, x0, y1)) + self._encode_color(color), _DELAY_HWLINE)
+            self._shadow_fill(x0 - self._X_START, y0 - self._Y_START, 1, y1 - y0 + 1, color)
+
+    def copy_rect(self, x: int, y: int, width: int, height: int, dest_x: int, dest_y: int) -> None:
+        """Copy a rectangle of the display contents to another position, for
+        example to scroll part of the screen. Parts that would come from or
+        go to outside of the display are cut off."""
+        # Cut off the same amount from the source and the destination
+        left = max(0, -x, -dest_x)
+        top = max(0, -y, -dest_y)
+        x, dest_x, width = x + left, dest_x + left, width - left
+        y, dest_y, height = y + top, dest_y + top, height - top
+        width = min(width, self.width - x, self.width - dest_x)
+        height = min(height, self.height - y, self.height - dest_y)
+        if width <= 0 or height <= 0:
+            return
+        dx, dy = dest_x - x, dest_y - y
+        with self:
+            if abs(dx) < width and abs(dy) < height and (dy > 0 or (not dy and dx > 0)):
+                # The controller copies line by line from the top left, so
+                # it would overwrite the source before reading it. Copy in
+                # pieces that don't overlap, from the far end back.
+                if dy:
+                    for start in reversed(range(0, height, dy)):
+                        size = min(dy, height - start)
+                        self._copy(x, y + start, width, size, dest_x, dest_y + start)
+                else:
+                    for start in reversed(range(0, width, dx)):
+                        size = min(dx, width - start)
+                        self._copy(x + start, y, size, height, dest_x + start, dest_y)
+            else:
+                self._copy(x, y, width, height, dest_x, dest_y)
+            if self._shadow is not None:
+                self._shadow[dest_y : dest_y + height, dest_x : dest_x + width] = self._shadow[
+                    y : y + height, x : x + width
+                ].copy()
+
+    def _copy(self, x: int, y: int, width: int, height: int, dest_x: int, dest_y: int) -> None:
+        """Copy a rectangle that lies within the display."""
+        x += self._X_START
+        y += self._Y_START
+        corners = (x, y, x + width - 1, y + height - 1, dest_x + self._X_START, dest_y + self._Y_START)
+        self._accelerate(_COPY, bytes(corners), _DELAY_HWFILL)
@@ -122,6 +122,7 @@ class SSD1351(DisplaySPI):
         x_offset: int = 0,
         y_offset: int = 0,
         rotation: int = 0,
+        exclusive: bool = False,
     ):
         super().__init__(
             spi,
@@ -136,4 +137,5 @@ class SSD1351(DisplaySPI):
             x_offset=x_offset,
             y_offset=y_offset,
             rotation=rotation,
+            exclusive=exclusive,
         )
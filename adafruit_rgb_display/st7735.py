@@ -16,7 +16,7 @@ import struct
 
 from micropython import const
 
-from adafruit_rgb_display.rgb import DisplaySPI
+from adafruit_rgb_display.rgb import DisplaySPI, VerticalScroll
 
 try:
     from typing import ByteString, Optional, Tuple, Union
@@ -76,7 +76,7 @@ _GMCTRP1 = const(0xE0)
 _GMCTRN1 = const(0xE1)
 
 
-class ST7735(DisplaySPI):
+class ST7735(VerticalScroll, DisplaySPI):
     """
     A simple driver for the ST7735-based displays.
 
@@ -96,6 +96,7 @@ class ST7735(DisplaySPI):
     _PAGE_SET = _RASET
     _RAM_WRITE = _RAMWR
     _RAM_READ = _RAMRD
+    _SCROLL_LINES = 162
     _INIT = (
         (_SWRESET, None),
         (_SLPOUT, None),
@@ -143,6 +144,7 @@ class ST7735(DisplaySPI):
         x_offset: int = 0,
         y_offset: int = 0,
         rotation: int = 0,
+        exclusive: bool = False,
     ) -> None:
         super().__init__(
             spi,
@@ -157,6 +159,7 @@ class ST7735(DisplaySPI):
             x_offset=x_offset,
             y_offset=y_offset,
             rotation=rotation,
+            exclusive=exclusive,
         )
 
 
@@ -204,6 +207,7 @@ class ST7735R(ST7735):
         x_offset: int = 0,
         y_offset: int = 0,
         rotation: int = 0,
+        exclusive: bool = False,
         bgr: bool = False,
         invert: bool = False,
     ) -> None:
@@ -222,6 +226,7 @@ class ST7735R(ST7735):
             x_offset=x_offset,
             y_offset=y_offset,
             rotation=rotation,
+            exclusive=exclusive,
         )
 
     def init(self) -> None:
@@ -245,6 +250,9 @@ class ST7735R(ST7735):
 class ST7735S(ST7735):
     """A simple driver for the ST7735S-based displays."""
 
+    # The init sequence exchanges rows and columns
+    _SCROLL_ALONG_X = True
+
     _INIT = (
         # Frame Rate
         (_FRMCTR1, b"\x01\x2c\x2d"),
@@ -293,6 +301,7 @@ class ST7735S(ST7735):
         x_offset: int = 2,
         y_offset: int = 1,
         rotation: int = 0,
+        exclusive: bool = False,
     ) -> None:
         self._bl = bl
         # Turn on backlight
@@ -310,4 +319,5 @@ class ST7735S(ST7735):
             x_offset=x_offset,
             y_offset=y_offset,
             rotation=rotation,
+            exclusive=exclusive,
         )
@@ -18,7 +18,7 @@ import busio
 import digitalio
 from micropython import const
 
-from adafruit_rgb_display.rgb import DisplaySPI
+from adafruit_rgb_display.rgb import DisplaySPI, VerticalScroll
 
 try:
     from typing import Optional
@@ -75,7 +75,7 @@ _GMCTRP1 = const(0xE0)
 _GMCTRN1 = const(0xE1)
 
 
-class ST7789(DisplaySPI):
+class ST7789(VerticalScroll, DisplaySPI):
     """
     A simple driver for the ST7789-based displays.
 
@@ -117,6 +117,7 @@ class ST7789(DisplaySPI):
         x_offset: int = 0,
         y_offset: int = 0,
         rotation: int = 0,
+        exclusive: bool = False,
     ) -> None:
         super().__init__(
             spi,
@@ -131,6 +132,7 @@ class ST7789(DisplaySPI):
             x_offset=x_offset,
             y_offset=y_offset,
             rotation=rotation,
+            exclusive=exclusive,
         )
 
     def init(self) -> None:
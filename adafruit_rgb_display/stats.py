@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.stats`
+====================================================
+
+A dashboard of system statistics on Linux, read straight from ``/proc`` and
+``/sys`` instead of running shell commands. Each line is read at its own
+interval and only the characters that changed are sent to the display.
+
+* Author(s): Adafruit Industries
+"""
+
+import os
+import socket
+import time
+
+from adafruit_rgb_display.text import Label, TextRenderer
+
+try:
+    from typing import Callable, List, Optional
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+
+def _read(path: str) -> str:
+    with open(path, encoding="ascii") as file:
+        return file.read()
+
+
+def ip_address() -> str:
+    """Return the address used for outgoing traffic, like ``hostname -I``.
+    No packet is sent to find it."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        try:
+            sock.connect(("10.255.255.255", 1))
+            address = sock.getsockname()[0]
+        except OSError:
+            address = ""
+    return "IP: " + address
+
+
+def cpu_load() -> str:
+    """Return the load average over the last minute."""
+    return "CPU Load: %.2f" % float(_read("/proc/loadavg").split()[0])
+
+
+def memory_usage() -> str:
+    """Return the memory in use, like ``free -m``."""
+    info = {}
+    for line in _read("/proc/meminfo").splitlines():
+        name, value = line.split(":", 1)
+        info[name] = int(value.split()[0])
+    total = info["MemTotal"]
+    used = total - info.get("MemAvailable", info["MemFree"])
+    return "Mem: %d/%d MB  %.2f%%" % (used // 1024, total // 1024, used * 100 / total)
+
+
+def disk_usage(path: str = "/") -> str:
+    """Return the space used on the filesystem of a path, like ``df -h``."""
+    stat = os.statvfs(path)
+    used = (stat.f_blocks - stat.f_bfree) * stat.f_frsize
+    available = stat.f_bavail * stat.f_frsize
+    total = stat.f_blocks * stat.f_frsize
+    percent = -(-used * 100 // (used + available)) if used + available else 0
+    return "Disk: %d/%d GB  %d%%" % (used >> 30, total >> 30, percent)
+
+
+def cpu_temperature(zone: int = 0) -> str:
+    """Return the temperature of a thermal zone, usually the CPU."""
+    try:
+        millidegrees = int(_read("/sys/class/thermal/thermal_zone%d/temp" % zone))
+    except OSError:
+        return "CPU Temp: -"
+    return "CPU Temp: %.1f C" % (millidegrees / 1000)
+
+
+class _Line:
+    def __init__(self, label: Label, read: Callable[[], str], interval: float) -> None:
+        self.label = label
+        self.read = read
+        self.interval = interval
+        self.due = 0.0
+
+
+class Dashboard:
+    """Lines of text below each other, each updated from a function at its
+    own interval. Values that stay the same send nothing; values that change
+    send only the characters that differ. Between updates :meth:`run`
+    sleeps until the next line is due.
+
+    .. code-block:: python
+
+      renderer = TextRenderer(display, load_font("DejaVuSans.ttf", 24), rotation=90)
+      dashboard = Dashboard(renderer)
+      dashboard.add(stats.ip_address, 30, color=0xFFFF)
+      dashboard.add(stats.cpu_load, 1, color=0xFFE0)
+      dashboard.add(stats.cpu_temperature, 2, color=0xF81F)
+      dashboard.run()
+
+    :param TextRenderer renderer: the renderer to draw with, which also sets
+        the rotation
+    :param int x: left edge of the lines
+    :param int y: top edge of the first line
+    :param int spacing: extra pixels between lines
+    :param int background: the background color in 565 format
+    """
+
+    def __init__(
+        self,
+        renderer: TextRenderer,
+        *,
+        x: int = 0,
+        y: int = 0,
+        spacing: int = 0,
+        background: int = 0,
+    ) -> None:
+        self.renderer = renderer
+        self.x = x
+        self.y = y
+        self.spacing = spacing
+        self.background = background
+        self._lines: List[_Line] = []
+
+    def add(self, read: Callable[[], str], interval: float = 1.0, *, color: int = 0xFFFF) -> Label:
+        """Add a line below the others, and return its label.
+
+        :param read: a function returning the text of the line
+        :param float interval: the time between reads, in seconds
+        :param int color: the text color in 565 format
+        """
+        y = self.y + len(self._lines) * (self.renderer.line_height + self.spacing)
+        label = Label(self.renderer, self.x, y, color=color, background=self.background)
+        self._lines.append(_Line(label, read, interval))
+        return label
+
+    def update(self) -> int:
+        """Read the lines that are due and draw what changed.
+
+        :return: the number of lines that changed
+        """
+        now = time.monotonic()
+        changed = 0
+        for line in self._lines:
+            if line.due > now:
+                continue
+            line.due = now + line.interval
+            text = line.read()
+            if text != line.label.text:
+                line.label.text = text
+                changed += 1
+        return changed
+
+    def _timeout(self) -> float:
+        """Return the time until the next line is due."""
+        if not self._lines:
+            return 1.0
+        return max(0.0, min(line.due for line in self._lines) - time.monotonic())
+
+    def run(self, stop: Optional[Callable[[], bool]] = None) -> None:
+        """Update the lines until stopped, sleeping in between.
+
+        :param stop: a function called after each update, return True from it
+            to stop
+        """
+        while True:
+            self.update()
+            if stop is not None and stop():
+                return
+            time.sleep(self._timeout())
@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.stripchart`
+====================================================
+
+A strip chart that plots each new sample by sending a single line of pixels to
+the display. Requires NumPy.
+
+* Author(s): Adafruit Industries
+"""
+
+import numpy
+
+from adafruit_rgb_display.rgb import Display, VerticalScroll
+
+try:
+    from typing import Optional, Sequence
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+_COLORS = (0x07E0, 0xF800, 0x07FF, 0xFFE0)
+
+# Palette indices of the parts of the chart, traces follow
+_BACKGROUND = 0
+_GRID = 1
+_TRACE = 2
+
+
+class StripChart:
+    """A strip chart of one or more traces on a part of a display.
+
+    Time advances along the ``axis`` of the display, ``"x"`` or ``"y"``, and
+    each sample is drawn as one line of pixels across it, with the maximum
+    value at the top or left edge. When the display can scroll along that
+    axis in hardware and the chart spans the display across it, the chart
+    scrolls and draws the new sample at the end. Otherwise it sweeps across
+    the chart like an oscilloscope, clearing the line ahead of the newest
+    sample.
+
+    :param Display display: the display to draw on
+    :param int traces: the number of values in each sample
+    :param int x: left edge of the chart
+    :param int y: top edge of the chart
+    :param int width: width of the chart, defaults to the rest of the display
+    :param int height: height of the chart, defaults to the rest of the display
+    :param str axis: the axis along which time advances. Defaults to the axis
+        the display scrolls along, or ``"x"``.
+    :param float minimum: the value plotted at the bottom or right edge
+    :param float maximum: the value plotted at the top or left edge
+    :param colors: the 565 color of each trace
+    :param int background: the background color
+    :param int grid: the color of the grid lines
+    :param int grid_spacing: the number of pixels between value grid lines, or 0 for none
+    :param int grid_interval: the number of samples between time grid lines, or 0 for none
+    """
+
+    def __init__(
+        self,
+        display: Display,
+        traces: int = 1,
+        *,
+        x: int = 0,
+        y: int = 0,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        axis: Optional[str] = None,
+        minimum: float = 0.0,
+        maximum: float = 1.0,
+        colors: Optional[Sequence[int]] = None,
+        background: int = 0,
+        grid: int = 0x4208,
+        grid_spacing: int = 0,
+        grid_interval: int = 0,
+    ) -> None:
+        scroll = isinstance(display, VerticalScroll)
+        if axis is None:
+            axis = "x" if not scroll or display._SCROLL_ALONG_X else "y"  # type: ignore[attr-defined]
+        if axis not in {"x", "y"}:
+            raise ValueError("Axis must be x or y")
+        if colors is None:
+            colors = [_COLORS[trace % len(_COLORS)] for trace in range(traces)]
+        if len(colors) != traces:
+            raise ValueError("Need one color per trace")
+        if maximum == minimum:
+            raise ValueError("Maximum must differ from minimum")
+        self.display = display
+        self.traces = traces
+        self.x = x
+        self.y = y
+        self.width = display.width - x if width is None else width
+        self.height = display.height - y if height is None else height
+        self.axis = axis
+        self.minimum = minimum
+        self.maximum = maximum
+        self.grid_interval = grid_interval
+        if axis == "x":
+            self.length, size = self.width, self.height
+            self._scrolling = (
+                scroll and display._SCROLL_ALONG_X and y == 0 and self.height == display.height  # type: ignore[attr-defined]
+            )
+        else:
+            self.length, size = self.height, self.width
+            self._scrolling = (
+                scroll and not display._SCROLL_ALONG_X and x == 0 and self.width == display.width  # type: ignore[attr-defined]
+            )
+        self._palette = numpy.frombuffer(
+            b"".join(display._encode_pixel(color) for color in (background, grid, *colors)),
+            dtype="uint8",
+        ).reshape(traces + 2, -1)
+        # Lines of palette indices drawn under the traces
+        self._template = numpy.full(size, _BACKGROUND, dtype="uint8")
+        if grid_spacing:
+            self._template[size - 1 :: -grid_spacing] = _GRID
+        self._grid_template = numpy.full(size, _GRID, dtype="uint8")
+        self._trace_colors = numpy.arange(_TRACE, _TRACE + traces, dtype="uint8")
+        self._samples = numpy.zeros((traces, self.length))
+        self._count = 0
+        self._cursor = 0
+        self._ticks = 0
+        self._previous: Optional[numpy.ndarray] = None
+        self.clear()
+
+    @property
+    def samples(self) -> numpy.ndarray:
+        """The samples on the chart, one row per trace, oldest first"""
+        start = self._cursor if self._count == self.length else 0
+        return numpy.roll(self._samples, -start, axis=1)[:, : self._count]
+
+    def clear(self) -> None:
+        """Remove all samples and clear the chart."""
+        self._count = 0
+        self._cursor = 0
+        self._ticks = 0
+        self._previous = None
+        if self._scrolling:
+            if self.axis == "x":
+                self.display.scroll_area(self.x, self.display.width - self.x - self.width)  # type: ignore[attr-defined]
+            else:
+                self.display.scroll_area(self.y, self.display.height - self.y - self.height)  # type: ignore[attr-defined]
+        self._write(0, numpy.tile(self._template, (self.length, 1)))
+
+    def add(self, *values: float) -> None:
+        """Add a sample with one value per trace and draw it."""
+        if len(values) != self.traces:
+            raise ValueError("Expected %d values" % self.traces)
+        self._samples[:, self._cursor] = values
+        self._cursor = (self._cursor + 1) % self.length
+        self._count = min(self._count + 1, self.length)
+        line = self._line(numpy.array(values, dtype="float"))
+        if self._scrolling:
+            self.display.scroll(1)  # type: ignore[attr-defined]
+            end = self.display.scrolled(self._start + self.length - 1)  # type: ignore[attr-defined]
+            self._write(end - self._start, line[None])
+        elif self._cursor:
+            # Clear the line ahead of the newest sample in the same block
+            self._write(self._cursor - 1, numpy.stack((line, self._template)))
+        else:
+            self._write(self.length - 1, line[None])
+
+    def redraw(self) -> None:
+        """Draw the whole chart again from the remembered samples."""
+        samples = self.samples
+        self.clear()
+        for sample in samples.T:
+            self.add(*sample)
+
+    @property
+    def _start(self) -> int:
+        """The first display line of the chart along the time axis."""
+        return self.x if self.axis == "x" else self.y
+
+    def _line(self, values: numpy.ndarray) -> numpy.ndarray:
+        """Return the palette indices of the line for a new sample, connecting
+        each trace to its previous value."""
+        size = len(self._template)
+        scale = (size - 1) / (self.maximum - self.minimum)
+        positions = numpy.clip(numpy.rint((self.maximum - values) * scale), 0, size - 1).astype("int")
+        previous = positions if self._previous is None else self._previous
+        self._previous = positions
+        self._ticks += 1
+        if self.grid_interval and self._ticks % self.grid_interval == 0:
+            line = self._grid_template.copy()
+        else:
+            line = self._template.copy()
+        for low, high, color in zip(
+            numpy.minimum(positions, previous), numpy.maximum(positions, previous), self._trace_colors
+        ):
+            line[low : high + 1] = color
+        return line
+
+    def _write(self, position: int, lines: numpy.ndarray) -> None:
+        """Send lines of palette indices to the display in one block, starting
+        at a position along the time axis of the chart."""
+        count, size = lines.shape
+        if self.axis == "x":
+            x0, y0, x1, y1 = self.x + position, self.y, self.x + position + count - 1, self.y + size - 1
+            lines = lines.T
+        else:
+            x0, y0, x1, y1 = self.x, self.y + position, self.x + size - 1, self.y + position + count - 1
+        self.display._block(x0, y0, x1, y1, self._palette[lines].tobytes())
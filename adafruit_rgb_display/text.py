@@ -0,0 +1,312 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.text`
+====================================================
+
+Draw text from a cache of glyphs already encoded for the display, without
+rendering or converting a whole image. Requires Pillow to render the font.
+
+* Author(s): Adafruit Industries
+"""
+
+from collections import OrderedDict
+from math import ceil
+
+from PIL import BdfFontFile, Image, ImageDraw, ImageFont
+
+from adafruit_rgb_display.rgb import Display
+
+try:
+    from typing import Dict, List, Optional, Tuple, Union
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+# Number of color pairs to keep the blended pixels of
+_SHADE_CACHE_SIZE = 16
+
+
+def load_font(path: str, size: int = 16) -> Union[ImageFont.ImageFont, ImageFont.FreeTypeFont]:
+    """Load a BDF bitmap font, a Pillow bitmap font or a TrueType/OpenType font.
+
+    :param str path: the font file
+    :param int size: the size of scalable fonts
+    """
+    if path.lower().endswith(".bdf"):
+        with open(path, "rb") as file:
+            return BdfFontFile.BdfFontFile(file).to_imagefont()
+    if path.lower().endswith(".pil"):
+        return ImageFont.load(path)
+    return ImageFont.truetype(path, size)
+
+
+class TextRenderer:
+    """Draws text with a font, rendering each character once per text and
+    background color and keeping the encoded glyphs in a cache. The least
+    recently used glyphs are dropped when the cache is full.
+
+    :param Display display: the display to draw on
+    :param font: a Pillow font, see :func:`load_font`. Defaults to Pillow's
+        default font.
+    :param int cell_width: the width of every character, for example to line
+        up text in columns. Defaults to the width of each character in the font.
+    :param int cache_size: the number of glyphs to keep
+    :param int rotation: the rotation of the text, like
+        :meth:`Display.image() <adafruit_rgb_display.rgb.Display.image>`.
+        Positions are then given on the rotated display, and glyphs are
+        cached already rotated.
+    """
+
+    def __init__(
+        self,
+        display: Display,
+        font: Optional[Union[ImageFont.ImageFont, ImageFont.FreeTypeFont]] = None,
+        *,
+        cell_width: Optional[int] = None,
+        cache_size: int = 512,
+        rotation: int = 0,
+    ) -> None:
+        if rotation not in {0, 90, 180, 270}:
+            raise ValueError("Rotation must be 0/90/180/270")
+        self.display = display
+        self.font = font if font is not None else ImageFont.load_default()
+        self.cell_width = cell_width
+        self.cache_size = cache_size
+        self.rotation = rotation
+        if hasattr(self.font, "getmetrics"):
+            ascent, descent = self.font.getmetrics()
+            self.line_height = ascent + descent
+        else:
+            self.line_height = self.font.getbbox("Ag|")[3]
+        self._pixel_size = len(display._encode_pixel(0))
+        self._glyphs: OrderedDict[Tuple[str, int, int], List[bytes]] = OrderedDict()
+        self._shades: OrderedDict[Tuple[int, int], List[bytes]] = OrderedDict()
+        self._widths: Dict[str, int] = {}
+
+    def char_width(self, char: str) -> int:
+        """Return the width of a character in pixels."""
+        if self.cell_width is not None:
+            return self.cell_width
+        width = self._widths.get(char)
+        if width is None:
+            width = max(1, ceil(self.font.getlength(char)))
+            self._widths[char] = width
+        return width
+
+    def width(self, text: str) -> int:
+        """Return the width of a text in pixels."""
+        return sum(self.char_width(char) for char in text)
+
+    def glyph(self, char: str, color: int = 0xFFFF, background: int = 0) -> List[bytes]:
+        """Return the encoded lines of pixels of a character, in the
+        orientation of the display.
+
+        :param str char: the character
+        :param int color: the text color in 565 format
+        :param int background: the background color in 565 format
+        """
+        key = (char, color, background)
+        glyph = self._glyphs.get(key)
+        if glyph is not None:
+            self._glyphs.move_to_end(key)
+            return glyph
+        width = self.char_width(char)
+        mask = Image.new("L", (width, self.line_height))
+        ImageDraw.Draw(mask).text((0, 0), char, font=self.font, fill=255)
+        shades = self._shade(color, background)
+        data = mask.tobytes()
+        glyph = [
+            b"".join(shades[value] for value in data[row * width : (row + 1) * width])
+            for row in range(self.line_height)
+        ]
+        if self.rotation:
+            glyph = self._rotate(glyph, width)
+        self._glyphs[key] = glyph
+        if len(self._glyphs) > self.cache_size:
+            self._glyphs.popitem(last=False)
+        return glyph
+
+    def _rotate(self, rows: List[bytes], width: int) -> List[bytes]:
+        """Rotate the lines of pixels of a glyph like :meth:`PIL.Image.Image.rotate`."""
+        size = self._pixel_size
+        pixels = [[row[column * size : (column + 1) * size] for column in range(width)] for row in rows]
+        if self.rotation == 180:
+            return [b"".join(reversed(row)) for row in reversed(pixels)]
+        if self.rotation == 90:
+            return [b"".join(row[column] for row in pixels) for column in reversed(range(width))]
+        return [b"".join(row[column] for row in reversed(pixels)) for column in range(width)]
+
+    def render(self, text: str, color: int = 0xFFFF, background: int = 0) -> bytes:
+        """Return the encoded pixels of a line of text, :meth:`width` pixels
+        wide and :attr:`line_height` pixels high before rotation, one line of
+        pixels after another, for example to copy into a canvas."""
+        glyphs = [self.glyph(char, color, background) for char in text]
+        if self.rotation % 180 == 90:
+            # The glyphs are stacked, with the first one at the bottom when turned left
+            if self.rotation == 90:
+                glyphs.reverse()
+            return b"".join(b"".join(glyph) for glyph in glyphs)
+        if self.rotation == 180:
+            glyphs.reverse()
+        return b"".join(b"".join(glyph[row] for glyph in glyphs) for row in range(self.line_height))
+
+    def _rect(self, x: int, y: int, width: int, height: int) -> Tuple[int, int, int, int]:
+        """Return where a rectangle of the rotated display is on the display,
+        as ``(x0, y0, x1, y1)``."""
+        right, bottom = self.display.width - 1, self.display.height - 1
+        if self.rotation == 90:
+            return y, bottom - x - width + 1, y + height - 1, bottom - x
+        if self.rotation == 180:
+            return right - x - width + 1, bottom - y - height + 1, right - x, bottom - y
+        if self.rotation == 270:
+            return right - y - height + 1, x, right - y, x + width - 1
+        return x, y, x + width - 1, y + height - 1
+
+    def _clip(self, rect: Tuple[int, int, int, int]) -> Optional[Tuple[int, int, int, int]]:
+        """Return the part of a rectangle on the display, or None if it is off
+        the display."""
+        x0, y0 = max(rect[0], 0), max(rect[1], 0)
+        x1, y1 = min(rect[2], self.display.width - 1), min(rect[3], self.display.height - 1)
+        if x0 > x1 or y0 > y1:
+            return None
+        return x0, y0, x1, y1
+
+    def fill(self, x: int, y: int, width: int, height: int, color: int) -> None:
+        """Fill a rectangle, positioned like text. What is off the display is
+        cut off."""
+        rect = self._clip(self._rect(x, y, width, height))
+        if rect is not None:
+            x0, y0, x1, y1 = rect
+            self.display.fill_rectangle(x0, y0, x1 - x0 + 1, y1 - y0 + 1, color)
+
+    def draw(self, text: str, x: int, y: int, color: int = 0xFFFF, background: int = 0) -> int:
+        """Draw a line of text on the display in a single block, cutting off
+        what is off the display.
+
+        :param str text: the text to draw
+        :param int x: left edge of the text
+        :param int y: top edge of the text
+        :param int color: the text color in 565 format
+        :param int background: the background color in 565 format
+        :return: the width of the text in pixels
+        """
+        if not text:
+            return 0
+        data = self.render(text, color, background)
+        width = len(data) // (self.line_height * self._pixel_size)
+        rect = self._rect(x, y, width, self.line_height)
+        visible = self._clip(rect)
+        if visible is None:
+            return width
+        if visible != rect:
+            # Cut the lines of pixels down to the part on the display
+            size = self._pixel_size
+            line = (rect[2] - rect[0] + 1) * size
+            start, end = (visible[0] - rect[0]) * size, (visible[2] - rect[0] + 1) * size
+            data = b"".join(
+                data[row * line + start : row * line + end]
+                for row in range(visible[1] - rect[1], visible[3] - rect[1] + 1)
+            )
+        self.display._block(*visible, data)
+        return width
+
+    def _shade(self, color: int, background: int) -> List[bytes]:
+        """Return the encoded pixels for all coverage values between the
+        background and the text color."""
+        key = (color, background)
+        shades = self._shades.get(key)
+        if shades is not None:
+            self._shades.move_to_end(key)
+            return shades
+        shades = []
+        for alpha in range(256):
+            mixed = 0
+            for mask in (0xF800, 0x07E0, 0x001F):
+                mixed |= ((color & mask) * alpha + (background & mask) * (255 - alpha)) // 255 & mask
+            shades.append(self.display._encode_pixel(mixed))
+        self._shades[key] = shades
+        if len(self._shades) > _SHADE_CACHE_SIZE:
+            self._shades.popitem(last=False)
+        return shades
+
+
+class Label:
+    """A line of text at a fixed position that only sends the characters
+    that changed when the text changes, such as a numeric readout.
+
+    .. code-block:: python
+
+      renderer = TextRenderer(display, load_font("DejaVuSans.ttf", 24))
+      temperature = Label(renderer, 0, 0, color=0xFFE0)
+      while True:
+          temperature.text = "CPU Temp: %.1f C" % read_temperature()
+
+    :param TextRenderer renderer: the renderer to draw with
+    :param int x: left edge of the text
+    :param int y: top edge of the text
+    :param str text: the initial text
+    :param int color: the text color in 565 format
+    :param int background: the background color in 565 format
+    """
+
+    def __init__(
+        self,
+        renderer: TextRenderer,
+        x: int,
+        y: int,
+        text: str = "",
+        *,
+        color: int = 0xFFFF,
+        background: int = 0,
+    ) -> None:
+        self.renderer = renderer
+        self.x = x
+        self.y = y
+        self.color = color
+        self.background = background
+        self._text = ""
+        self._drawn: Optional[Tuple[int, int]] = None
+        self.text = text
+
+    @property
+    def text(self) -> str:
+        """The text shown. Setting it draws the characters that changed and
+        clears what is left of longer text."""
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        renderer = self.renderer
+        old = self._text if self._drawn == (self.color, self.background) else ""
+        old_width = renderer.width(self._text)
+        # Draw runs of characters that differ or moved
+        position = old_position = start_position = 0
+        start = None
+        for index, char in enumerate(text):
+            same = index < len(old) and old[index] == char and old_position == position
+            if not same and start is None:
+                start, start_position = index, position
+            elif same and start is not None:
+                renderer.draw(text[start:index], self.x + start_position, self.y, self.color, self.background)
+                start = None
+            position += renderer.char_width(char)
+            if index < len(old):
+                old_position += renderer.char_width(old[index])
+        if start is not None:
+            renderer.draw(text[start:], self.x + start_position, self.y, self.color, self.background)
+        if old_width > position:
+            clear = old_width - position
+            renderer.fill(self.x + position, self.y, clear, renderer.line_height, self.background)
+        self._text = text
+        self._drawn = (self.color, self.background)
+
+    def redraw(self) -> None:
+        """Draw the whole text again, for example after something else has
+        drawn over it."""
+        self._drawn = None
+        self.text = self._text
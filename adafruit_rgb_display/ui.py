@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.ui`
+====================================================
+
+A loop for button driven interfaces: it debounces buttons, calls handlers for
+presses and releases, redraws only the parts of a
+:class:`~adafruit_rgb_display.scene.Scene` that changed, and sleeps when
+nothing happens.
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+try:
+    import threading
+except ImportError:
+    threading = None  # type: ignore[assignment]
+
+from adafruit_rgb_display.rgb import Display
+from adafruit_rgb_display.scene import Node, Scene
+
+try:
+    from typing import Callable, Dict, List, Optional, Tuple
+
+    import digitalio
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+
+class Event:
+    """A button that was pressed or released.
+
+    :param str name: the name of the button
+    :param bool pressed: True when pressed, False when released
+    :param float time: when the change was accepted, from :func:`time.monotonic`
+    """
+
+    def __init__(self, name: str, pressed: bool, time: float) -> None:
+        self.name = name
+        self.pressed = pressed
+        self.time = time
+
+    def __repr__(self) -> str:
+        return f"Event({self.name!r}, {self.pressed})"
+
+
+class UI:
+    """Runs a button driven interface on a display.
+
+    Buttons connected to pins are read every ``poll_interval`` seconds.
+    Buttons watched some other way, for example by an interrupt handler in
+    another thread, report their changes with :meth:`post`, and the loop
+    waits for them without polling. Either way a change is accepted once the
+    button stayed in the new state for ``debounce`` seconds.
+
+    .. code-block:: python
+
+      ui = UI(display)
+      light = ui.add(Fill(10, 10, 40, 40, 0))
+      ui.add_button("A", digitalio.DigitalInOut(board.D5))
+      ui.on("A", lambda event: setattr(light, "color", 0x07E0 if event.pressed else 0))
+      ui.run()
+
+    :param Display display: the display to draw on
+    :param int background: the 565 color of the display where no node is drawn
+    :param float debounce: the time a button must keep its state, in seconds
+    :param float poll_interval: the time between reading the pins, in seconds
+    """
+
+    def __init__(
+        self,
+        display: Display,
+        background: int = 0,
+        *,
+        debounce: float = 0.02,
+        poll_interval: float = 0.01,
+    ) -> None:
+        self.display = display
+        self.scene = Scene(display, background)
+        """The scene drawn on the display"""
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._pins: Dict[str, Tuple[digitalio.DigitalInOut, bool]] = {}
+        self._pressed: Dict[str, bool] = {}
+        # The last state seen of each button and since when
+        self._raw: Dict[str, Tuple[bool, float]] = {}
+        self._handlers: Dict[str, List[Callable[[Event], None]]] = {}
+        self._posted: List[Tuple[str, bool, float]] = []
+        self._wake = threading.Condition() if threading else None
+
+    def add(self, node: Node) -> Node:
+        """Add a node to the scene, and return it."""
+        return self.scene.add(node)
+
+    def add_button(
+        self,
+        name: str,
+        pin: Optional[digitalio.DigitalInOut] = None,
+        *,
+        value_when_pressed: bool = False,
+    ) -> None:
+        """Add a button. Buttons without a pin report their changes with
+        :meth:`post`.
+
+        :param str name: the name of the button, used in events
+        :param pin: the input the button is connected to
+        :param bool value_when_pressed: the value of the pin when pressed
+        """
+        if pin is not None:
+            self._pins[name] = (pin, value_when_pressed)
+        self._pressed[name] = False
+        self._raw[name] = (False, time.monotonic())
+
+    def pressed(self, name: str) -> bool:
+        """Return whether a button is pressed, after debouncing."""
+        return self._pressed[name]
+
+    def on(self, name: str, handler: Callable[[Event], None]) -> None:
+        """Call a function with an :class:`Event` each time a button is
+        pressed or released."""
+        self._handlers.setdefault(name, []).append(handler)
+
+    def post(self, name: str, pressed: bool) -> None:
+        """Report that a button changed, waking up the loop. Can be called
+        from another thread."""
+        if self._wake is None:
+            self._posted.append((name, pressed, time.monotonic()))
+            return
+        with self._wake:
+            self._posted.append((name, pressed, time.monotonic()))
+            self._wake.notify()
+
+    def _take_posted(self) -> List[Tuple[str, bool, float]]:
+        if self._wake is None:
+            posted, self._posted = self._posted, []
+            return posted
+        with self._wake:
+            posted, self._posted = self._posted, []
+        return posted
+
+    def _see(self, name: str, pressed: bool, now: float) -> None:
+        """Note the state of a button, restarting the debounce time when it
+        changed."""
+        if self._raw[name][0] != pressed:
+            self._raw[name] = (pressed, now)
+
+    def step(self) -> bool:
+        """Read the buttons, call the handlers of accepted changes and send
+        the parts of the scene that changed.
+
+        :return: whether anything changed
+        """
+        for name, pressed, when in self._take_posted():
+            self._see(name, pressed, when)
+        now = time.monotonic()
+        for name, (pin, value_when_pressed) in self._pins.items():
+            self._see(name, pin.value == value_when_pressed, now)
+        events = []
+        for name, (pressed, since) in self._raw.items():
+            if pressed != self._pressed[name] and now - since >= self.debounce:
+                self._pressed[name] = pressed
+                events.append(Event(name, pressed, now))
+        for event in events:
+            for handler in self._handlers.get(event.name, ()):
+                handler(event)
+        return self.scene.flush() > 0 or bool(events)
+
+    def _timeout(self) -> Optional[float]:
+        """Return the time until the next step is needed, or None to wait for
+        a posted change."""
+        deadlines = [
+            since + self.debounce
+            for name, (pressed, since) in self._raw.items()
+            if pressed != self._pressed[name]
+        ]
+        if deadlines:
+            timeout = max(0.0, min(deadlines) - time.monotonic())
+            return min(timeout, self.poll_interval) if self._pins else timeout
+        return self.poll_interval if self._pins else None
+
+    def run(self, stop: Optional[Callable[[], bool]] = None) -> None:
+        """Run the interface, sleeping between steps until a button may have
+        changed.
+
+        :param stop: a function called after each step, return True from it
+            to stop. Without buttons on pins, steps only happen when a button
+            changes.
+        """
+        while True:
+            self.step()
+            if stop is not None and stop():
+                return
+            timeout = self._timeout()
+            if self._wake is None:
+                time.sleep(self.poll_interval if timeout is None else timeout)
+                continue
+            with self._wake:
+                if not self._posted:
+                    self._wake.wait(timeout)
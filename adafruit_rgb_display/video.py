@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.video`
+====================================================
+
+Play short clips stored as raw 565 frames, ready to send to the display, from a
+memory mapped file. Encoding clips requires Pillow and NumPy, playing them
+requires neither.
+
+The file starts with a 16 byte little endian header: the magic ``b"R565"``,
+the width and height of the frames, the duration of each frame in
+microseconds and the number of frames. Big endian 565 frames follow, one line
+after another.
+
+Encode a clip from the command line with:
+
+.. code-block:: shell
+
+  python -m adafruit_rgb_display.video clip.r565 clip.gif --size 240x320 --rotation 90
+
+* Author(s): Adafruit Industries
+"""
+
+import argparse
+import mmap
+import struct
+
+from adafruit_rgb_display.rgb import Display
+from adafruit_rgb_display.scheduler import FrameScheduler
+
+try:
+    from typing import Callable, Iterable, Optional, Tuple
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+_MAGIC = b"R565"
+_HEADER = "<4sHHII"
+_HEADER_SIZE = struct.calcsize(_HEADER)
+
+
+class Video:
+    """A clip of raw 565 frames, memory mapped from a file.
+
+    :param str path: the file to play
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, width, height, duration, count = struct.unpack_from(_HEADER, self._map)
+        if magic != _MAGIC:
+            self._map.close()
+            raise ValueError("Not a 565 video file")
+        self.width = width
+        self.height = height
+        self.duration = duration / 1000000
+        """The time each frame is shown, in seconds"""
+        self.count = count
+        """The number of frames"""
+        self._size = width * height * 2
+        if len(self._map) < _HEADER_SIZE + count * self._size:
+            self._map.close()
+            raise ValueError("Video file is truncated")
+        self._frames = memoryview(self._map)
+
+    @property
+    def fps(self) -> float:
+        """The number of frames per second"""
+        return 1 / self.duration if self.duration else 0.0
+
+    def frame(self, index: int) -> memoryview:
+        """Return the pixels of a frame, without copying."""
+        start = _HEADER_SIZE + index * self._size
+        return self._frames[start : start + self._size]
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        self._frames.release()
+        self._map.close()
+
+
+def play(
+    display: Display,
+    video: Video,
+    *,
+    x: int = 0,
+    y: int = 0,
+    loops: int = 1,
+    stop: Optional[Callable[[], bool]] = None,
+    drop: bool = True,
+) -> bool:
+    """Play a video on a display. The frames are sent straight from the file,
+    so they must already be in the orientation of the display, and the
+    display must take 16-bit 565 pixels.
+
+    :param Display display: the display to play on
+    :param Video video: the video to play
+    :param int x: left edge of the video on the display
+    :param int y: top edge of the video on the display
+    :param int loops: the number of times to play it, 0 for forever
+    :param stop: a function called after each frame, return True from it
+        to stop playing
+    :param bool drop: whether to skip frames when running late
+    :return: True if the video played to the end, False if stopped
+    """
+    display._require_565("Video playback")
+    if x + video.width > display.width or y + video.height > display.height:
+        raise ValueError(f"Video must not exceed dimensions of display ({display.width}x{display.height}).")
+    x1, y1 = x + video.width - 1, y + video.height - 1
+    scheduler = FrameScheduler(drop=drop)
+    while True:
+        for index in range(video.count):
+            if scheduler.next(video.duration):
+                display._block(x, y, x1, y1, video.frame(index))
+            if stop is not None and stop():
+                return False
+            scheduler.wait()
+        if loops == 1:
+            return True
+        if loops > 0:
+            loops -= 1
+
+
+def encode(
+    path: str,
+    sources: Iterable[str],
+    size: Tuple[int, int],
+    *,
+    rotation: int = 0,
+    fps: Optional[float] = None,
+    background: Tuple[int, int, int] = (0, 0, 0),
+) -> int:
+    """Encode images and animated GIFs into a video file. Each image is
+    scaled to fit and rotated like
+    :meth:`Display.image() <adafruit_rgb_display.rgb.Display.image>`, so that
+    the frames can be sent to the display as they are.
+
+    :param str path: the video file to write
+    :param sources: the image files to read, in order
+    :param tuple size: the width and height of the display
+    :param int rotation: the rotation of the display
+    :param float fps: the number of frames per second. Frames of animations
+        are repeated or skipped to keep their timing. Defaults to the frame
+        rate of the first animation, or 10.
+    :param tuple background: the color of the borders around images that
+        don't have the aspect ratio of the display
+    :return: the number of frames written
+    """
+    from PIL import Image, ImageOps  # noqa: PLC0415
+
+    from adafruit_rgb_display.scaler import Scaler  # noqa: PLC0415
+
+    if rotation not in {0, 90, 180, 270}:
+        raise ValueError("Rotation must be 0/90/180/270")
+    width, height = size
+    unrotated = (height, width) if rotation % 180 == 90 else (width, height)
+    scaler = Scaler(unrotated, unrotated, rotation=rotation)
+    count = 0
+    # The time covered by the images read so far
+    elapsed = 0.0
+    with open(path, "wb") as file:
+        file.write(bytes(_HEADER_SIZE))
+        for source in sources:
+            with Image.open(source) as image:
+                for index in range(getattr(image, "n_frames", 1)):
+                    image.seek(index)
+                    duration = image.info.get("duration", 0) / 1000
+                    if fps is None:
+                        fps = 1 / duration if duration else 10.0
+                    elapsed += duration or 1 / fps
+                    repeats = round(elapsed * fps) - count
+                    if repeats <= 0:
+                        continue
+                    frame = ImageOps.pad(
+                        image.convert("RGB"), unrotated, method=Image.Resampling.BOX, color=background
+                    )
+                    data = scaler.scale(frame).tobytes()
+                    for _ in range(repeats):
+                        file.write(data)
+                    count += repeats
+        file.seek(0)
+        file.write(struct.pack(_HEADER, _MAGIC, width, height, round(1000000 / (fps or 10.0)), count))
+    return count
+
+
+def main() -> None:
+    """Encode a video from the command line."""
+    parser = argparse.ArgumentParser(description="Encode images and animated GIFs into a 565 video.")
+    parser.add_argument("output", help="the video file to write")
+    parser.add_argument("sources", nargs="+", help="the images to encode, in order")
+    parser.add_argument("--size", required=True, help="the size of the display, as WIDTHxHEIGHT")
+    parser.add_argument("--rotation", type=int, default=0, help="the rotation of the display")
+    parser.add_argument("--fps", type=float, help="the number of frames per second")
+    args = parser.parse_args()
+    width, height = (int(value) for value in args.size.lower().split("x"))
+    count = encode(args.output, args.sources, (width, height), rotation=args.rotation, fps=args.fps)
+    print(f"Wrote {count} frames to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
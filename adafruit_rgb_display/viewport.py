@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_rgb_display.viewport`
+====================================================
+
+Pan the display over a 565 image larger than the display, such as a map,
+sending only the lines uncovered by each step. Requires NumPy.
+
+* Author(s): Adafruit Industries
+"""
+
+import numpy
+
+from adafruit_rgb_display.asset import Asset
+from adafruit_rgb_display.rgb import Display, VerticalScroll
+
+try:
+    from typing import Union
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_RGB_Display.git"
+
+
+class Viewport:
+    """Shows the part of a large image that fits on the display, starting at
+    :attr:`left` and :attr:`top` in the image.
+
+    When panning along the axis the display scrolls along in hardware, the
+    display content is scrolled and only the uncovered lines are sent.
+    Displays that can copy rectangles of their content, like the SSD1331,
+    shift the content along both axes. Otherwise the whole display is sent
+    again. The image must be in the orientation of the display, like an
+    :class:`~adafruit_rgb_display.asset.Asset` converted with its rotation,
+    and the display must take 16-bit 565 pixels.
+
+    :param Display display: the display to draw on
+    :param source: the image, as a 2D array of 565 colors or a memory mapped
+        asset without flags
+    :param int left: the first column of the image to show
+    :param int top: the first line of the image to show
+    """
+
+    def __init__(
+        self,
+        display: Display,
+        source: Union[numpy.ndarray, Asset],
+        *,
+        left: int = 0,
+        top: int = 0,
+    ) -> None:
+        display._require_565("The viewport")
+        if isinstance(source, Asset):
+            if source.pixels is None:
+                raise ValueError("Asset must be memory mapped and without flags")
+            source = numpy.frombuffer(source.pixels, dtype=">u2").reshape(source.height, source.width)
+        else:
+            source = numpy.asarray(source, dtype=">u2")
+        if source.shape[0] < display.height or source.shape[1] < display.width:
+            raise ValueError("Source must not be smaller than the display")
+        self.display = display
+        self.source = source
+        self._axis = None
+        if isinstance(display, VerticalScroll):
+            display.scroll_area()
+            self._axis = "x" if display._SCROLL_ALONG_X else "y"
+        self.left, self.top = self._clamp(left, top)
+        self.redraw()
+
+    def _clamp(self, left: int, top: int) -> tuple:
+        """Return the nearest position that keeps the display on the image."""
+        height, width = self.source.shape
+        return (
+            min(max(0, left), width - self.display.width),
+            min(max(0, top), height - self.display.height),
+        )
+
+    def redraw(self) -> None:
+        """Send the whole display again."""
+        self._draw(0, 0, self.display.width - 1, self.display.height - 1)
+
+    def pan(self, dx: int, dy: int) -> None:
+        """Move the display over the image by ``dx`` columns and ``dy``
+        lines, stopping at the edges of the image."""
+        self.move_to(self.left + dx, self.top + dy)
+
+    def move_to(self, left: int, top: int) -> None:
+        """Move the display over the image so that it shows the image from
+        column ``left`` and line ``top``, stopping at the edges of the image."""
+        left, top = self._clamp(left, top)
+        dx, dy = left - self.left, top - self.top
+        self.left, self.top = left, top
+        width, height = self.display.width, self.display.height
+        if abs(dx) >= width or abs(dy) >= height:
+            self.redraw()
+        elif self._axis == "y" and not dx:
+            if dy:
+                self.display.scroll(dy)  # type: ignore[attr-defined]
+                self._uncovered(0, dy)
+        elif self._axis == "x" and not dy:
+            if dx:
+                self.display.scroll(dx)  # type: ignore[attr-defined]
+                self._uncovered(dx, 0)
+        elif self._axis is None and hasattr(self.display, "copy_rect"):
+            self.display.copy_rect(
+                max(dx, 0), max(dy, 0), width - abs(dx), height - abs(dy), max(-dx, 0), max(-dy, 0)
+            )
+            self._uncovered(dx, dy)
+        else:
+            self.redraw()
+
+    def _uncovered(self, dx: int, dy: int) -> None:
+        """Send the lines and columns uncovered by shifting the display
+        content by ``dx`` and ``dy``."""
+        right, bottom = self.display.width - 1, self.display.height - 1
+        # The lines kept from before, where uncovered columns go
+        y0, y1 = 0, bottom
+        if dy > 0:
+            self._draw(0, bottom - dy + 1, right, bottom)
+            y1 = bottom - dy
+        elif dy < 0:
+            self._draw(0, 0, right, -dy - 1)
+            y0 = -dy
+        if dx > 0:
+            self._draw(right - dx + 1, y0, right, y1)
+        elif dx < 0:
+            self._draw(0, y0, -dx - 1, y1)
+
+    def _draw(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        """Send the part of the image shown at a rectangle of the display,
+        split where the scrolled display content wraps around."""
+        if self._axis is None:
+            self._send(x0, y0, x1, y1, x0, y0)
+            return
+        display = self.display
+        along_x = self._axis == "x"
+        start, end = (x0, x1) if along_x else (y0, y1)
+        lines = display.width if along_x else display.height
+        while start <= end:
+            line = display.scrolled(start)  # type: ignore[attr-defined]
+            count = min(end - start + 1, lines - line)
+            if along_x:
+                self._send(start, y0, start + count - 1, y1, line, y0)
+            else:
+                self._send(x0, start, x1, start + count - 1, x0, line)
+            start += count
+
+    def _send(self, x0: int, y0: int, x1: int, y1: int, to_x: int, to_y: int) -> None:
+        """Send the part of the image shown at a rectangle of the display to
+        a position in the display memory."""
+        pixels = self.source[self.top + y0 : self.top + y1 + 1, self.left + x0 : self.left + x1 + 1]
+        self.display._block(to_x, to_y, to_x + x1 - x0, to_y + y1 - y0, pixels.tobytes())
@@ -24,6 +24,7 @@ extensions = [
 # digitalio, micropython and busio. List the modules you use. Without it, the
 # autodoc module docs will fail to generate with a warning.
 # autodoc_mock_imports = ["adafruit_bus_device", "micropython"]
+autodoc_mock_imports = ["numpy", "PIL"]
 
 intersphinx_mapping = {
     "python": ("https://docs.python.org/3", None),
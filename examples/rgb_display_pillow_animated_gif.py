@@ -17,12 +17,10 @@ Author(s): Melissa LeBlanc-Williams for Adafruit Industries
 """
 
 import os
-import time
 
 import board
 import digitalio
-import numpy
-from PIL import Image, ImageOps
+from PIL import Image
 
 from adafruit_rgb_display import (
     hx8357,
@@ -32,6 +30,7 @@ from adafruit_rgb_display import (
     st7735,
     st7789,
 )
+from adafruit_rgb_display.animation import AnimationPlayer
 
 # Change to match your display
 BUTTON_NEXT = board.D17
@@ -52,32 +51,17 @@ def init_button(pin):
     return button
 
 
-class Frame:
-    def __init__(self, duration=0):
-        self.duration = duration
-        self.image = None
-
-
 class AnimatedGif:
-    def __init__(self, display, width=None, height=None, folder=None):
-        self._frame_count = 0
-        self._loop = 0
+    def __init__(self, display, folder=None):
         self._index = 0
-        self._duration = 0
         self._gif_files = []
-        self._frames = []
-
-        if width is not None:
-            self._width = width
-        else:
-            self._width = display.width
-        if height is not None:
-            self._height = height
-        else:
-            self._height = display.height
-        self.display = display
+        # Frames are converted once and kept within this many bytes
+        self.player = AnimationPlayer(display, budget=64 * 1024 * 1024)
         self.advance_button = init_button(BUTTON_NEXT)
         self.back_button = init_button(BUTTON_PREVIOUS)
+        self._prev_advance_btn_val = self.advance_button.value
+        self._prev_back_btn_val = self.back_button.value
+        self._pressed = None
         if folder is not None:
             self.load_files(folder)
             self.run()
@@ -102,66 +86,36 @@ class AnimatedGif:
             print("No Gif files found in current folder")
             exit()  # noqa: PLR1722, sys.exit
 
-    def preload(self):
-        image = Image.open(self._gif_files[self._index])
-        print(f"Loading {self._gif_files[self._index]}...")
-        if "duration" in image.info:
-            self._duration = image.info["duration"]
-        else:
-            self._duration = 0
-        if "loop" in image.info:
-            self._loop = image.info["loop"]
-        else:
-            self._loop = 1
-        self._frame_count = image.n_frames
-        self._frames.clear()
-        for frame in range(self._frame_count):
-            image.seek(frame)
-            # Create blank image for drawing.
-            # Make sure to create image with mode 'RGB' for full color.
-            frame_object = Frame(duration=self._duration)
-            if "duration" in image.info:
-                frame_object.duration = image.info["duration"]
-            frame_object.image = ImageOps.pad(
-                image.convert("RGB"),
-                (self._width, self._height),
-                method=Image.NEAREST,
-                color=(0, 0, 0),
-                centering=(0.5, 0.5),
-            )
-            self._frames.append(frame_object)
+    def check_buttons(self):
+        _cur_advance_btn_val = self.advance_button.value
+        _cur_back_btn_val = self.back_button.value
+        if not _cur_advance_btn_val and self._prev_advance_btn_val:
+            self._pressed = self.advance
+        elif not _cur_back_btn_val and self._prev_back_btn_val:
+            self._pressed = self.back
+        self._prev_back_btn_val = _cur_back_btn_val
+        self._prev_advance_btn_val = _cur_advance_btn_val
+        return self._pressed is not None
 
     def play(self):
-        self.preload()
-
-        _prev_advance_btn_val = self.advance_button.value
-        _prev_back_btn_val = self.back_button.value
         # Check if we have loaded any files first
         if not self._gif_files:
             print("There are no Gif Images loaded to Play")
             return False
-        while True:
-            for frame_object in self._frames:
-                start_time = time.monotonic()
-                self.display.image(frame_object.image)
-                _cur_advance_btn_val = self.advance_button.value
-                _cur_back_btn_val = self.back_button.value
-                if not _cur_advance_btn_val and _prev_advance_btn_val:
-                    self.advance()
-                    return False
-                if not _cur_back_btn_val and _prev_back_btn_val:
-                    self.back()
-                    return False
-
-                _prev_back_btn_val = _cur_back_btn_val
-                _prev_advance_btn_val = _cur_advance_btn_val
-                while time.monotonic() < (start_time + frame_object.duration / 1000):
-                    pass
-
-            if self._loop == 1:
-                return True
-            if self._loop > 0:
-                self._loop -= 1
+        print(f"Playing {self._gif_files[self._index]}...")
+        # Start converting this one first, then the neighbours in the
+        # background, so switching is instant
+        self.player.load(self._gif_files[self._index])
+        count = len(self._gif_files)
+        self.player.prefetch(
+            self._gif_files[(self._index + 1) % count],
+            self._gif_files[(self._index - 1) % count],
+        )
+        self._pressed = None
+        if self.player.play(self._gif_files[self._index], stop=self.check_buttons):
+            return True
+        self._pressed()
+        return False
 
     def run(self):
         while True:
@@ -200,11 +154,4 @@ disp = ili9341.ILI9341(
     baudrate=BAUDRATE,
 )
 
-if disp.rotation % 180 == 90:
-    disp_height = disp.width  # we swap height/width to rotate it to landscape!
-    disp_width = disp.height
-else:
-    disp_width = disp.width
-    disp_height = disp.height
-
-gif_player = AnimatedGif(disp, width=disp_width, height=disp_height, folder=".")
+gif_player = AnimatedGif(disp, folder=".")
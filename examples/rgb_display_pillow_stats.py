@@ -11,12 +11,8 @@ Adafruit Blinka to support CircuitPython libraries. CircuitPython does
 not support PIL/pillow (python imaging library)!
 """
 
-import subprocess
-import time
-
 import board
 import digitalio
-from PIL import Image, ImageDraw, ImageFont
 
 from adafruit_rgb_display import (
     hx8357,
@@ -25,7 +21,10 @@ from adafruit_rgb_display import (
     ssd1351,
     st7735,
     st7789,
+    stats,
 )
+from adafruit_rgb_display.stats import Dashboard
+from adafruit_rgb_display.text import TextRenderer, load_font
 
 # Configuration for CS and DC pins (these are PiTFT defaults):
 cs_pin = digitalio.DigitalInOut(board.CE0)
@@ -62,62 +61,21 @@ disp = ili9341.ILI9341(
     baudrate=BAUDRATE,
 )
 
-# Create blank image for drawing.
-# Make sure to create image with mode 'RGB' for full color.
-if disp.rotation % 180 == 90:
-    height = disp.width  # we swap height/width to rotate it to landscape!
-    width = disp.height
-else:
-    width = disp.width  # we swap height/width to rotate it to landscape!
-    height = disp.height
-
-image = Image.new("RGB", (width, height))
-
-# Get drawing object to draw on image.
-draw = ImageDraw.Draw(image)
-
-# Draw a black filled box to clear the image.
-draw.rectangle((0, 0, width, height), outline=0, fill=(0, 0, 0))
-disp.image(image)
-
-# First define some constants to allow easy positioning of text.
-padding = -2
-x = 0
+# Clear the display.
+disp.fill(0)
 
 # Load a TTF font.  Make sure the .ttf font file is in the
 # same directory as the python script!
 # Some other nice fonts to try: http://www.dafont.com/bitmap.php
-font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
-
-while True:
-    # Draw a black filled box to clear the image.
-    draw.rectangle((0, 0, width, height), outline=0, fill=0)
-
-    # Shell scripts for system monitoring from here:
-    # https://unix.stackexchange.com/questions/119126/command-to-display-memory-usage-disk-usage-and-cpu-load
-    cmd = "hostname -I | cut -d' ' -f1"
-    IP = "IP: " + subprocess.check_output(cmd, shell=True).decode("utf-8")
-    cmd = "top -bn1 | grep load | awk '{printf \"CPU Load: %.2f\", $(NF-2)}'"
-    CPU = subprocess.check_output(cmd, shell=True).decode("utf-8")
-    cmd = "free -m | awk 'NR==2{printf \"Mem: %s/%s MB  %.2f%%\", $3,$2,$3*100/$2 }'"
-    MemUsage = subprocess.check_output(cmd, shell=True).decode("utf-8")
-    cmd = 'df -h | awk \'$NF=="/"{printf "Disk: %d/%d GB  %s", $3,$2,$5}\''
-    Disk = subprocess.check_output(cmd, shell=True).decode("utf-8")
-    cmd = "cat /sys/class/thermal/thermal_zone0/temp |  awk '{printf \"CPU Temp: %.1f C\", $(NF-0) / 1000}'"
-    Temp = subprocess.check_output(cmd, shell=True).decode("utf-8")
-
-    # Write four lines of text.
-    y = padding
-    draw.text((x, y), IP, font=font, fill="#FFFFFF")
-    y += font.getsize(IP)[1]
-    draw.text((x, y), CPU, font=font, fill="#FFFF00")
-    y += font.getsize(CPU)[1]
-    draw.text((x, y), MemUsage, font=font, fill="#00FF00")
-    y += font.getsize(MemUsage)[1]
-    draw.text((x, y), Disk, font=font, fill="#0000FF")
-    y += font.getsize(Disk)[1]
-    draw.text((x, y), Temp, font=font, fill="#FF00FF")
-
-    # Display image.
-    disp.image(image)
-    time.sleep(0.1)
+font = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
+renderer = TextRenderer(disp, font, rotation=disp.rotation)
+
+# Read each statistic from /proc or /sys at its own interval, and send only
+# the characters that changed.
+dashboard = Dashboard(renderer, y=-2)
+dashboard.add(stats.ip_address, 30, color=0xFFFF)
+dashboard.add(stats.cpu_load, 1, color=0xFFE0)
+dashboard.add(stats.memory_usage, 2, color=0x07E0)
+dashboard.add(stats.disk_usage, 60, color=0x001F)
+dashboard.add(stats.cpu_temperature, 2, color=0xF81F)
+dashboard.run()
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+The Mini PiTFT bonnet buttons example, redrawing only the buttons that
+changed and sleeping in between, instead of sending the whole display every
+10 milliseconds.
+
+This example is for use on (Linux) computers that are using CPython with
+Adafruit Blinka to support CircuitPython libraries.
+"""
+
+import board
+from digitalio import DigitalInOut
+from PIL import Image, ImageDraw, ImageFont
+
+from adafruit_rgb_display import st7789
+from adafruit_rgb_display.scaler import Scaler
+from adafruit_rgb_display.scene import Bitmap
+from adafruit_rgb_display.ui import UI
+
+# Create the display
+cs_pin = DigitalInOut(board.CE0)
+dc_pin = DigitalInOut(board.D25)
+reset_pin = DigitalInOut(board.D24)
+BAUDRATE = 24000000
+
+spi = board.SPI()
+disp = st7789.ST7789(
+    spi,
+    height=240,
+    y_offset=80,
+    rotation=180,
+    cs=cs_pin,
+    dc=dc_pin,
+    rst=reset_pin,
+    baudrate=BAUDRATE,
+)
+
+# Turn on the Backlight
+backlight = DigitalInOut(board.D26)
+backlight.switch_to_output()
+backlight.value = True
+
+udlr_fill = "#00FF00"
+udlr_outline = "#00FFFF"
+button_fill = "#FF00FF"
+button_outline = "#FFFFFF"
+
+# Name, pin, shape, corners and pressed color of each button
+buttons = (
+    ("U", board.D17, "polygon", [(40, 40), (60, 4), (80, 40)], udlr_fill),
+    ("D", board.D22, "polygon", [(60, 120), (80, 84), (40, 84)], udlr_fill),
+    ("L", board.D27, "polygon", [(0, 60), (36, 42), (36, 81)], udlr_fill),
+    ("R", board.D23, "polygon", [(120, 60), (84, 42), (84, 82)], udlr_fill),
+    ("C", board.D4, "rectangle", (40, 44, 80, 80), button_fill),
+    ("A", board.D5, "ellipse", (140, 80, 180, 120), button_fill),
+    ("B", board.D6, "ellipse", (190, 40, 230, 80), button_fill),
+)
+
+# Draw everything released and everything pressed once
+if disp.rotation % 180 == 90:
+    size = (disp.height, disp.width)
+else:
+    size = (disp.width, disp.height)
+fnt = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 30)
+released = Image.new("RGB", size)
+pressed = Image.new("RGB", size)
+for image, state in ((released, False), (pressed, True)):
+    draw = ImageDraw.Draw(image)
+    for _, _, shape, corners, fill in buttons:
+        outline = udlr_outline if shape == "polygon" else button_outline
+        getattr(draw, shape)(corners, outline=outline, fill=fill if state else 0)
+    draw.text((20, 150), "Hello World", font=fnt, fill="#FFFF00")
+released = released.rotate(disp.rotation, expand=True)
+pressed = pressed.rotate(disp.rotation, expand=True)
+
+
+def bitmap(image, box):
+    """Cut a box out of a rotated image into a bitmap node."""
+    crop = image.crop(box)
+    pixels = Scaler(crop.size, crop.size).scale(crop).tobytes()
+    return Bitmap.from_pixels(box[0], box[1], crop.width, crop.height, pixels)
+
+
+ui = UI(disp)
+# The text and everything else that never changes
+ui.add(bitmap(released, (0, 0, disp.width, disp.height)))
+for name, pin, shape, corners, fill in buttons:
+    # Find where the button ends up on the rotated display
+    mask = Image.new("L", size)
+    getattr(ImageDraw.Draw(mask), shape)(corners, fill=255, outline=255)
+    box = mask.rotate(disp.rotation, expand=True).getbbox()
+    node = ui.add(bitmap(released, box))
+    states = {False: node.spans, True: bitmap(pressed, box).spans}
+    ui.add_button(name, DigitalInOut(pin))
+    ui.on(name, lambda event, node=node, states=states: setattr(node, "spans", states[event.pressed]))
+
+ui.run()
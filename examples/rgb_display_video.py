@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+Play a looping clip of raw 565 frames, sent straight from the file.
+
+Encode the clip once, on any computer, for the size and rotation of the
+display, for example:
+
+    python -m adafruit_rgb_display.video clip.r565 clip.gif --size 240x320 --rotation 90
+
+This example is for use on (Linux) computers that are using CPython with
+Adafruit Blinka to support CircuitPython libraries.
+"""
+
+import board
+import digitalio
+
+from adafruit_rgb_display import ili9341
+from adafruit_rgb_display.video import Video, play
+
+# Configuration for CS and DC pins (these are PiTFT defaults):
+cs_pin = digitalio.DigitalInOut(board.CE0)
+dc_pin = digitalio.DigitalInOut(board.D25)
+reset_pin = digitalio.DigitalInOut(board.D24)
+
+# Config for display baudrate (default max is 24mhz):
+BAUDRATE = 24000000
+
+# Setup SPI bus using hardware SPI:
+spi = board.SPI()
+
+# Create the display, the clip must be encoded for its size:
+disp = ili9341.ILI9341(spi, cs=cs_pin, dc=dc_pin, rst=reset_pin, baudrate=BAUDRATE)
+
+clip = Video("clip.r565")
+try:
+    play(disp, clip, loops=0)
+finally:
+    clip.close()
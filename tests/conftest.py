@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""A fake SPI bus with devices on it, and a panel that keeps what a
+display controller would show."""
+
+import struct
+import threading
+
+import numpy
+import pytest
+
+_CASET = 0x2A
+_RASET = 0x2B
+_RAMWR = 0x2C
+_RAMRD = 0x2E
+_VSCRDEF = 0x33
+_VSCRSADD = 0x37
+
+
+class FakePin:
+    """A digital output. Chip select pins tell the bus which device is
+    selected."""
+
+    def __init__(self, bus=None, device=None):
+        self.bus = bus
+        self.device = device
+        self._value = True
+
+    def switch_to_output(self, value=False, drive_mode=None):
+        self.value = value
+
+    def deinit(self):
+        pass
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        if self.bus is None:
+            return
+        if value:
+            if self.bus.selected is self.device:
+                self.bus.selected = None
+        else:
+            assert self.bus.selected in {None, self.device}, "two devices selected at once"
+            self.bus.selected = self.device
+
+
+class FakeDevice:
+    """Something on the bus, with its own chip select and data/command pins."""
+
+    def __init__(self, bus, name):
+        self.name = name
+        self.cs = FakePin(bus, self)
+        self.dc = FakePin()
+        self.writes = []
+
+    def receive(self, data):
+        self.writes.append((self.dc.value, data))
+
+    @staticmethod
+    def transmit(count):
+        return bytes(count)
+
+
+class Panel(FakeDevice):
+    """A display controller taking 16-bit pixels through the usual column,
+    row and memory write commands, and sending them back as 18-bit pixels
+    after a dummy byte through the memory read command. Vertical scrolling
+    changes which memory lines are shown, see :meth:`shown`."""
+
+    def __init__(self, bus, name="panel", size=320):
+        super().__init__(bus, name)
+        self.memory = numpy.zeros((size, size), dtype=">u2")
+        self.command = None
+        self.columns = self.rows = (0, 0)
+        self.position = 0
+        self.pending = b""
+        self.scroll_area = None
+        self.scroll_start = 0
+
+    def receive(self, data):
+        super().receive(data)
+        if not data:
+            return
+        if not self.dc.value:
+            self.command = data[0]
+            self.position = 0
+            self.pending = b""
+        elif self.command == _CASET:
+            self.columns = struct.unpack(">HH", data)
+        elif self.command == _RASET:
+            self.rows = struct.unpack(">HH", data)
+        elif self.command == _VSCRDEF:
+            self.scroll_area = struct.unpack(">HHH", data)
+        elif self.command == _VSCRSADD:
+            (self.scroll_start,) = struct.unpack(">H", data)
+        elif self.command == _RAMWR:
+            data = self.pending + data
+            count = len(data) // 2
+            self.pending = data[count * 2 :]
+            width = self.columns[1] - self.columns[0] + 1
+            for pixel in struct.unpack(">%dH" % count, data[: count * 2]):
+                row, column = divmod(self.position, width)
+                self.memory[self.rows[0] + row, self.columns[0] + column] = pixel
+                self.position += 1
+
+    def shown(self):
+        """Return the memory lines in the order the scrolled panel shows them."""
+        lines = numpy.arange(len(self.memory))
+        if self.scroll_area is not None:
+            top, height, _ = self.scroll_area
+            area = lines[top : top + height]
+            lines[top : top + height] = top + (area - top + self.scroll_start - top) % height
+        return self.memory[lines]
+
+    def transmit(self, count):
+        if self.command != _RAMRD:
+            return bytes(count)
+        pixels = self.memory[self.rows[0] : self.rows[1] + 1, self.columns[0] : self.columns[1] + 1]
+        pixels = pixels.astype("uint16").reshape(-1, 1)
+        data = numpy.hstack(((pixels >> 8) & 0xF8, (pixels >> 3) & 0xFC, (pixels << 3) & 0xF8))
+        return (b"\xff" + data.astype("uint8").tobytes() + bytes(count))[:count]
+
+
+class FakeSPI:
+    """An SPI bus that hands what is written to the selected device."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.selected = None
+        self.configures = 0
+        self.locks = 0
+
+    def try_lock(self):
+        if self._lock.acquire(False):
+            self.locks += 1
+            return True
+        return False
+
+    def unlock(self):
+        self._lock.release()
+
+    def configure(self, **kwargs):
+        self.configures += 1
+
+    def write(self, buffer, start=0, end=None):
+        assert self.selected is not None, "nothing selected"
+        self.selected.receive(bytes(buffer[start:end]))
+
+    def readinto(self, buffer, start=0, end=None, write_value=0):
+        assert self.selected is not None, "nothing selected"
+        end = len(buffer) if end is None else end
+        buffer[start:end] = self.selected.transmit(end - start)
+
+
+@pytest.fixture
+def bus():
+    return FakeSPI()
+
+
+@pytest.fixture
+def make_display(bus):
+    """Return a function making a display of a class on the bus, with the
+    panel it drives."""
+
+    def make(cls, name="panel", **kwargs):
+        panel = Panel(bus, name)
+        display = cls(bus, dc=panel.dc, cs=panel.cs, **kwargs)
+        panel.writes.clear()
+        return display, panel
+
+    return make
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from PIL import Image
+
+from adafruit_rgb_display.animation import AnimationPlayer
+from adafruit_rgb_display.rgb import color565
+from adafruit_rgb_display.st7789 import ST7789
+
+_COLORS = ((255, 0, 0), (0, 255, 0), (0, 0, 255))
+
+
+def _gif(path, offset=0):
+    frames = []
+    for index, color in enumerate(_COLORS):
+        frame = Image.new("RGB", (60, 60))
+        frame.paste(color, (index * 10 + offset, 5, index * 10 + offset + 20, 40))
+        frames.append(frame)
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=0, loop=1)
+    return str(path)
+
+
+@pytest.fixture
+def player(make_display):
+    display, panel = make_display(ST7789, width=240, height=240)
+    player = AnimationPlayer(display, budget=240 * 240 * 2 * 2, workers=1)
+    yield player, panel
+    player.close()
+
+
+def _converted(player):
+    """Wait for the conversions started so far, run one after another."""
+    player._executor.submit(lambda: None).result()
+
+
+def _last_frame_shown(panel):
+    # The frames are scaled up by 4 to fill the display
+    return panel.memory[20, 81] == color565(*_COLORS[-1]) and panel.memory[20, 41] == 0
+
+
+def test_played_and_cached(player, tmp_path):
+    player, panel = player
+    path = _gif(tmp_path / "a.gif")
+    assert player.play(path, loops=1)
+    assert _last_frame_shown(panel)
+    _converted(player)
+    animation = player.load(path)
+    assert not animation.streamed
+    assert player.cache.get(player._key(path)) is animation
+    assert player.cache.nbytes == animation.nbytes <= player.cache.budget
+
+
+def test_too_large_streamed(player, tmp_path):
+    player, panel = player
+    player.cache.budget = 240 * 240 * 2
+    path = _gif(tmp_path / "a.gif")
+    assert player.play(path, loops=2)
+    assert _last_frame_shown(panel)
+    _converted(player)
+    animation = player.load(path)
+    assert animation.streamed
+    assert not animation.frames
+    assert not player.cache
+    # Not converted again just to find it too large
+    assert player.load(path) is animation
+    panel.memory[:] = 0
+    assert player.play(path, loops=1)
+    assert _last_frame_shown(panel)
+
+
+def test_converting_counts_against_budget(player, tmp_path):
+    player, _ = player
+    first = _gif(tmp_path / "a.gif")
+    second = _gif(tmp_path / "b.gif", offset=5)
+    player.load(first)
+    _converted(player)
+    assert len(player.cache) == 1
+    player.load(second)
+    _converted(player)
+    assert player.cache.nbytes <= player.cache.budget
+    assert player._key(first) not in player.cache
+    assert player._key(second) in player.cache
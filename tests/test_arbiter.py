@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+import time
+
+import pytest
+from adafruit_bus_device.spi_device import SPIDevice
+from conftest import FakeDevice
+
+from adafruit_rgb_display.arbiter import BusArbiter
+from adafruit_rgb_display.st7789 import ST7789
+
+
+def _run(*targets, timeout=10.0):
+    threads = [threading.Thread(target=target, daemon=True) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout)
+    assert not any(thread.is_alive() for thread in threads), "threads did not finish"
+
+
+def test_for_bus_is_shared(bus):
+    assert BusArbiter.for_bus(bus) is BusArbiter.for_bus(bus)
+
+
+def test_released_to_highest_priority_first():
+    arbiter = BusArbiter()
+    order = []
+    arbiter.acquire()
+
+    def waiter(priority):
+        arbiter.acquire(priority)
+        order.append(priority)
+        arbiter.release()
+
+    threads = []
+    for priority in (1, 5, 3):
+        thread = threading.Thread(target=waiter, args=(priority,))
+        thread.start()
+        threads.append(thread)
+        while arbiter.waiting < len(threads):
+            time.sleep(0.001)
+    arbiter.release()
+    for thread in threads:
+        thread.join(5)
+    assert order == [5, 3, 1]
+
+
+def test_release_by_other_thread_fails():
+    arbiter = BusArbiter()
+    with pytest.raises(RuntimeError):
+        arbiter.release()
+
+
+def test_concurrent_drawing_matches_shadow(bus, make_display):
+    display, panel = make_display(ST7789, width=240, height=240)
+    display.enable_shadow()
+    display.share_bus(chunk_size=512)
+    touch = FakeDevice(bus, "touch")
+    device = SPIDevice(bus, touch.cs)
+    arbiter = display.arbiter
+    stop = threading.Event()
+
+    def draw(color):
+        for index in range(40):
+            display.fill_rectangle(index * 3 % 120, index * 5 % 120, 100, 100, color)
+
+    def poll():
+        while not stop.is_set():
+            with arbiter.claim(priority=10), device as spi:
+                spi.write(b"\xd0\x00\x00")
+
+    poller = threading.Thread(target=poll, daemon=True)
+    poller.start()
+    _run(lambda: draw(0xF800), lambda: draw(0x07E0))
+    stop.set()
+    poller.join(5)
+    assert touch.writes
+    assert (panel.memory[:240, :240] == display.shadow).all()
+
+
+def test_claim_then_draw_raises_instead_of_deadlock(make_display):
+    display, _ = make_display(ST7789, width=240, height=240)
+    display.share_bus(chunk_size=1024)
+    arbiter = display.arbiter
+    errors = []
+    filling = threading.Event()
+
+    def claim_and_draw():
+        filling.wait(5)
+        with arbiter.claim(5):
+            try:
+                display.pixel(0, 0, 1)
+            except RuntimeError as error:
+                errors.append(error)
+
+    def fill():
+        with display:
+            filling.set()
+            for _ in range(5):
+                display.fill_rectangle(0, 0, 200, 200, 2)
+
+    _run(claim_and_draw, fill)
+    assert len(errors) == 1
+
+
+def test_draw_with_claim_when_holding_display(make_display):
+    display, panel = make_display(ST7789, width=240, height=240)
+    display.share_bus()
+    with display, display.arbiter.claim(10):
+        display.pixel(1, 2, 0x1234)
+    assert panel.memory[2, 1] == 0x1234
+    assert not display.arbiter.held
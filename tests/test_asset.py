@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from PIL import Image
+
+from adafruit_rgb_display import asset as asset_module
+from adafruit_rgb_display.asset import Asset, encode
+from adafruit_rgb_display.rgb import color565
+from adafruit_rgb_display.ssd1331 import SSD1331
+from adafruit_rgb_display.st7789 import ST7789
+
+
+@pytest.fixture
+def image():
+    img = Image.new("RGBA", (20, 10), (10, 200, 30, 255))
+    img.paste((250, 0, 0, 255), (0, 0, 5, 10))
+    img.paste((0, 0, 0, 0), (8, 2, 12, 6))
+    return img
+
+
+@pytest.mark.parametrize("rle", [False, True])
+def test_keyed_asset_leaves_transparent_pixels(tmp_path, make_display, image, rle):
+    path = str(tmp_path / "sprite.565")
+    encode(path, image, rle=rle)
+    asset = Asset(path)
+    assert asset.keyed
+    display, panel = make_display(ST7789, width=240, height=240)
+    display.enable_shadow()
+    display.fill_rectangle(0, 0, 30, 30, 0x1234)
+    display.draw_asset(asset, 3, 4)
+    asset.close()
+    assert panel.memory[4, 3] == color565(250, 0, 0)
+    assert panel.memory[13, 22] == color565(10, 200, 30)
+    assert panel.memory[6, 11] == 0x1234
+    assert (panel.memory[:240, :240] == display.shadow).all()
+
+
+def test_plain_asset(tmp_path, make_display, image):
+    path = str(tmp_path / "background.565")
+    encode(path, image.convert("RGB"))
+    asset = Asset(path)
+    assert not asset.flags
+    assert len(asset.pixels) == 20 * 10 * 2
+    display, panel = make_display(ST7789, width=240, height=240)
+    display.draw_asset(asset)
+    asset.close()
+    assert panel.memory[0, 0] == color565(250, 0, 0)
+    assert panel.memory[9, 19] == color565(10, 200, 30)
+
+
+@pytest.mark.parametrize(
+    ("cls", "kwargs"), [(ST7789, {"width": 240, "height": 240}), (SSD1331, {"color_depth": 8})]
+)
+def test_asset_refused(tmp_path, make_display, image, cls, kwargs):
+    path = str(tmp_path / "sprite.565")
+    encode(path, image)
+    asset = Asset(path)
+    display, _ = make_display(cls, **kwargs)
+    with pytest.raises(ValueError):
+        display.draw_asset(asset, display.width - 10, 0)
+    asset.close()
+
+
+def test_asset_read_from_file(tmp_path, make_display, image, monkeypatch):
+    monkeypatch.setattr(asset_module, "mmap", None)
+    path = str(tmp_path / "sprite.565")
+    encode(path, image, rle=True)
+    asset = Asset(path)
+    display, panel = make_display(ST7789, width=240, height=240)
+    display.draw_asset(asset)
+    asset.close()
+    assert panel.memory[0, 0] == color565(250, 0, 0)
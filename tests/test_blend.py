@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from PIL import Image
+
+from adafruit_rgb_display.ssd1331 import SSD1331
+from adafruit_rgb_display.st7789 import ST7789
+
+
+def test_blend_over_shadow(make_display):
+    display, panel = make_display(ST7789, width=240, height=240)
+    display.enable_shadow()
+    display.fill_rectangle(0, 0, 20, 20, 0x001F)
+    img = Image.new("RGBA", (20, 20), (0, 0, 0, 0))
+    img.paste((255, 0, 0, 255), (5, 5, 10, 10))
+    panel.writes.clear()
+    display.image(img, blend=True)
+    assert panel.memory[5, 5] == 0xF800
+    assert panel.memory[4, 4] == 0x001F
+    assert (panel.memory[:240, :240] == display.shadow).all()
+    # Only the opaque box is sent
+    assert sum(len(data) for dc, data in panel.writes if dc) < 20 * 20 * 2
+
+
+def test_8bit_refused(make_display):
+    display, _ = make_display(SSD1331, color_depth=8)
+    with pytest.raises(ValueError, match="16-bit"):
+        display.image(Image.new("RGBA", (4, 4)), blend=True)
+
+
+def test_blend_over_readback(make_display):
+    display, panel = make_display(ST7789, width=240, height=240)
+    display.fill_rectangle(0, 0, 20, 20, 0x001F)
+    display.pixel(3, 3, 0x07E0)
+    assert display.pixel(3, 3) == 0x07E0
+    assert display.pixel(4, 4) == 0x001F
+    img = Image.new("RGBA", (20, 20), (0, 0, 0, 0))
+    img.paste((255, 0, 0, 255), (5, 5, 10, 10))
+    img.putpixel((3, 4), (255, 0, 0, 255))
+    display.image(img, blend=True)
+    assert panel.memory[5, 5] == panel.memory[4, 3] == 0xF800
+    # The pixels around them are read back in place
+    assert panel.memory[3, 3] == 0x07E0
+    assert (panel.memory[6:10, :5] == 0x001F).all()
+    assert (panel.memory[:20, 11:20] == 0x001F).all()
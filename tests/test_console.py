@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import struct
+
+import pytest
+
+from adafruit_rgb_display.console import Console
+from adafruit_rgb_display.ili9341 import ILI9341
+from adafruit_rgb_display.st7789 import ST7789
+from adafruit_rgb_display.text import TextRenderer
+
+
+@pytest.fixture
+def console(make_display):
+    display, panel = make_display(ST7789, width=240, height=320)
+    display.fill(0x001F)
+    console = Console(display, top=16, bottom=20)
+    return console, panel
+
+
+def _line(make_display, console, text):
+    """Return the pixels of a line of the console, drawn on another panel."""
+    display, panel = make_display(ILI9341, name="reference")
+    TextRenderer(display, console.font, cell_width=console._cell_width).draw(
+        text.ljust(console.columns), 0, 0
+    )
+    return panel.memory[: console._line_height, :240]
+
+
+def _scroll_starts(panel):
+    return [
+        struct.unpack(">H", data)[0]
+        for (_, command), (_, data) in zip(panel.writes, panel.writes[1:])
+        if command == b"\x37"
+    ]
+
+
+def test_scrolls_when_full(make_display, console):
+    console, panel = console
+    height = console._line_height
+    rows = console.rows
+    assert panel.scroll_area == (16, rows * height, 320 - 16 - rows * height)
+    panel.writes.clear()
+    for index in range(rows):
+        console.append(f"line {index}")
+    assert not _scroll_starts(panel)
+    panel.writes.clear()
+    console.append("line %d" % rows)
+    assert _scroll_starts(panel) == [16 + height]
+    panel.writes.clear()
+    console.append("x" * (console.columns + 1))
+    assert _scroll_starts(panel) == [16 + 2 * height, 16 + 3 * height]
+    assert console.lines[-2:] == ["x" * console.columns, "x"]
+
+
+def test_shows_last_lines(make_display, console):
+    console, panel = console
+    height = console._line_height
+    rows = console.rows
+    lines = ["a long line of text that is cut", "short"] + [f"line {index}" for index in range(rows + 3)]
+    for line in lines:
+        console.append(line)
+    shown = panel.shown()
+    for row, line in enumerate(console.lines[-rows:]):
+        top = 16 + row * height
+        # The band exposed by scrolling holds only the new line, on the background
+        assert (shown[top : top + height, :240] == _line(make_display, console, line)).all()
+
+
+def test_fixed_areas_stay(console):
+    console, panel = console
+    for index in range(console.rows * 3):
+        console.append(f"line {index}")
+    shown = panel.shown()
+    bottom = 16 + console.rows * console._line_height
+    assert (shown[:16, :240] == 0x001F).all()
+    assert (shown[bottom:320, :240] == 0x001F).all()
+
+
+def test_clear(console):
+    console, panel = console
+    for index in range(console.rows + 2):
+        console.append(f"line {index}")
+    console.clear()
+    assert not console.lines
+    shown = panel.shown()
+    bottom = 16 + console.rows * console._line_height
+    assert panel.scroll_start == 16
+    assert (shown[16:bottom, :240] == 0).all()
+    assert (shown[:16, :240] == 0x001F).all()
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_rgb_display.hx8353 import HX8353
+from adafruit_rgb_display.ssd1331 import SSD1331
+from adafruit_rgb_display.st7789 import ST7789
+
+
+def test_bus_locked_and_configured_once(bus, make_display):
+    display, panel = make_display(ST7789, width=240, height=240, exclusive=True)
+    for x in range(10):
+        display.pixel(x, 0, 0xFFFF)
+    assert bus.locks == 1
+    assert bus.configures == 1
+    assert display._lock is None
+    assert (panel.memory[0, :10] == 0xFFFF).all()
+
+
+def test_deinit_releases_bus(bus, make_display):
+    display, _ = make_display(ST7789, width=240, height=240, exclusive=True)
+    with pytest.raises(ValueError):
+        display.share_bus()
+    display.deinit()
+    assert bus.selected is None
+    assert bus.try_lock()
+    bus.unlock()
+    with pytest.raises(RuntimeError):
+        display.pixel(0, 0, 0)
+
+
+def test_ssd1331_exclusive(make_display):
+    display, panel = make_display(SSD1331, exclusive=True)
+    display.write(0x15, b"\x00\x5f")
+    display.write(None, b"\x12\x34")
+    assert panel.writes == [(False, b"\x15"), (False, b"\x00\x5f"), (True, b"\x12\x34")]
+
+
+def test_hx8353_rotation(make_display):
+    display, _ = make_display(HX8353, rotation=90)
+    assert display.rotation == 90
+    assert display.spi_device.baudrate == 12000000
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import numpy
+import pytest
+
+from adafruit_rgb_display.fbmirror import Framebuffer, FramebufferMirror
+from adafruit_rgb_display.ssd1331 import SSD1331
+from adafruit_rgb_display.st7789 import ST7789
+
+
+def _pixels(pixel_format, channels):
+    """Pack RGB channels into framebuffer pixels."""
+    red, green, blue = (channels[:, :, index].astype("uint32") for index in range(3))
+    if pixel_format == "RGB565":
+        return ((red & 0xF8) << 8 | (green & 0xFC) << 3 | blue >> 3).astype("<u2")
+    if pixel_format == "BGRA":
+        return (0xFF000000 | red << 16 | green << 8 | blue).astype("<u4")
+    return (blue << 24 | green << 16 | red << 8).astype("<u4")
+
+
+def _565(channels):
+    red, green, blue = (channels[:, :, index].astype("uint16") for index in range(3))
+    return (red & 0xF8) << 8 | (green & 0xFC) << 3 | blue >> 3
+
+
+@pytest.fixture
+def channels():
+    y, x = numpy.mgrid[0:240, 0:240]
+    return numpy.stack([x, y, (x + y) // 2], axis=2).astype("uint8")
+
+
+@pytest.mark.parametrize("mode", ["nearest", "box"])
+@pytest.mark.parametrize("pixel_format", ["RGB565", "BGRA", "XRGB"])
+def test_mirror_sends_changed_tiles(make_display, tmp_path, channels, pixel_format, mode):
+    display, panel = make_display(ST7789, width=240, height=240)
+    path = tmp_path / "fb"
+    path.write_bytes(_pixels(pixel_format, channels).tobytes())
+    framebuffer = Framebuffer(str(path), width=240, height=240, pixel_format=pixel_format)
+    mirror = FramebufferMirror(display, framebuffer, mode=mode)
+    blocks = []
+    block = display._block
+
+    def record(x0, y0, x1, y1, data):
+        blocks.append((x0, y0, x1, y1))
+        block(x0, y0, x1, y1, data)
+
+    display._block = record
+    # The first update sends everything, a row of tiles at a time
+    assert mirror.update() == 15
+    assert blocks == [(0, row * 16, 239, row * 16 + 15) for row in range(15)]
+    assert (panel.memory[:240, :240] == _565(channels)).all()
+    blocks.clear()
+    assert mirror.update() == 0
+    assert not blocks
+    # Two neighbouring tiles and one further down change
+    channels[20, 40] = channels[30, 63] = channels[100, 5] = (255, 255, 255)
+    with open(path, "r+b") as file:
+        file.write(_pixels(pixel_format, channels).tobytes())
+    assert mirror.update() == 2
+    assert blocks == [(32, 16, 63, 31), (0, 96, 15, 111)]
+    assert (panel.memory[:240, :240] == _565(channels)).all()
+    framebuffer.close()
+
+
+def test_not_a_framebuffer(tmp_path):
+    path = tmp_path / "fb"
+    path.write_bytes(bytes(16))
+    with pytest.raises(ValueError, match="Not a framebuffer"):
+        Framebuffer(str(path))
+
+
+def test_requires_565(make_display, tmp_path):
+    display, _ = make_display(SSD1331, color_depth=8)
+    path = tmp_path / "fb"
+    path.write_bytes(bytes(96 * 64 * 2))
+    framebuffer = Framebuffer(str(path), width=96, height=64, pixel_format="RGB565")
+    with pytest.raises(ValueError, match="16-bit"):
+        FramebufferMirror(display, framebuffer)
+    framebuffer.close()
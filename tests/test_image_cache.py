@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+import time
+
+import pytest
+from PIL import Image
+
+from adafruit_rgb_display.ssd1331 import SSD1331
+from adafruit_rgb_display.st7789 import ST7789
+
+
+def _gradient(width, height, shift=0):
+    img = Image.new("RGB", (width, height))
+    img.putdata(
+        [((x * 7 + shift) % 256, (y * 5) % 256, (x + y) % 256) for y in range(height) for x in range(width)]
+    )
+    return img
+
+
+@pytest.fixture
+def counted(make_display):
+    """A display counting the lines it converts."""
+    display, panel = make_display(ST7789, width=240, height=240)
+    display.enable_image_cache(stripe_height=8)
+    converted = []
+    encode = display._encode_image
+
+    def counting(img):
+        converted.append(img.height)
+        return encode(img)
+
+    display._encode_image = counting
+    return display, panel, converted
+
+
+def test_unchanged_stripes_not_converted(counted):
+    display, panel, converted = counted
+    img = _gradient(240, 64)
+    display.image(img)
+    assert converted == [64]
+    img.paste((255, 0, 0), (0, 20, 10, 21))
+    display.image(img)
+    assert converted == [64, 8]
+    display.image(img)
+    assert converted == [64, 8]
+    assert panel.memory[20, 0] == 0xF800
+
+
+def test_failed_conversion_is_retried(counted):
+    display, _, converted = counted
+    img = _gradient(240, 32)
+    encode = display._encode_image
+    display._encode_image = lambda img: 1 / 0
+    with pytest.raises(ZeroDivisionError):
+        display.image(img)
+    display._encode_image = encode
+    display.image(img)
+    assert converted == [32]
+
+
+def test_stripe_height_rounded_for_dither(make_display):
+    display, panel = make_display(SSD1331, color_depth=8, dither=True)
+    img = _gradient(96, 64)
+    img.paste((0, 0, 255), (0, 60, 96, 61))
+    display.image(img)
+    expected = b"".join(data for dc, data in panel.writes if dc)
+    display.enable_image_cache(stripe_height=6)
+    assert display._stripe_height == 8
+    display.image(_gradient(96, 64))
+    panel.writes.clear()
+    display.image(img)
+    assert b"".join(data for dc, data in panel.writes if dc) == expected
+
+
+def test_threads_drawing_cached_images(make_display):
+    display, panel = make_display(ST7789, width=240, height=240)
+    display.enable_image_cache(stripe_height=4, resend=False)
+    red = Image.new("RGB", (240, 32), (255, 0, 0))
+    striped = red.copy()
+    for top in range(4, 32, 8):
+        striped.paste((0, 0, 255), (0, top, 240, top + 4))
+    expected = {bytes(display._encode_image(img)) for img in (red, striped)}
+    block = display._block
+    held = []
+
+    def slow(*args):
+        # Let the other thread run in the middle of drawing
+        held.append(display._held())
+        time.sleep(0.001)
+        block(*args)
+
+    def draw(img):
+        for _ in range(20):
+            display.image(img)
+
+    display._block = slow
+    threads = [threading.Thread(target=draw, args=(img,)) for img in (red, striped)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Every block was sent by the thread holding the display
+    assert all(held)
+    assert panel.memory[:32, :240].tobytes() in expected
+    # The cache still matches the display
+    display.image(red)
+    assert panel.memory[:32, :240].tobytes() == bytes(display._encode_image(red))
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from PIL import Image
+
+from adafruit_rgb_display import rgb
+from adafruit_rgb_display.st7789 import ST7789
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_scale_doubles_pixels(make_display, monkeypatch, with_numpy):
+    if not with_numpy:
+        monkeypatch.setattr(rgb, "numpy", None)
+    display, panel = make_display(ST7789, width=240, height=240)
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0), (0, 255, 255), (255, 255, 255)]
+    img = Image.new("RGB", (3, 2))
+    img.putdata(colors)
+    display.image(img, x=10, y=20, scale=2)
+    assert panel.columns == (10, 15)
+    assert panel.rows == (20, 23)
+    pixels = [rgb.color565(color) for color in colors]
+    for y in range(4):
+        for x in range(6):
+            assert panel.memory[20 + y, 10 + x] == pixels[(y // 2) * 3 + x // 2]
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_expand_memoryview(monkeypatch, with_numpy):
+    if not with_numpy:
+        monkeypatch.setattr(rgb, "numpy", None)
+    data = memoryview(bytes([1, 2, 3, 4]))
+    assert bytes(rgb._expand(data, 2, 1, 2)) == bytes([1, 2, 1, 2, 3, 4, 3, 4]) * 2
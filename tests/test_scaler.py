@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import numpy
+import pytest
+from PIL import Image
+
+from adafruit_rgb_display.scaler import Scaler
+
+
+def _565(img):
+    pixels = numpy.asarray(img).astype("uint16")
+    return (pixels[:, :, 0] & 0xF8) << 8 | (pixels[:, :, 1] & 0xFC) << 3 | pixels[:, :, 2] >> 3
+
+
+@pytest.fixture
+def source():
+    y, x = numpy.mgrid[0:45, 0:64]
+    return Image.fromarray(numpy.stack([x * 4, y * 5, (x * 7 + y * 3) % 256], axis=2).astype("uint8"))
+
+
+@pytest.mark.parametrize("size", [(64, 45), (160, 120), (200, 47), (32, 24), (17, 11), (50, 90)])
+def test_nearest_like_pillow(source, size):
+    expected = _565(source.resize(size, Image.Resampling.NEAREST))
+    scaler = Scaler(source.size, size)
+    assert (scaler.scale(source) == expected).all()
+    assert (scaler.scale(numpy.asarray(source)) == expected).all()
+
+
+@pytest.mark.parametrize("rotation", [90, 180, 270])
+def test_rotation_like_pillow(source, rotation):
+    expected = _565(source.resize((40, 30), Image.Resampling.NEAREST).rotate(rotation, expand=True))
+    assert (Scaler(source.size, (40, 30), rotation=rotation).scale(source) == expected).all()
+
+
+def test_box_averages():
+    img = Image.new("RGB", (4, 2))
+    img.putdata([(0, 0, 0), (255, 255, 255), (80, 40, 0), (0, 40, 80)] * 2)
+    expected = _565(Image.new("RGB", (2, 1), (127, 127, 127)))
+    expected[0, 1] = _565(Image.new("RGB", (1, 1), (40, 40, 40)))[0, 0]
+    assert (Scaler((4, 2), (2, 1), "box").scale(img) == expected).all()
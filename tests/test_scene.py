@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import time
+
+from adafruit_rgb_display.scene import Bitmap, Fill, Scene, coalesce
+from adafruit_rgb_display.st7789 import ST7789
+
+
+def _covers(merged, rect):
+    return any(m[0] <= rect[0] and m[1] <= rect[1] and rect[2] <= m[2] and rect[3] <= m[3] for m in merged)
+
+
+def test_coalesce_merges_close_rects():
+    assert coalesce([(0, 0, 9, 9), (10, 0, 19, 9)]) == [(0, 0, 19, 9)]
+    assert coalesce([(0, 0, 9, 9), (2, 2, 5, 5)]) == [(0, 0, 9, 9)]
+
+
+def test_coalesce_keeps_distant_rects():
+    rects = [(0, 0, 9, 9), (200, 0, 209, 9), (100, 200, 109, 209)]
+    assert sorted(coalesce(rects)) == sorted(rects)
+
+
+def test_coalesce_many_rects():
+    rects = [(x * 30, y * 30, x * 30 + 1, y * 30 + 1) for x in range(40) for y in range(40)]
+    start = time.monotonic()
+    merged = coalesce(rects)
+    assert time.monotonic() - start < 2
+    assert all(_covers(merged, rect) for rect in rects)
+    assert len(merged) <= len(rects)
+
+
+def test_coalesce_never_costs_more():
+    def cost(rects):
+        return sum(64 + (r[2] - r[0] + 1) * (r[3] - r[1] + 1) * 2 for r in rects)
+
+    rects = [((x * 7) % 230, (x * 13) % 230, (x * 7) % 230 + 3, (x * 13) % 230 + 2) for x in range(300)]
+    merged = coalesce(rects)
+    assert cost(merged) <= cost(rects)
+    assert cost(merged) <= cost([(0, 0, 232, 231)])
+    assert all(_covers(merged, rect) for rect in rects)
+
+
+def test_flush_sends_only_damage(make_display):
+    display, panel = make_display(ST7789, width=240, height=240)
+    scene = Scene(display, 0x0001)
+    button = scene.add(Fill(10, 10, 20, 20, 0x001F))
+    text = scene.add(Bitmap.from_pixels(100, 100, 2, 1, b"\xf8\x00\x07\xe0"))
+    assert scene.flush() == 1
+    assert panel.memory[10, 10] == 0x001F
+    assert panel.memory[100, 101] == 0x07E0
+    assert panel.memory[0, 0] == 0x0001
+    assert scene.flush() == 0
+    panel.writes.clear()
+    button.x = 12
+    assert scene.flush() == 1
+    assert panel.memory[10, 10] == 0x0001
+    assert panel.memory[10, 31] == 0x001F
+    # The window corners and the pixels
+    assert sum(len(data) for dc, data in panel.writes if dc) == 8 + 22 * 20 * 2
+    text.visible = False
+    scene.flush()
+    assert panel.memory[100, 101] == 0x0001
+
+
+def test_flush_holds_display(make_display):
+    display, _ = make_display(ST7789, width=240, height=240)
+    scene = Scene(display)
+    first = scene.add(Fill(0, 0, 10, 10, 0x001F))
+    second = scene.add(Fill(200, 200, 10, 10, 0x001F))
+    scene.flush()
+    held = []
+    block = display._block
+
+    def record(*args):
+        held.append(display._held())
+        block(*args)
+
+    display._block = record
+    first.color = second.color = 0xF800
+    assert scene.flush() == 2
+    assert held == [True, True]
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from adafruit_rgb_display import scheduler
+from adafruit_rgb_display.scene import Fill, Scene
+from adafruit_rgb_display.scheduler import FrameScheduler, RegionScheduler
+from adafruit_rgb_display.st7789 import ST7789
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.now += delay
+
+
+def test_frames_paced_and_dropped(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(scheduler, "time", clock)
+    frames = FrameScheduler()
+    assert frames.next(0.1)
+    clock.now += 0.05
+    frames.wait()
+    assert clock.now == 100.1
+    # Drawing the second frame took too long, the third one is dropped
+    assert frames.next(0.1)
+    clock.now += 0.25
+    assert not frames.next(0.1)
+    assert frames.dropped == 1
+    assert frames.next(0.1)
+    frames.reset()
+    assert frames.next(0.1)
+    assert frames.late == 0
+
+
+def test_regions_sent_within_budget_by_priority(make_display):
+    display, panel = make_display(ST7789, width=240, height=240)
+    scene = Scene(display)
+    scene.take_damage()
+    scene.add(Fill(0, 0, 240, 240, 0x07E0))
+    updates = RegionScheduler(display, scene.render, budget=64 + 240 * 10 * 2, overhead=64)
+    updates.damage(0, 0, 239, 99)
+    updates.damage(0, 200, 9, 209, priority=1)
+    assert updates.tick() <= updates.budget
+    # The small region with a priority went first
+    assert panel.memory[205, 5] == 0x07E0
+    ticks = 1
+    while updates.pending:
+        assert updates.tick() <= updates.budget
+        ticks += 1
+    assert ticks > 5
+    assert (panel.memory[:100, :240] == 0x07E0).all()
+    assert not panel.memory[100:200].any()
+
+
+def test_region_larger_than_budget_goes_through(make_display):
+    display, panel = make_display(ST7789, width=240, height=240)
+    updates = RegionScheduler(display, lambda rect: b"\xff\xff" * 240, budget=10)
+    updates.damage(0, 0, 239, 3)
+    for _ in range(4):
+        updates.tick()
+    assert not updates.pending
+    assert (panel.memory[:4, :240] == 0xFFFF).all()
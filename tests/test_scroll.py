@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import struct
+
+import pytest
+from conftest import FakePin
+
+from adafruit_rgb_display.hx8357 import HX8357
+from adafruit_rgb_display.ili9341 import ILI9341
+from adafruit_rgb_display.st7735 import ST7735R, ST7735S
+from adafruit_rgb_display.st7789 import ST7789
+
+
+def _commands(panel):
+    """Return the commands written to a panel with their data."""
+    return [
+        (command[0], data)
+        for (dc, command), (_, data) in zip(panel.writes, panel.writes[1:] + [(True, b"")])
+        if not dc
+    ]
+
+
+@pytest.mark.parametrize(
+    "cls, kwargs, area, start",
+    [
+        (ST7789, {}, (10, 290, 20), 10),
+        # Lines are counted from the first line of the controller memory
+        (ST7789, {"height": 240, "y_offset": 80}, (90, 210, 20), 90),
+        (ST7735R, {}, (10, 130, 22), 10),
+        # Scrolls along x, which starts 2 lines into the memory
+        (ST7735S, {"bl": FakePin()}, (12, 98, 52), 12),
+        (HX8357, {}, (10, 450, 20), 10),
+        (ILI9341, {}, (10, 290, 20), 10),
+    ],
+)
+def test_scroll_commands(make_display, cls, kwargs, area, start):
+    display, panel = make_display(cls, **kwargs)
+    display.scroll_area(10, 20)
+    assert _commands(panel) == [(0x33, struct.pack(">HHH", *area)), (0x37, struct.pack(">H", start))]
+    panel.writes.clear()
+    display.scroll(25)
+    display.scroll(-30)
+    assert display.scroll() == area[1] - 5
+    assert _commands(panel) == [
+        (0x37, struct.pack(">H", start + 25)),
+        (0x37, struct.pack(">H", start + area[1] - 5)),
+    ]
+
+
+def test_scroll_whole_display(make_display):
+    display, panel = make_display(ST7789)
+    display.scroll(5)
+    assert _commands(panel) == [
+        (0x33, struct.pack(">HHH", 0, 320, 0)),
+        (0x37, struct.pack(">H", 0)),
+        (0x37, struct.pack(">H", 5)),
+    ]
+
+
+def test_scrolled(make_display):
+    display, panel = make_display(ST7789)
+    assert display.scrolled(100) == 100
+    display.scroll_area(10, 20)
+    display.scroll(25)
+    assert display.scrolled(10) == 35
+    assert display.scrolled(274) == 299
+    assert display.scrolled(275) == 10
+    assert display.scrolled(299) == 34
+    # The fixed areas don't move
+    assert display.scrolled(9) == 9
+    assert display.scrolled(300) == 300
+    # What is drawn at the scrolled line shows up at the line
+    for y in (9, 10, 200, 275, 299, 300):
+        display.fill_rectangle(0, display.scrolled(y), 240, 1, 0xF800)
+        assert (panel.shown()[y, :240] == 0xF800).all()
+        display.fill_rectangle(0, display.scrolled(y), 240, 1, 0)
+    assert not panel.shown().any()
@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import numpy
+import pytest
+
+from adafruit_rgb_display.sprite import Sprite, SpriteLayer
+from adafruit_rgb_display.ssd1331 import SSD1331
+from adafruit_rgb_display.st7789 import ST7789
+
+
+def test_moving_sprite_sends_old_and_new_place(make_display):
+    display, panel = make_display(ST7789, width=240, height=240)
+    layer = SpriteLayer(display, 0x0010)
+    mask = numpy.ones((4, 4), dtype=bool)
+    mask[0, 0] = False
+    ball = layer.add(Sprite(numpy.full((4, 4), 0xF800), mask, x=10, y=10))
+    assert layer.update() == 1
+    assert panel.memory[10, 11] == 0xF800
+    assert panel.memory[10, 10] == 0x0010
+    assert layer.update() == 0
+    ball.x = 100
+    assert layer.update() == 2
+    assert panel.memory[11, 11] == 0x0010
+    assert panel.memory[11, 101] == 0xF800
+
+
+def test_8bit_refused(make_display):
+    display, _ = make_display(SSD1331, color_depth=8)
+    with pytest.raises(ValueError):
+        SpriteLayer(display)
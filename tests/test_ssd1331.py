@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import numpy
+import pytest
+
+from adafruit_rgb_display.ssd1331 import SSD1331
+
+
+@pytest.fixture
+def accelerated(make_display):
+    """An SSD1331 whose acceleration commands act on an array like the
+    controller does, copying line by line from the top left."""
+    display, _ = make_display(SSD1331)
+    memory = numpy.arange(96 * 64).reshape(64, 96)
+    display.enable_shadow()
+    display._shadow[:] = memory
+    commands = []
+
+    def accelerate(command, data, delay):
+        commands.append(command)
+        if command == 0x23:
+            x0, y0, x1, y1, dest_x, dest_y = data
+            for row in range(y1 - y0 + 1):
+                for column in range(x1 - x0 + 1):
+                    memory[dest_y + row, dest_x + column] = memory[y0 + row, x0 + column]
+        elif command == 0x25:
+            x0, y0, x1, y1 = data
+            memory[y0 : y1 + 1, x0 : x1 + 1] = 0
+
+    display._accelerate = accelerate
+    return display, memory, commands
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        (0, 0, 96, 60, 0, 4),
+        (0, 4, 96, 60, 0, 0),
+        (0, 0, 90, 64, 6, 0),
+        (6, 0, 90, 64, 0, 0),
+        (0, 0, 95, 63, 1, 1),
+        (1, 1, 95, 63, 0, 0),
+        (-10, -5, 50, 40, 20, 30),
+        (20, 30, 100, 100, -10, -5),
+    ],
+)
+def test_copy_rect(accelerated, args):
+    display, memory, _ = accelerated
+    expected = memory.copy()
+    x, y, width, height, dest_x, dest_y = args
+    # Copy pixel by pixel from a snapshot, skipping what falls outside
+    for row in range(height):
+        for column in range(width):
+            sx, sy, tx, ty = x + column, y + row, dest_x + column, dest_y + row
+            if 0 <= min(sx, tx) and max(sx, tx) < 96 and 0 <= min(sy, ty) and max(sy, ty) < 64:
+                expected[ty, tx] = memory[sy, sx]
+    display.copy_rect(*args)
+    assert (memory == expected).all()
+    assert (display.shadow == expected).all()
+
+
+def test_copy_rect_outside(accelerated):
+    display, _, commands = accelerated
+    display.copy_rect(0, 0, 10, 10, 96, 0)
+    assert not commands
+
+
+def test_black_fill_clears(accelerated):
+    display, memory, commands = accelerated
+    display.fill_rectangle(2, 3, 10, 10, 0)
+    display.fill_rectangle(2, 3, 10, 10, 0x1234)
+    assert commands == [0x25, 0x22]
+    assert not memory[3:13, 2:12].any()
+    assert (display.shadow[3:13, 2:12] == 0x1234).all()
+
+
+def test_8bit_refuses_565(make_display):
+    display, _ = make_display(SSD1331, color_depth=8)
+    with pytest.raises(ValueError):
+        display.enable_shadow()
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_rgb_display import stats
+from adafruit_rgb_display.st7789 import ST7789
+from adafruit_rgb_display.text import TextRenderer
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.now += delay
+
+
+def _sent(panel):
+    """Return the number of blocks and pixel bytes written to a panel, and
+    forget them."""
+    blocks = sum(1 for dc, data in panel.writes if not dc and data == b"\x2c")
+    pixels = 0
+    command = None
+    for dc, data in panel.writes:
+        if not dc:
+            command = data
+        elif command == b"\x2c":
+            pixels += len(data)
+    panel.writes.clear()
+    return blocks, pixels
+
+
+@pytest.fixture
+def dashboard(make_display, monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(stats, "time", clock)
+    display, panel = make_display(ST7789, width=240, height=240)
+    renderer = TextRenderer(display, cell_width=8)
+    dashboard = stats.Dashboard(renderer, x=4, y=10, spacing=2)
+    values = {"load": "CPU Load: 0.50", "temp": "CPU Temp: 45.0 C"}
+    dashboard.add(lambda: values["load"], 1)
+    dashboard.add(lambda: values["temp"], 4)
+    return dashboard, values, clock, panel
+
+
+def test_counters_match_bytes_sent(dashboard):
+    dashboard, values, clock, panel = dashboard
+    height = dashboard.renderer.line_height
+    assert dashboard.update() == 2
+    assert _sent(panel) == (2, (14 + 16) * 8 * height * 2)
+    # Nothing changed, nothing is sent
+    clock.now += 1
+    assert dashboard.update() == 0
+    assert _sent(panel) == (0, 0)
+    # One character of one line changed
+    values["load"] = "CPU Load: 0.52"
+    clock.now += 1
+    assert dashboard.update() == 1
+    assert _sent(panel) == (1, 8 * height * 2)
+    assert (panel.columns, panel.rows) == ((4 + 13 * 8, 4 + 14 * 8 - 1), (10, 10 + height - 1))
+    # Lines are read at their own intervals
+    values["temp"] = "CPU Temp: 47.5 C"
+    clock.now += 1
+    assert dashboard.update() == 0
+    assert _sent(panel) == (0, 0)
+    clock.now += 1
+    assert dashboard.update() == 1
+    assert _sent(panel) == (2, 2 * 8 * height * 2)
+    assert panel.rows == (12 + height, 11 + 2 * height)
+    assert dashboard._timeout() == 1
+
+
+def test_readings(monkeypatch):
+    files = {
+        "/proc/loadavg": "0.25 0.40 0.50 1/234 5678\n",
+        "/proc/meminfo": "MemTotal:  1024000 kB\nMemFree:  100000 kB\nMemAvailable:  512000 kB\n",
+        "/sys/class/thermal/thermal_zone0/temp": "48312\n",
+    }
+    monkeypatch.setattr(stats, "_read", files.__getitem__)
+    assert stats.cpu_load() == "CPU Load: 0.25"
+    assert stats.memory_usage() == "Mem: 500/1000 MB  50.00%"
+    assert stats.cpu_temperature() == "CPU Temp: 48.3 C"
+
+    def missing(path):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(stats, "_read", missing)
+    assert stats.cpu_temperature() == "CPU Temp: -"
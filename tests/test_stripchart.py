@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_rgb_display.st7789 import ST7789
+from adafruit_rgb_display.stripchart import StripChart
+
+
+def _memory_writes(panel):
+    return sum(1 for dc, data in panel.writes if not dc and data == b"\x2c")
+
+
+def test_sweep_sends_one_block(make_display):
+    display, panel = make_display(ST7789)
+    chart = StripChart(display, x=20, y=30, width=100, height=50, axis="x")
+    panel.writes.clear()
+    chart.add(0.5)
+    # The new sample and the cleared line ahead of it
+    assert _memory_writes(panel) == 1
+    assert (panel.columns, panel.rows) == ((20, 21), (30, 79))
+    for _ in range(98):
+        chart.add(0.5)
+    panel.writes.clear()
+    # The last line of the chart has nothing ahead of it
+    chart.add(0.5)
+    assert _memory_writes(panel) == 1
+    assert (panel.columns, panel.rows) == ((119, 119), (30, 79))
+
+
+def test_scroll_sends_one_line(make_display):
+    display, panel = make_display(ST7789)
+    chart = StripChart(display, y=40, height=200)
+    assert chart.axis == "y"
+    for _ in range(250):
+        panel.writes.clear()
+        chart.add(0.5)
+        assert _memory_writes(panel) == 1
+        assert panel.columns == (0, 239)
+        assert panel.rows[0] == panel.rows[1]
+    shown = panel.shown()
+    assert (shown[40:240, 120] == 0x07E0).all()
+
+
+@pytest.mark.parametrize("axis", ["x", "y"])
+def test_maximum_at_top_or_left(make_display, axis):
+    display, panel = make_display(ST7789)
+    chart = StripChart(display, x=10, y=20, width=101, height=51, axis=axis, minimum=-1, maximum=1)
+    size = 51 if axis == "x" else 101
+    for value, index in ((1, 0), (-1, size - 1), (0, size // 2)):
+        chart.clear()
+        chart.add(value)
+        if axis == "x":
+            # Time runs left to right, the maximum is at the top
+            line = panel.memory[20:71, 10]
+        else:
+            # Time runs top to bottom, the maximum is at the left
+            line = panel.memory[20, 10:111]
+        assert list(line.nonzero()[0]) == [index]
+        assert line[index] == 0x07E0
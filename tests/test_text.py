@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import numpy
+import pytest
+
+from adafruit_rgb_display import text
+from adafruit_rgb_display.st7789 import ST7789
+from adafruit_rgb_display.text import Label, TextRenderer
+
+
+@pytest.fixture
+def blocks(make_display):
+    """A display recording the rectangles of the blocks sent to it."""
+    display, panel = make_display(ST7789, width=240, height=320)
+    sent = []
+    block = display._block
+
+    def record(x0, y0, x1, y1, data=None):
+        sent.append((x0, y0, x1, y1))
+        return block(x0, y0, x1, y1, data)
+
+    display._block = record
+    return display, panel, sent
+
+
+def test_label_sends_changed_cells(blocks):
+    display, panel, sent = blocks
+    renderer = TextRenderer(display, cell_width=8)
+    height = renderer.line_height
+    label = Label(renderer, 10, 20, "12.5 C")
+    assert sent == [(10, 20, 10 + 6 * 8 - 1, 20 + height - 1)]
+    sent.clear()
+    label.text = "12.7 C"
+    assert sent == [(34, 20, 41, 20 + height - 1)]
+    sent.clear()
+    label.text = "13.0 C"
+    assert sent == [(18, 20, 25, 20 + height - 1), (34, 20, 41, 20 + height - 1)]
+    sent.clear()
+    label.text = "13.0 C"
+    assert not sent
+    # Shorter text clears what is left of the old one
+    label.text = "13.0"
+    assert sent == [(42, 20, 57, 20 + height - 1)]
+    assert (panel.memory[20 : 20 + height, 42:58] == 0).all()
+    # The result is the same as drawing the text at once
+    renderer.draw("13.0", 10, 100)
+    assert (panel.memory[20 : 20 + height, 10:58] == panel.memory[100 : 100 + height, 10:58]).all()
+
+
+def test_label_redraws_in_new_colors(blocks):
+    display, _, sent = blocks
+    renderer = TextRenderer(display, cell_width=8)
+    label = Label(renderer, 0, 0, "abc")
+    sent.clear()
+    label.color = 0xF800
+    label.text = "abd"
+    assert sent == [(0, 0, 23, renderer.line_height - 1)]
+
+
+def test_glyph_cache(blocks, monkeypatch):
+    display, _, _ = blocks
+    drawn = []
+    draw = text.ImageDraw.Draw
+    monkeypatch.setattr(text.ImageDraw, "Draw", lambda image: drawn.append(image) or draw(image))
+    renderer = TextRenderer(display, cache_size=3)
+    renderer.draw("aaab", 0, 0)
+    assert len(drawn) == 2
+    assert renderer.glyph("a") is renderer.glyph("a")
+    renderer.draw("ab", 0, 0)
+    assert len(drawn) == 2
+    # Another color is another glyph
+    renderer.draw("a", 0, 0, color=0xF800)
+    assert len(drawn) == 3
+    # The least recently used glyph, a in white, is dropped
+    renderer.draw("c", 0, 0)
+    renderer.draw("b", 0, 0)
+    assert len(drawn) == 4
+    renderer.draw("a", 0, 0)
+    assert len(drawn) == 5
+
+
+@pytest.mark.parametrize("rotation", [90, 180, 270])
+def test_rotated_text(make_display, rotation):
+    display, panel = make_display(ST7789, width=240, height=320)
+    renderer = TextRenderer(display)
+    height = renderer.line_height
+    width = renderer.draw("Hi 42", 0, 0)
+    expected = panel.memory[:height, :width].copy()
+    panel.memory[:] = 0
+    renderer = TextRenderer(display, rotation=rotation)
+    renderer.draw("Hi 42", 30, 50)
+    # What the display shows, turned back the way the text is read
+    turned = numpy.rot90(panel.memory[:320, :240], -rotation // 90)
+    assert (turned[50 : 50 + height, 30 : 30 + width] == expected).all()
+    turned[50 : 50 + height, 30 : 30 + width] = 0
+    assert not turned.any()
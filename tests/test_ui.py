@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+from conftest import FakePin
+
+from adafruit_rgb_display import ui
+from adafruit_rgb_display.scene import Fill
+from adafruit_rgb_display.st7789 import ST7789
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(ui, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def buttons(make_display, clock):
+    """A UI with a button on a pin, pulled up and pressed when low, and the
+    events it sent. Times are multiples of an eighth of a second, so that
+    they add up exactly."""
+    display, panel = make_display(ST7789, width=240, height=240)
+    interface = ui.UI(display, debounce=0.25, poll_interval=0.125)
+    pin = FakePin()
+    pin.value = True
+    interface.add_button("A", pin)
+    events = []
+    interface.on("A", lambda event: events.append((event.pressed, event.time)))
+    interface.step()
+    panel.writes.clear()
+    return interface, pin, events, panel
+
+
+def test_debounce(clock, buttons):
+    interface, pin, events, _ = buttons
+    pin.value = False
+    assert not interface.step()
+    assert interface._timeout() == 0.125
+    clock.now += 0.125
+    assert not interface.step()
+    clock.now += 0.0625
+    assert interface._timeout() == 0.0625
+    assert not interface.step()
+    clock.now += 0.0625
+    assert interface.step()
+    assert events == [(True, 100.25)]
+    assert interface.pressed("A")
+
+
+def test_bounces_restart_debounce(clock, buttons):
+    interface, pin, events, _ = buttons
+    # The contact bounces for a while before settling
+    for value in (False, True, False, True, False):
+        pin.value = value
+        interface.step()
+        clock.now += 0.125
+    assert not events
+    clock.now += 0.125
+    interface.step()
+    assert events == [(True, 100.75)]
+    # A short glitch while held is ignored
+    pin.value = True
+    interface.step()
+    clock.now += 0.125
+    pin.value = False
+    interface.step()
+    clock.now += 0.5
+    interface.step()
+    assert events == [(True, 100.75)]
+
+
+def test_held_button_fires_once(clock, buttons):
+    interface, pin, events, _ = buttons
+    pin.value = False
+    for _ in range(20):
+        interface.step()
+        clock.now += 0.125
+    assert events == [(True, 100.25)]
+    pin.value = True
+    for _ in range(20):
+        interface.step()
+        clock.now += 0.125
+    assert events == [(True, 100.25), (False, 102.75)]
+    # Pressing again sends another press
+    pin.value = False
+    for _ in range(3):
+        interface.step()
+        clock.now += 0.125
+    assert events == [(True, 100.25), (False, 102.75), (True, 105.25)]
+
+
+def test_posted_changes(clock, buttons):
+    interface, _, _, _ = buttons
+    interface.add_button("B")
+    posted = []
+    interface.on("B", lambda event: posted.append(event.pressed))
+    interface.post("B", True)
+    assert interface._timeout() == 0.125
+    clock.now += 0.25
+    interface.step()
+    interface.post("B", False)
+    clock.now += 0.25
+    interface.step()
+    assert posted == [True, False]
+
+
+def test_redraws_only_changes(clock, buttons):
+    interface, pin, _, panel = buttons
+    light = interface.add(Fill(10, 20, 30, 40, 0x001F))
+    interface.add(Fill(100, 100, 50, 50, 0xF800))
+    interface.on("A", lambda event: setattr(light, "color", 0x07E0 if event.pressed else 0x001F))
+    interface.step()
+    panel.writes.clear()
+    # Nothing changes, nothing is sent
+    for _ in range(5):
+        assert not interface.step()
+        clock.now += 0.125
+    assert not panel.writes
+    pin.value = False
+    interface.step()
+    assert not panel.writes
+    clock.now += 0.25
+    assert interface.step()
+    # Only the light is sent
+    assert [data for dc, data in panel.writes if not dc] == [b"\x2a", b"\x2b", b"\x2c"]
+    assert (panel.columns, panel.rows) == ((10, 39), (20, 59))
+    assert (panel.memory[20:60, 10:40] == 0x07E0).all()
+    panel.writes.clear()
+    # Setting what a node already shows doesn't redraw it
+    light.color = 0x07E0
+    clock.now += 0.25
+    assert not interface.step()
+    assert not panel.writes
@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import struct
+
+import pytest
+from PIL import Image
+
+from adafruit_rgb_display import scheduler, video
+from adafruit_rgb_display.rgb import color565
+from adafruit_rgb_display.ssd1331 import SSD1331
+from adafruit_rgb_display.st7789 import ST7789
+
+_COLORS = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.now += delay
+
+
+def _gradient(width, height):
+    img = Image.new("RGB", (width, height))
+    img.putdata(
+        [(x * 40 % 256, y * 30 % 256, (x + y) * 20 % 256) for y in range(height) for x in range(width)]
+    )
+    return img
+
+
+@pytest.fixture
+def clip(tmp_path):
+    """A clip of three frames of one color each, a tenth of a second long."""
+    path = str(tmp_path / "clip.r565")
+    sources = []
+    for index, color in enumerate(_COLORS):
+        sources.append(str(tmp_path / f"{index}.png"))
+        Image.new("RGB", (8, 6), color).save(sources[-1])
+    assert video.encode(path, sources, (8, 6), fps=10) == 3
+    return path
+
+
+def test_header_and_frames(clip):
+    with open(clip, "rb") as file:
+        data = file.read()
+    assert struct.unpack_from("<4sHHII", data) == (b"R565", 8, 6, 100000, 3)
+    assert len(data) == 16 + 3 * 8 * 6 * 2
+    clip = video.Video(clip)
+    assert (clip.width, clip.height, clip.count) == (8, 6, 3)
+    assert clip.duration == 0.1
+    assert clip.fps == 10
+    for index, color in enumerate(_COLORS):
+        assert bytes(clip.frame(index)) == struct.pack(">H", color565(color)) * 48
+    clip.close()
+
+
+def test_bad_files(clip, tmp_path):
+    with open(clip, "rb") as file:
+        data = file.read()
+    path = tmp_path / "bad.r565"
+    path.write_bytes(b"GIF8" + data[4:])
+    with pytest.raises(ValueError, match="Not a 565"):
+        video.Video(str(path))
+    path.write_bytes(data[:-1])
+    with pytest.raises(ValueError, match="truncated"):
+        video.Video(str(path))
+
+
+def test_animation_timing(tmp_path):
+    # Frames of 100 and 200 ms at 10 frames per second, the second repeated
+    path = str(tmp_path / "clip.r565")
+    source = str(tmp_path / "clip.gif")
+    frames = [Image.new("RGB", (8, 6), color) for color in _COLORS[:2]]
+    frames[0].save(source, save_all=True, append_images=frames[1:], duration=[100, 200], loop=0)
+    assert video.encode(path, [source], (8, 6)) == 3
+    clip = video.Video(path)
+    assert clip.fps == 10
+    assert bytes(clip.frame(1)) == bytes(clip.frame(2)) == struct.pack(">H", color565(_COLORS[1])) * 48
+    clip.close()
+
+
+@pytest.mark.parametrize("rotation", [0, 90])
+def test_plays_like_image(make_display, tmp_path, rotation):
+    display, panel = make_display(ST7789, width=240, height=240)
+    source = _gradient(6, 8) if rotation else _gradient(8, 6)
+    source.save(tmp_path / "source.png")
+    path = str(tmp_path / "clip.r565")
+    video.encode(path, [str(tmp_path / "source.png")], (8, 6), rotation=rotation)
+    clip = video.Video(path)
+    assert video.play(display, clip, x=10, y=20)
+    clip.close()
+    played = panel.memory[20:26, 10:18].copy()
+    display.image(source, rotation=rotation, x=10, y=20)
+    assert (panel.memory[20:26, 10:18] == played).all()
+
+
+def test_frames_paced_and_skipped(make_display, monkeypatch, clip):
+    clock = _Clock()
+    monkeypatch.setattr(scheduler, "time", clock)
+    display, _ = make_display(ST7789, width=240, height=240)
+    clip = video.Video(clip)
+    frames = [bytes(clip.frame(index)) for index in range(clip.count)]
+    shown = []
+    cost = 0.0
+
+    def block(x0, y0, x1, y1, data):
+        nonlocal cost
+        shown.append((frames.index(bytes(data)), round(clock.now, 3)))
+        clock.now += cost
+
+    display._block = block
+    assert video.play(display, clip, loops=2)
+    assert shown == [(index % 3, 100 + index / 10) for index in range(6)]
+    # Sending a frame takes longer than showing it, the frames whose time
+    # is over are skipped
+    shown.clear()
+    cost = 0.25
+    assert video.play(display, clip)
+    assert shown == [(0, 100.6), (2, 100.85)]
+    # Unless asked not to
+    shown.clear()
+    assert video.play(display, clip, drop=False)
+    assert [index for index, _ in shown] == [0, 1, 2]
+    assert not video.play(display, clip, stop=lambda: True)
+    clip.close()
+
+
+def test_requires_565(make_display, clip):
+    display, _ = make_display(SSD1331, color_depth=8)
+    clip = video.Video(clip)
+    with pytest.raises(ValueError, match="16-bit"):
+        video.play(display, clip)
+    clip.close()
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import numpy
+import pytest
+
+from adafruit_rgb_display.ssd1331 import SSD1331
+from adafruit_rgb_display.st7789 import ST7789
+from adafruit_rgb_display.viewport import Viewport
+
+
+@pytest.fixture
+def source():
+    return numpy.arange(300 * 400, dtype=">u2").reshape(300, 400)
+
+
+def test_pan_stops_at_edges(make_display, source):
+    display, _ = make_display(ST7789, width=240, height=240)
+    viewport = Viewport(display, source, left=10, top=20)
+    viewport.move_to(1000, -5)
+    assert (viewport.left, viewport.top) == (160, 0)
+    viewport.pan(-30, 0)
+    assert (viewport.left, viewport.top) == (130, 0)
+
+
+def test_ssd1331_copies_content(make_display, source):
+    display, _ = make_display(SSD1331)
+    viewport = Viewport(display, source)
+    copies = []
+    display.copy_rect = lambda *args: copies.append(args)
+    viewport.pan(3, 2)
+    assert copies == [(3, 2, 93, 62, 0, 0)]
+
+
+def test_8bit_refused(make_display, source):
+    display, _ = make_display(SSD1331, color_depth=8)
+    with pytest.raises(ValueError):
+        Viewport(display, source)